@@ -1,11 +1,33 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session, send_from_directory
+from flask import Flask, Request, render_template, request, jsonify, redirect, url_for, session, send_from_directory
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from functools import wraps
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.security import generate_password_hash, check_password_hash
-from werkzeug.utils import secure_filename
+from werkzeug.utils import safe_join, secure_filename
+from sqlalchemy import and_, bindparam, case, func, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload
+import base64
+import gzip
+import hashlib
+import json
+import mimetypes
 import random
 import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+
+try:
+    import brotli  # optional: ถ้าไม่ได้ติดตั้งจะใช้ gzip อย่างเดียว
+except ImportError:
+    brotli = None
 
 app = Flask(__name__)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///lucky_draw.db'
@@ -15,13 +37,174 @@ app.config['UPLOAD_FOLDER_PRIZES'] = 'static/uploads/prizes'
 app.config['UPLOAD_FOLDER_PARTICIPANTS'] = 'static/uploads/participants'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['ALLOWED_EXTENSIONS'] = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+app.config['MAX_PHOTO_ZIP_LENGTH'] = 1024 * 1024 * 1024  # 1GB max สำหรับ ZIP รูปผู้เข้าร่วม
+app.config['PHOTO_IMPORT_WORKERS'] = 4  # จำนวน thread ที่แตกไฟล์รูปจาก ZIP พร้อมกัน
+app.config['COMPRESS_MIN_SIZE'] = 1024  # บีบอัดเฉพาะ response ที่ใหญ่กว่านี้ (bytes)
+app.config['COMPRESS_GZIP_LEVEL'] = 6
+app.config['COMPRESS_BROTLI_QUALITY'] = 5
+app.config['COMPRESS_MIMETYPES'] = {
+    'text/html', 'text/css', 'text/plain', 'text/javascript', 'application/javascript',
+    'application/json', 'image/svg+xml'
+}
+
+app.config['TEMPLATE_CACHE_DIR'] = os.path.join(app.instance_path, 'jinja_cache')  # bytecode ของ template ที่ compile แล้ว
+app.config['ARCHIVE_FOLDER'] = os.path.join(app.instance_path, 'archives')  # ไฟล์ snapshot ของงานที่จบแล้ว
+app.config['CHECK_IN_FLUSH_INTERVAL'] = 1.0  # วินาที - เขียนการเช็คอินที่รอไว้ลงฐานข้อมูลทุกๆ เท่านี้
+app.config['CHECK_IN_BATCH_SIZE'] = 200  # หรือเมื่อรอครบจำนวนนี้
 
 # สร้าง folder สำหรับเก็บรูปภาพ
 os.makedirs(app.config['UPLOAD_FOLDER_PRIZES'], exist_ok=True)
 os.makedirs(app.config['UPLOAD_FOLDER_PARTICIPANTS'], exist_ok=True)
+os.makedirs(app.config['TEMPLATE_CACHE_DIR'], exist_ok=True)
+os.makedirs(app.config['ARCHIVE_FOLDER'], exist_ok=True)
+
+# เก็บ bytecode ของ template ลงดิสก์ - worker ใหม่/หลัง restart โหลดได้เลยไม่ต้อง compile ใหม่
+# (Jinja ตรวจ checksum ของไฟล์ template เอง ถ้าแก้ template จะ compile ใหม่อัตโนมัติ)
+app.jinja_options = {
+    **app.jinja_options,
+    'bytecode_cache': FileSystemBytecodeCache(app.config['TEMPLATE_CACHE_DIR'])
+}
+
+class LuckyDrawRequest(Request):
+    """ให้ endpoint อัปโหลด ZIP รูปผู้เข้าร่วมรับไฟล์ใหญ่กว่า MAX_CONTENT_LENGTH ได้"""
+    @property
+    def max_content_length(self):
+        if self.path == '/api/participants/photos/bulk' and self.method == 'POST':
+            return app.config['MAX_PHOTO_ZIP_LENGTH']
+        return super().max_content_length
+
+app.request_class = LuckyDrawRequest
+
+@app.errorhandler(413)
+def request_too_large(e):
+    """ไฟล์ใหญ่เกินกำหนด - API ตอบเป็น JSON ให้หน้าเว็บแสดงข้อความได้"""
+    if not request.path.startswith('/api/'):
+        return e
+    limit = request.max_content_length or app.config['MAX_CONTENT_LENGTH']
+    return jsonify({'error': f'ไฟล์ใหญ่เกินไป (สูงสุด {limit // (1024 * 1024)} MB)'}), 413
 
 db = SQLAlchemy(app)
 
+# ==================== Response Compression ====================
+def preferred_encoding():
+    """เลือก encoding ที่ client รองรับ: br (ถ้ามี brotli) > gzip > ไม่บีบอัด"""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+@app.after_request
+def compress_response(response):
+    """บีบอัด response แบบ dynamic (HTML/JSON) ตาม Accept-Encoding เมื่อขนาดเกิน COMPRESS_MIN_SIZE"""
+    if response.mimetype not in app.config['COMPRESS_MIMETYPES']:
+        return response
+    response.vary.add('Accept-Encoding')
+    
+    # ไฟล์ (send_file), stream, ช่วงไฟล์ และ response ที่บีบอัดแล้วไม่ต้องทำซ้ำ
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    encoding = preferred_encoding()
+    if encoding is None:
+        return response
+    data = response.get_data()
+    if len(data) < app.config['COMPRESS_MIN_SIZE']:
+        return response
+    
+    if encoding == 'br':
+        data = brotli.compress(data, quality=app.config['COMPRESS_BROTLI_QUALITY'])
+    else:
+        data = gzip.compress(data, compresslevel=app.config['COMPRESS_GZIP_LEVEL'])
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+def send_precompressed(directory, filename):
+    """
+    ส่งไฟล์ static โดยใช้ไฟล์ .br / .gz ที่บีบอัดไว้ล่วงหน้า (สร้างด้วย compress_static.py)
+    ถ้า client รองรับและไฟล์บีบอัดใหม่กว่าไฟล์ต้นฉบับ
+    """
+    path = safe_join(directory, filename)
+    if path and os.path.isfile(path):
+        accepted = request.accept_encodings
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            compressed = path + suffix
+            if (accepted[encoding] and os.path.isfile(compressed)
+                    and os.path.getmtime(compressed) >= os.path.getmtime(path)):
+                mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                response = send_from_directory(directory, filename + suffix, mimetype=mimetype)
+                response.headers['Content-Encoding'] = encoding
+                response.vary.add('Accept-Encoding')
+                return response
+    return send_from_directory(directory, filename)
+
+# ==================== Static Bundles ====================
+# CSS/JS ของแต่ละหน้าอยู่ใน static/css และ static/js - template อ้างถึงผ่าน asset_url()
+# ซึ่งใส่ hash ของเนื้อไฟล์ไว้ในชื่อ ทำให้ browser cache ได้ยาว และได้ไฟล์ใหม่ทันทีเมื่อไฟล์เปลี่ยน
+ASSET_HASH_LENGTH = 10
+ASSET_MAX_AGE = 365 * 24 * 60 * 60  # 1 ปี
+FINGERPRINT_RE = re.compile(r'^(?P<stem>.+)\.(?P<hash>[0-9a-f]{%d})(?P<ext>\.(?:css|js))$' % ASSET_HASH_LENGTH)
+BUNDLE_DIRS = ('css', 'js')
+
+asset_hashes = {}  # filename -> (mtime, hash) คำนวณใหม่เมื่อไฟล์ถูกแก้
+
+def asset_hash(filename):
+    """hash ของเนื้อไฟล์ใน static/"""
+    path = safe_join(app.static_folder, filename)
+    mtime = os.path.getmtime(path)
+    cached = asset_hashes.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:ASSET_HASH_LENGTH]
+    asset_hashes[filename] = (mtime, digest)
+    return digest
+
+@app.template_global()
+def asset_url(filename):
+    """URL ของไฟล์ static ที่มี hash ในชื่อ เช่น css/spin.css -> /static/css/spin.1a2b3c4d5e.css"""
+    stem, ext = os.path.splitext(filename)
+    return url_for('static', filename=f'{stem}.{asset_hash(filename)}{ext}')
+
+def bundle_urls():
+    """URL (มี hash) ของ CSS/JS ทุกไฟล์ - ใช้ให้ service worker precache"""
+    urls = []
+    for bundle_dir in BUNDLE_DIRS:
+        directory = os.path.join(app.static_folder, bundle_dir)
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            if os.path.splitext(filename)[1] in ('.css', '.js'):
+                urls.append(asset_url(f'{bundle_dir}/{filename}'))
+    return urls
+
+def serve_static(filename):
+    """
+    ส่งไฟล์ใน /static/ (ใช้ไฟล์ .br/.gz ที่บีบอัดไว้ล่วงหน้าถ้ามี)
+    ชื่อที่มี hash ตรงกับเนื้อไฟล์ปัจจุบันจะตั้ง cache 1 ปีแบบ immutable
+    """
+    match = FINGERPRINT_RE.match(filename)
+    if match:
+        original = match.group('stem') + match.group('ext')
+        path = safe_join(app.static_folder, original)
+        if path and os.path.isfile(path):
+            response = send_precompressed(app.static_folder, original)
+            if asset_hash(original) == match.group('hash'):
+                response.cache_control.no_cache = None
+                response.cache_control.public = True
+                response.cache_control.max_age = ASSET_MAX_AGE
+                response.cache_control.immutable = True
+            else:
+                # hash เก่า (เช่นหน้า HTML ที่ค้างใน cache) - ส่งไฟล์ปัจจุบันแต่ห้าม cache
+                response.cache_control.no_cache = True
+            return response
+    return send_precompressed(app.static_folder, filename)
+
+app.view_functions['static'] = serve_static
+
 # ==================== Authentication ====================
 
 def login_required(f):
@@ -72,9 +255,17 @@ class Participant(db.Model):
     prize_id = db.Column(db.Integer, db.ForeignKey('prize.id'), nullable=True)
     won_at = db.Column(db.DateTime, nullable=True)
     attendance_status = db.Column(db.String(50), default='เข้าร่วมงาน')  # สถานะการเข้าร่วม: 'เข้าร่วมงาน', 'ไม่เข้าร่วมงาน'
+    checked_in_at = db.Column(db.DateTime, nullable=True)  # เวลาเช็คอินหน้างาน (None = ยังไม่เช็คอิน)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     prize = db.relationship('Prize', backref='winner', foreign_keys=[prize_id])
+    
+    # index สำหรับ keyset pagination (เรียงตามชื่อ), กรองสถานะผู้ชนะ และสุ่มเฉพาะคนที่เช็คอินแล้ว
+    __table_args__ = (
+        db.Index('ix_participant_name_id', 'name', 'id'),
+        db.Index('ix_participant_is_winner', 'is_winner'),
+        db.Index('ix_participant_draw_pool', 'is_winner', 'checked_in_at'),
+    )
 
 class Prize(db.Model):
     """รายชื่อรางวัล (จัดเป็นหมวดหมู่)"""
@@ -107,12 +298,143 @@ class DrawHistory(db.Model):
     status = db.Column(db.String(50), default='ได้รับรางวัล')  # สถานะ: 'ได้รับรางวัล', 'ไม่เข้าร่วมงาน'
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+class DrawStat(db.Model):
+    """
+    ตัวนับสรุปการสุ่ม (อัปเดตทีละรายการตอน spin / ไม่เข้าร่วมงาน ไม่ต้อง scan DrawHistory)
+    key: 'all', 'grand', 'normal' หรือ 'prize:<id>'
+    """
+    key = db.Column(db.String(50), primary_key=True)
+    prize_id = db.Column(db.Integer, nullable=True)  # เฉพาะแถวของรางวัล
+    name = db.Column(db.String(200), nullable=True)
+    is_grand = db.Column(db.Boolean, nullable=True)
+    quantity = db.Column(db.Integer, default=0)  # จำนวนรางวัลทั้งหมด
+    claimed = db.Column(db.Integer, default=0)  # จำนวนที่ถูกสุ่มไปแล้ว (หักคนที่ไม่เข้าร่วมงาน)
+    available = db.Column(db.Integer, default=0)  # จำนวนรายการรางวัลที่ยังเหลือ (remaining > 0)
+    draws = db.Column(db.Integer, default=0)  # จำนวนครั้งที่สุ่มได้ผู้โชคดี
+    no_shows = db.Column(db.Integer, default=0)  # จำนวนผู้โชคดีที่ไม่เข้าร่วมงาน
+    last_draw_at = db.Column(db.DateTime, nullable=True)
+
+class DrawTimeline(db.Model):
+    """จำนวนผู้โชคดีต่อนาที (UTC) สำหรับกราฟ draws per minute"""
+    bucket = db.Column(db.DateTime, primary_key=True)  # ต้นนาที
+    draws = db.Column(db.Integer, default=0)
+    grand_draws = db.Column(db.Integer, default=0)
+
 # Helper functions
 def allowed_file(filename):
     """ตรวจสอบว่าไฟล์ที่อัปโหลดเป็นประเภทที่อนุญาตหรือไม่"""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
 
+def participant_to_dict(p):
+    """แปลง Participant เป็น dict สำหรับ JSON"""
+    return {
+        'id': p.id,
+        'name': p.name,
+        'phone': p.phone,
+        'image_path': p.image_path,
+        'is_winner': p.is_winner,
+        'prize_name': p.prize.name if p.prize else None,
+        'attendance_status': p.attendance_status,
+        'checked_in_at': p.checked_in_at.isoformat() if p.checked_in_at else None
+    }
+
+def prize_to_dict(p):
+    """แปลง Prize เป็น dict สำหรับ JSON"""
+    return {
+        'id': p.id,
+        'name': p.name,
+        'description': p.description,
+        'color': p.color,
+        'qr_code': p.qr_code,
+        'image_path': p.image_path,
+        'is_grand': p.is_grand,
+        'quantity': p.quantity,
+        'claimed_count': p.claimed_count,
+        'remaining': p.remaining
+    }
+
+# ==================== Pagination Helpers ====================
+PAGE_SIZE_DEFAULT = 50
+PAGE_SIZE_MAX = 500
+
+def encode_cursor(sort_value, row_id):
+    """สร้าง cursor จากค่า key ของแถวสุดท้ายในหน้า (base64 ของ JSON)"""
+    raw = json.dumps([sort_value, row_id], separators=(',', ':'), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """แปลง cursor กลับเป็น (sort_value, row_id) - ValueError ถ้า cursor ไม่ถูกต้อง"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except Exception:
+        raise ValueError('invalid cursor')
+    # ค่าใน cursor ถูกส่งเป็น bind parameter ตรงๆ - รับเฉพาะชนิดที่ SQLite รองรับ
+    if not isinstance(row_id, int) or not isinstance(sort_value, (str, int, float, type(None))):
+        raise ValueError('invalid cursor')
+    return sort_value, row_id
+
+def parse_page_size():
+    """อ่าน limit จาก query string (จำกัดไม่เกิน PAGE_SIZE_MAX)"""
+    limit = int(request.args.get('limit', PAGE_SIZE_DEFAULT))
+    return max(1, min(limit, PAGE_SIZE_MAX))
+
+def keyset_paginate(query, sort_column, id_column, descending, cursor, limit):
+    """
+    Keyset pagination: เรียงตาม (sort_column, id) แล้วดึงแถวถัดจาก cursor
+    ไม่ใช้ OFFSET จึงเร็วเท่ากันทุกหน้าแม้ตารางจะใหญ่
+    คืนค่า (รายการ, next_cursor หรือ None ถ้าเป็นหน้าสุดท้าย)
+    """
+    if cursor:
+        last_value, last_id = decode_cursor(cursor)
+        if descending:
+            query = query.filter(or_(sort_column < last_value,
+                                     and_(sort_column == last_value, id_column < last_id)))
+        else:
+            query = query.filter(or_(sort_column > last_value,
+                                     and_(sort_column == last_value, id_column > last_id)))
+    
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    
+    rows = query.add_columns(sort_column).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_item, last_value = rows[-1]
+        next_cursor = encode_cursor(last_value, last_item.id)
+    return [item for item, _ in rows], next_cursor
+
+def paged_response(query, sort_columns, id_column, to_dict):
+    """
+    ตอบกลับรายการแบบแบ่งหน้า: {'items', 'next_cursor', 'total'}
+    total จะส่งเฉพาะหน้าแรก (ไม่มี cursor) เพื่อไม่ต้อง count ทุกหน้า
+    """
+    sort = request.args.get('sort', 'id')
+    if sort not in sort_columns:
+        return jsonify({'error': f'ไม่รองรับการเรียงตาม "{sort}"'}), 400
+    descending = request.args.get('order', 'asc') == 'desc'
+    cursor = request.args.get('cursor')
+    
+    try:
+        limit = parse_page_size()
+        total = None if cursor else query.order_by(None).count()
+        items, next_cursor = keyset_paginate(query, sort_columns[sort], id_column,
+                                             descending, cursor, limit)
+    except ValueError:
+        return jsonify({'error': 'พารามิเตอร์ limit หรือ cursor ไม่ถูกต้อง'}), 400
+    
+    response = {
+        'items': [to_dict(item) for item in items],
+        'next_cursor': next_cursor
+    }
+    if total is not None:
+        response['total'] = total
+    return jsonify(response)
+
 # Create tables and default admin user
 with app.app_context():
     db.create_all()
@@ -145,6 +467,30 @@ with app.app_context():
         print(f"Note: Could not add status column (may already exist or database issue): {e}")
         db.session.rollback()
     
+    # เพิ่มคอลัมน์ checked_in_at ถ้ายังไม่มี (สำหรับฐานข้อมูลที่มีอยู่แล้ว)
+    try:
+        from sqlalchemy import inspect, text
+        inspector = inspect(db.engine)
+        columns = [col['name'] for col in inspector.get_columns('participant')]
+        if 'checked_in_at' not in columns:
+            db.session.execute(text('ALTER TABLE participant ADD COLUMN checked_in_at DATETIME'))
+            db.session.commit()
+            print("Added checked_in_at column to participant table")
+    except Exception as e:
+        print(f"Note: Could not add checked_in_at column (may already exist or database issue): {e}")
+        db.session.rollback()
+    
+    # เพิ่ม index สำหรับ pagination และการสุ่มถ้ายังไม่มี (create_all ไม่เพิ่ม index ให้ตารางที่มีอยู่แล้ว)
+    try:
+        from sqlalchemy import text
+        db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_participant_name_id ON participant (name, id)'))
+        db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_participant_is_winner ON participant (is_winner)'))
+        db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_participant_draw_pool ON participant (is_winner, checked_in_at)'))
+        db.session.commit()
+    except Exception as e:
+        print(f"Note: Could not create participant indexes: {e}")
+        db.session.rollback()
+    
     # สร้าง default admin ถ้ายังไม่มี
     if not User.query.filter_by(username='admin').first():
         default_admin = User(
@@ -157,6 +503,25 @@ with app.app_context():
         db.session.add(default_admin)
         db.session.commit()
 
+# ==================== Template Warm-up ====================
+def warm_up_templates():
+    """
+    โหลด/compile template ทั้งหมดเข้า cache ตอน start
+    ให้ request แรกของหน้า /spin, /results, /admin เร็วเท่า request ปกติ
+    """
+    started = time.perf_counter()
+    names = [name for name in app.jinja_env.list_templates() if name.endswith('.html')]
+    for name in names:
+        app.jinja_env.get_template(name)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"Warmed up {len(names)} templates in {elapsed_ms:.1f} ms")
+    return elapsed_ms
+
+try:
+    warm_up_templates()
+except Exception as e:
+    print(f"Note: Could not warm up templates: {e}")
+
 # ==================== Login/Logout Routes ====================
 @app.route('/login', methods=['GET', 'POST'])
 def login_page():
@@ -212,8 +577,12 @@ def index():
 @app.route('/spin')
 @admin_required
 def spin_page():
+    # mode=checked-in: สุ่มเฉพาะคนที่เช็คอินหน้างานแล้ว
+    checked_in_only = request.args.get('mode') == 'checked-in'
+    if checked_in_only:
+        flush_check_ins()
     total_participants = Participant.query.count()  # ผู้เข้าร่วมทั้งหมด
-    participants = Participant.query.filter_by(is_winner=False).all()  # ผู้รอลุ้นรางวัล
+    participants = eligible_participants(checked_in_only).all()  # ผู้รอลุ้นรางวัล
     
     # ดึงรางวัลที่ยังมีเหลือ (quantity > claimed_count)
     all_prizes = Prize.query.all()
@@ -269,7 +638,13 @@ def spin_page():
                          grand_prizes=grand_prizes,
                          normal_prizes=normal_prizes,
                          total_grand_remaining=total_grand_remaining,
-                         total_normal_remaining=total_normal_remaining)
+                         total_normal_remaining=total_normal_remaining,
+                         checked_in_only=checked_in_only)
+
+@app.route('/check-in')
+@admin_required
+def check_in_page():
+    return render_template('check_in.html')
 
 @app.route('/results')
 @login_required
@@ -333,9 +708,17 @@ def results_page():
 @app.route('/admin')
 @admin_required
 def admin_page():
-    participants = Participant.query.all()
-    prizes = Prize.query.all()
-    return render_template('admin.html', participants=participants, prizes=prizes)
+    # ส่งเฉพาะตัวเลขสรุป รายการจริงโหลดทีละหน้าผ่าน /api/participants และ /api/prizes
+    total_participants = Participant.query.count()
+    winner_participants = Participant.query.filter_by(is_winner=True).count()
+    grand_prizes = Prize.query.filter_by(is_grand=True).count()
+    normal_prizes = Prize.query.filter_by(is_grand=False).count()
+    return render_template('admin.html',
+                         total_participants=total_participants,
+                         available_participants=total_participants - winner_participants,
+                         winner_participants=winner_participants,
+                         grand_prizes=grand_prizes,
+                         normal_prizes=normal_prizes)
 
 @app.route('/static/uploads/prizes/<filename>')
 def uploaded_prize_image(filename):
@@ -357,7 +740,29 @@ def users_page():
 @app.route('/api/participants', methods=['GET'])
 @admin_required
 def get_participants():
-    participants = Participant.query.filter_by(is_winner=False).all()
+    """
+    รายชื่อผู้เข้าร่วม
+    Query: status (available|winner|all, default available), q (ค้นหาชื่อ/เบอร์โทร)
+    ถ้าส่ง limit หรือ cursor มาจะตอบแบบแบ่งหน้า (keyset) พร้อม sort (id|name) และ order (asc|desc)
+    """
+    status = request.args.get('status', 'available')
+    search = request.args.get('q', '').strip()
+    
+    query = Participant.query
+    if status == 'available':
+        query = query.filter(Participant.is_winner == False)
+    elif status == 'winner':
+        query = query.filter(Participant.is_winner == True)
+    if search:
+        pattern = f'%{search}%'
+        query = query.filter(or_(Participant.name.ilike(pattern), Participant.phone.ilike(pattern)))
+    
+    if 'limit' in request.args or 'cursor' in request.args:
+        return paged_response(query.options(joinedload(Participant.prize)),
+                              {'id': Participant.id, 'name': Participant.name},
+                              Participant.id, participant_to_dict)
+    
+    participants = query.all()
     return jsonify([{
         'id': p.id,
         'name': p.name,
@@ -395,14 +800,22 @@ def add_participant():
     )
     db.session.add(participant)
     db.session.commit()
+    invalidate_check_in_phone_index()
     return jsonify({'success': True, 'id': participant.id, 'image_path': image_path})
 
 @app.route('/api/participants/<int:id>', methods=['DELETE'])
 @admin_required
 def delete_participant(id):
     participant = Participant.query.get_or_404(id)
+    if participant.prize:
+        # จำนวนครั้งที่สุ่มของยอดรวม/หมวดนับจากประวัติ (ไม่เปลี่ยน) - ลดเฉพาะแถวของรางวัลนั้น
+        no_show = int(participant.attendance_status == 'ไม่เข้าร่วมงาน')
+        add_to_draw_stat(f'prize:{participant.prize_id}', {'draws': -1, 'no_shows': -no_show})
+        for key in ('all', 'grand' if participant.prize.is_grand else 'normal'):
+            add_to_draw_stat(key, {'no_shows': -no_show})
     db.session.delete(participant)
     db.session.commit()
+    invalidate_check_in_phone_index()
     return jsonify({'success': True})
 
 @app.route('/api/participants/<int:id>/unclaim', methods=['POST'])
@@ -417,6 +830,10 @@ def unclaim_winner(id):
     if not participant.prize_id:
         return jsonify({'error': 'ไม่พบรางวัลที่เกี่ยวข้อง'}), 400
     
+    # คืนรางวัลไปแล้ว - ทำซ้ำจะนับไม่เข้าร่วมงาน/คืนรางวัลซ้ำ
+    if participant.attendance_status == 'ไม่เข้าร่วมงาน':
+        return jsonify({'error': f'{participant.name} ถูกเปลี่ยนเป็น "ไม่เข้าร่วมงาน" ไปแล้ว'}), 400
+    
     # หารางวัลที่เกี่ยวข้อง
     prize = Prize.query.get(participant.prize_id)
     if not prize:
@@ -428,22 +845,91 @@ def unclaim_winner(id):
         prize_name=prize.name
     ).first()
     
-    if history_entry:
-        history_entry.status = 'ไม่เข้าร่วมงาน'
+    mark_no_show(participant, prize, history_entry)
+    db.session.commit()
     
-    # คืนรางวัล (ลด claimed_count)
-    if prize.claimed_count > 0:
-        prize.claimed_count -= 1
+    return jsonify({
+        'success': True,
+        'message': f'เปลี่ยนสถานะ {participant.name} เป็น "ไม่เข้าร่วมงาน" และคืนรางวัล "{prize.name}" กลับเรียบร้อย'
+    })
+
+@app.route('/api/participants/no-show', methods=['POST'])
+@admin_required
+def batch_no_show():
+    """
+    เปลี่ยนผู้ชนะหลายคนเป็น 'ไม่เข้าร่วมงาน' แล้วสุ่มผู้โชคดีคนใหม่แทนในรางวัลเดิมทันที
+    Input: participant_ids (list), redraw (default true), checked_in_only (สุ่มแทนจากคนที่เช็คอินแล้ว)
+    ทำทั้งหมดใน commit เดียว - ถ้ามีรายการไหนไม่ถูกต้องจะไม่บันทึกอะไรเลย
+    """
+    data = request.json or {}
+    participant_ids = data.get('participant_ids') or []
+    redraw = data.get('redraw', True)
+    checked_in_only = bool(data.get('checked_in_only'))
     
-    # อัพเดทสถานะ participant (แต่ยังคง is_winner = True เพื่อคงอยู่ในรายการ)
-    participant.attendance_status = 'ไม่เข้าร่วมงาน'
-    # ไม่เปลี่ยน is_winner, prize_id, won_at เพื่อคงอยู่ในรายการผู้ได้รับรางวัล
+    if not isinstance(participant_ids, list) or not participant_ids:
+        return jsonify({'error': 'กรุณาเลือกผู้ชนะที่ไม่มารับรางวัล'}), 400
+    try:
+        participant_ids = list(dict.fromkeys(int(pid) for pid in participant_ids))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'รหัสผู้เข้าร่วมไม่ถูกต้อง'}), 400
+    
+    # flush_check_ins() commit เอง - ต้องทำก่อนเริ่มแก้ข้อมูล ไม่งั้นผู้ไม่มารับรางวัลจะถูกบันทึกก่อนสุ่มคนแทน
+    if redraw and checked_in_only:
+        flush_check_ins()
+    
+    participants = Participant.query.options(joinedload(Participant.prize)).filter(
+        Participant.id.in_(participant_ids)
+    ).all()
+    by_id = {p.id: p for p in participants}
+    
+    missing = [str(pid) for pid in participant_ids if pid not in by_id]
+    if missing:
+        return jsonify({'error': f'ไม่พบผู้เข้าร่วม (id: {", ".join(missing)})'}), 400
+    
+    invalid = [p.name for p in participants
+               if not p.is_winner or not p.prize or p.attendance_status == 'ไม่เข้าร่วมงาน']
+    if invalid:
+        return jsonify({'error': f'ไม่ใช่ผู้ชนะที่รอรับรางวัล: {", ".join(invalid)}'}), 400
+    
+    # ประวัติของผู้ชนะทุกคนในครั้งเดียว (ล่าสุดก่อน) - key = (ชื่อ, รางวัล)
+    history_entries = {}
+    histories = DrawHistory.query.filter(
+        DrawHistory.participant_name.in_({p.name for p in participants})
+    ).order_by(DrawHistory.created_at.desc())
+    for entry in histories:
+        if entry.status != 'ไม่เข้าร่วมงาน':
+            history_entries.setdefault((entry.participant_name, entry.prize_name), entry)
+    
+    no_shows = []
+    for pid in participant_ids:
+        participant = by_id[pid]
+        prize = participant.prize
+        mark_no_show(participant, prize, history_entries.get((participant.name, prize.name)))
+        no_shows.append({
+            'participant_id': participant.id,
+            'participant_name': participant.name,
+            'prize_id': prize.id,
+            'prize_name': prize.name
+        })
+    
+    # สุ่มคนใหม่แทน 1 คนต่อ 1 รางวัลที่คืนมา (ผู้ไม่มารับรางวัลยังเป็น is_winner จึงไม่ถูกสุ่มซ้ำ)
+    results = []
+    if redraw:
+        available_participants = eligible_participants(checked_in_only).all()
+        replacements = random.sample(available_participants, min(len(no_shows), len(available_participants)))
+        for no_show, winner in zip(no_shows, replacements):
+            result = award_prize(winner, by_id[no_show['participant_id']].prize)
+            result['replaces_id'] = no_show['participant_id']
+            result['replaces_name'] = no_show['participant_name']
+            results.append(result)
     
     db.session.commit()
     
     return jsonify({
         'success': True,
-        'message': f'เปลี่ยนสถานะ {participant.name} เป็น "ไม่เข้าร่วมงาน" และคืนรางวัล "{prize.name}" กลับเรียบร้อย'
+        'no_shows': no_shows,
+        'results': results,
+        'unfilled': len(no_shows) - len(results) if redraw else 0
     })
 
 @app.route('/api/participants/bulk', methods=['POST'])
@@ -460,35 +946,251 @@ def add_bulk_participants():
     db.session.commit()
     return jsonify({'success': True, 'count': count})
 
+# ==================== Bulk Participant Photos (ZIP) ====================
+# งานนำเข้ารูปเก็บในหน่วยความจำของ process นี้ (ใช้ได้กับการรันแบบ process เดียว)
+photo_import_jobs = {}
+photo_import_lock = threading.Lock()
+photo_import_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='photo-import')
+photo_worker_pool = ThreadPoolExecutor(max_workers=app.config['PHOTO_IMPORT_WORKERS'],
+                                       thread_name_prefix='photo-worker')
+PHOTO_IMPORT_BATCH_SIZE = 500   # commit การอัปเดต image_path ทีละกี่คน
+PHOTO_IMPORT_MAX_REPORTED = 200  # จำนวนชื่อไฟล์ที่จับคู่ไม่ได้ที่เก็บไว้แสดง
+
+def normalize_match_key(value):
+    """ทำให้ชื่อไฟล์/ชื่อคนเทียบกันได้: ตัด _ - และช่องว่างซ้ำ, ไม่สนตัวพิมพ์"""
+    value = (value or '').replace('_', ' ').replace('-', ' ')
+    return ' '.join(value.split()).casefold()
+
+def phone_match_key(value):
+    """เก็บเฉพาะตัวเลขของเบอร์โทร (ต้องยาวอย่างน้อย 6 หลัก)"""
+    digits = ''.join(ch for ch in (value or '') if ch.isdigit())
+    return digits if len(digits) >= 6 else None
+
+def zip_entry_name(info):
+    """ชื่อไฟล์ใน ZIP - ZIP ที่ไม่ได้ตั้ง flag UTF-8 (เช่นจาก Windows) จะถูกอ่านเป็น cp437"""
+    name = info.filename
+    if not info.flag_bits & 0x800:
+        try:
+            name = name.encode('cp437').decode('utf-8')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
+    return name
+
+def build_participant_lookup():
+    """สร้าง map ชื่อ/เบอร์โทร/ID -> participant id (ชื่อหรือเบอร์ที่ซ้ำกันจะเป็น None)"""
+    by_name, by_phone, by_id = {}, {}, {}
+    rows = db.session.query(Participant.id, Participant.name, Participant.phone).all()
+    for participant_id, name, phone in rows:
+        by_id[str(participant_id)] = participant_id
+        key = normalize_match_key(name)
+        by_name[key] = None if key in by_name else participant_id
+        phone_key = phone_match_key(phone)
+        if phone_key:
+            by_phone[phone_key] = None if phone_key in by_phone else participant_id
+    return by_name, by_phone, by_id
+
+def match_photo_to_participant(filename, lookup):
+    """จับคู่ไฟล์รูปกับผู้เข้าร่วมจากชื่อไฟล์: ชื่อ -> เบอร์โทร -> ID"""
+    by_name, by_phone, by_id = lookup
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    key = normalize_match_key(stem)
+    if key in by_name:
+        return by_name[key]
+    phone_key = phone_match_key(stem)
+    if phone_key and phone_key in by_phone:
+        return by_phone[phone_key]
+    return by_id.get(stem.strip())
+
+def update_photo_job(job_id, **changes):
+    with photo_import_lock:
+        photo_import_jobs[job_id].update(changes)
+
+def extract_participant_photo(archive, info, participant_id):
+    """แตกไฟล์รูปหนึ่งไฟล์จาก ZIP ไปไว้ใน UPLOAD_FOLDER_PARTICIPANTS (รันใน worker pool)"""
+    ext = os.path.splitext(info.filename)[1].lower()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_')
+    filename = f'{timestamp}{participant_id}_{uuid.uuid4().hex[:8]}{ext}'
+    filepath = os.path.join(app.config['UPLOAD_FOLDER_PARTICIPANTS'], filename)
+    with archive.open(info) as source, open(filepath, 'wb') as target:
+        while True:
+            chunk = source.read(1024 * 1024)
+            if not chunk:
+                break
+            target.write(chunk)
+    return f'uploads/participants/{filename}'
+
+def save_photo_batch(updates):
+    """บันทึก image_path ทีละ batch และลบรูปเก่าที่ถูกแทนที่"""
+    participants = Participant.query.filter(Participant.id.in_(list(updates.keys()))).all()
+    old_paths = []
+    for participant in participants:
+        if participant.image_path:
+            old_paths.append(participant.image_path)
+        participant.image_path = updates[participant.id]
+    db.session.commit()
+    for old_path in old_paths:
+        path = os.path.join('static', old_path)
+        if old_path.startswith('uploads/participants/') and os.path.exists(path):
+            os.remove(path)
+
+def run_photo_import(job_id, zip_path):
+    """ประมวลผล ZIP ใน background: จับคู่ไฟล์, แตกไฟล์ด้วย worker pool, อัปเดตฐานข้อมูลเป็น batch"""
+    update_photo_job(job_id, status='running', started_at=datetime.utcnow().isoformat())
+    try:
+        with app.app_context(), zipfile.ZipFile(zip_path) as archive:
+            lookup = build_participant_lookup()
+            
+            entries = []
+            unmatched = []
+            too_large = []  # จับคู่ได้หรือไม่ก็ตาม แต่ไฟล์ใหญ่เกิน MAX_CONTENT_LENGTH
+            for info in archive.infolist():
+                name = zip_entry_name(info)
+                basename = os.path.basename(name)
+                if info.is_dir() or not basename or basename.startswith('.') or '__MACOSX' in name:
+                    continue
+                if not allowed_file(basename):
+                    continue
+                if info.file_size > app.config['MAX_CONTENT_LENGTH']:
+                    too_large.append(basename)
+                    continue
+                participant_id = match_photo_to_participant(basename, lookup)
+                if participant_id is None:
+                    unmatched.append(basename)
+                else:
+                    entries.append((info, participant_id))
+            
+            rejected = len(unmatched) + len(too_large)
+            update_photo_job(job_id, total=len(entries) + rejected,
+                             processed=rejected, unmatched=len(unmatched),
+                             unmatched_files=unmatched[:PHOTO_IMPORT_MAX_REPORTED],
+                             too_large=len(too_large),
+                             too_large_files=too_large[:PHOTO_IMPORT_MAX_REPORTED])
+            
+            # ถ้ามีหลายไฟล์จับคู่กับคนเดียวกัน ใช้ไฟล์สุดท้าย
+            latest = {}
+            for info, participant_id in entries:
+                latest[participant_id] = info
+            skipped = len(entries) - len(latest)
+            
+            futures = {photo_worker_pool.submit(extract_participant_photo, archive, info, participant_id): participant_id
+                       for participant_id, info in latest.items()}
+            
+            updates = {}
+            matched = 0
+            failed = 0
+            for future, participant_id in futures.items():
+                try:
+                    updates[participant_id] = future.result()
+                    matched += 1
+                except Exception as e:
+                    print(f"Photo import {job_id}: failed to extract photo for participant {participant_id}: {e}")
+                    failed += 1
+                
+                if len(updates) >= PHOTO_IMPORT_BATCH_SIZE:
+                    save_photo_batch(updates)
+                    updates = {}
+                update_photo_job(job_id, processed=rejected + skipped + matched + failed,
+                                 matched=matched, failed=failed)
+            
+            if updates:
+                save_photo_batch(updates)
+            
+            update_photo_job(job_id, status='done', processed=len(entries) + rejected,
+                             matched=matched, failed=failed, duplicates=skipped,
+                             finished_at=datetime.utcnow().isoformat())
+    except Exception as e:
+        print(f"Photo import {job_id} failed: {e}")
+        with app.app_context():
+            db.session.rollback()
+        update_photo_job(job_id, status='failed', error=str(e),
+                         finished_at=datetime.utcnow().isoformat())
+    finally:
+        if os.path.exists(zip_path):
+            os.remove(zip_path)
+
+@app.route('/api/participants/photos/bulk', methods=['POST'])
+@admin_required
+def import_participant_photos():
+    """
+    อัปโหลด ZIP รูปผู้เข้าร่วม - ชื่อไฟล์ต้องเป็นชื่อ, เบอร์โทร หรือ ID ของผู้เข้าร่วม
+    ตอบกลับทันทีพร้อม job_id แล้วประมวลผลใน background (ดูความคืบหน้าที่ GET .../<job_id>)
+    """
+    file = request.files.get('file')
+    if not file or not file.filename:
+        return jsonify({'error': 'กรุณาเลือกไฟล์ ZIP'}), 400
+    
+    fd, zip_path = tempfile.mkstemp(suffix='.zip', prefix='photos_')
+    os.close(fd)
+    file.save(zip_path)
+    if not zipfile.is_zipfile(zip_path):
+        os.remove(zip_path)
+        return jsonify({'error': 'ไฟล์ที่อัปโหลดไม่ใช่ ZIP'}), 400
+    
+    job_id = uuid.uuid4().hex
+    with photo_import_lock:
+        photo_import_jobs[job_id] = {
+            'id': job_id,
+            'status': 'queued',
+            'filename': file.filename,
+            'total': None,
+            'processed': 0,
+            'matched': 0,
+            'unmatched': 0,
+            'failed': 0,
+            'duplicates': 0,
+            'unmatched_files': [],
+            'too_large': 0,
+            'too_large_files': [],
+            'error': None,
+            'created_at': datetime.utcnow().isoformat(),
+            'started_at': None,
+            'finished_at': None
+        }
+    photo_import_executor.submit(run_photo_import, job_id, zip_path)
+    
+    return jsonify({'success': True, 'job_id': job_id}), 202
+
+@app.route('/api/participants/photos/bulk/<job_id>', methods=['GET'])
+@admin_required
+def get_photo_import_status(job_id):
+    """ความคืบหน้าของงานนำเข้ารูปจาก ZIP"""
+    with photo_import_lock:
+        job = photo_import_jobs.get(job_id)
+        if not job:
+            return jsonify({'error': 'ไม่พบงานนำเข้ารูป'}), 404
+        return jsonify(dict(job, unmatched_files=list(job['unmatched_files'])))
+
 # ==================== API Routes - Prizes ====================
 @app.route('/api/prizes', methods=['GET'])
 @admin_required
 def get_prizes():
+    """
+    รายการรางวัล
+    Query: is_grand (true|false), available (true = เฉพาะที่ยังเหลือ), q (ค้นหาชื่อ/QR Code)
+    ถ้าส่ง limit หรือ cursor มาจะตอบแบบแบ่งหน้า (keyset) พร้อม sort (id|name|remaining) และ order (asc|desc)
+    """
     is_grand = request.args.get('is_grand', None)
     available_only = request.args.get('available', 'false') == 'true'
+    search = request.args.get('q', '').strip()
+    remaining = Prize.quantity - Prize.claimed_count
     
     query = Prize.query
     if is_grand is not None:
         query = query.filter_by(is_grand=is_grand == 'true')
     
-    prizes = query.all()
-    
     # กรองเฉพาะที่ยังมีเหลือ
     if available_only:
-        prizes = [p for p in prizes if p.remaining > 0]
+        query = query.filter(remaining > 0)
+    if search:
+        pattern = f'%{search}%'
+        query = query.filter(or_(Prize.name.ilike(pattern), Prize.qr_code.ilike(pattern)))
     
-    return jsonify([{
-        'id': p.id,
-        'name': p.name,
-        'description': p.description,
-        'color': p.color,
-        'qr_code': p.qr_code,
-        'image_path': p.image_path,
-        'is_grand': p.is_grand,
-        'quantity': p.quantity,
-        'claimed_count': p.claimed_count,
-        'remaining': p.remaining
-    } for p in prizes])
+    if 'limit' in request.args or 'cursor' in request.args:
+        return paged_response(query,
+                              {'id': Prize.id, 'name': Prize.name, 'remaining': remaining},
+                              Prize.id, prize_to_dict)
+    
+    return jsonify([prize_to_dict(p) for p in query.all()])
 
 @app.route('/api/prizes', methods=['POST'])
 @admin_required
@@ -532,6 +1234,8 @@ def add_prize():
         quantity=quantity
     )
     db.session.add(prize)
+    db.session.flush()  # ให้ได้ prize.id สำหรับแถวสรุป
+    sync_prize_stats(prize)
     db.session.commit()
     return jsonify({'success': True, 'id': prize.id, 'image_path': image_path})
 
@@ -539,6 +1243,7 @@ def add_prize():
 @admin_required
 def update_prize(id):
     prize = Prize.query.get_or_404(id)
+    stats_before = prize_stat_snapshot(prize)
     
     # รองรับทั้ง JSON และ FormData
     if request.is_json:
@@ -586,6 +1291,7 @@ def update_prize(id):
     if image_path:
         prize.image_path = image_path
     
+    sync_prize_stats(prize, stats_before)
     db.session.commit()
     return jsonify({'success': True})
 
@@ -593,21 +1299,81 @@ def update_prize(id):
 @admin_required
 def delete_prize(id):
     prize = Prize.query.get_or_404(id)
+    sync_prize_stats(prize, prize_stat_snapshot(prize), deleted=True)
     db.session.delete(prize)
     db.session.commit()
     return jsonify({'success': True})
 
 # ==================== API Routes - Spin ====================
+def eligible_participants(checked_in_only=False):
+    """
+    ผู้เข้าร่วมที่มีสิทธิ์ถูกสุ่ม (ใช้ร่วมกันระหว่าง spin, การสุ่มแทน และ simulate_fairness.py)
+    checked_in_only: เฉพาะคนที่เช็คอินหน้างานแล้ว (ใช้ index ix_participant_draw_pool)
+    """
+    query = Participant.query.filter_by(is_winner=False)
+    if checked_in_only:
+        query = query.filter(Participant.checked_in_at.isnot(None))
+    return query
+
+def award_prize(winner, prize):
+    """บันทึกผู้โชคดี 1 คนของรางวัล (ยังไม่ commit) คืนค่าผลลัพธ์สำหรับ response"""
+    winner.is_winner = True
+    winner.prize_id = prize.id
+    winner.won_at = datetime.utcnow()
+    
+    # เพิ่มจำนวนที่ถูกสุ่มไป
+    was_available = prize.remaining > 0
+    prize.claimed_count += 1
+    bump_draw_stats(prize, drawn_at=winner.won_at, claimed=1, draws=1,
+                    available=int(prize.remaining > 0) - int(was_available))
+    bump_draw_timeline(prize, winner.won_at)
+    
+    # บันทึกประวัติ (เวลาเดียวกับ won_at ให้ last_draw_at ตรงกับตอน rebuild_draw_stats)
+    history = DrawHistory(
+        participant_name=winner.name,
+        prize_name=prize.name,
+        is_grand=prize.is_grand,
+        status='ได้รับรางวัล',
+        created_at=winner.won_at
+    )
+    db.session.add(history)
+    
+    return {
+        'winner_id': winner.id,
+        'winner_name': winner.name,
+        'prize_id': prize.id,
+        'prize_name': prize.name,
+        'is_grand': prize.is_grand
+    }
+
+def mark_no_show(participant, prize, history_entry):
+    """เปลี่ยนผู้ชนะเป็น 'ไม่เข้าร่วมงาน' และคืนรางวัลกลับ (ยังไม่ commit)"""
+    if history_entry:
+        history_entry.status = 'ไม่เข้าร่วมงาน'
+    
+    # คืนรางวัล (ลด claimed_count)
+    was_available = prize.remaining > 0
+    claimed = 0
+    if prize.claimed_count > 0:
+        prize.claimed_count -= 1
+        claimed = -1
+    bump_draw_stats(prize, claimed=claimed, no_shows=1, available=int(prize.remaining > 0) - int(was_available))
+    
+    # อัพเดทสถานะ participant (แต่ยังคง is_winner = True เพื่อคงอยู่ในรายการ)
+    # ไม่เปลี่ยน is_winner, prize_id, won_at เพื่อคงอยู่ในรายการผู้ได้รับรางวัล
+    participant.attendance_status = 'ไม่เข้าร่วมงาน'
+
 @app.route('/api/spin', methods=['POST'])
 @admin_required
 def spin():
     """
     สุ่มหาผู้โชคดี - เลือกรางวัลก่อน แล้วค่อยสุ่มหาคน
-    Input: prize_id (รางวัลที่เลือก), count (จำนวนผู้โชคดี)
+    Input: prize_id (รางวัลที่เลือก), count (จำนวนผู้โชคดี), checked_in_only (สุ่มเฉพาะคนที่เช็คอินแล้ว)
     """
     data = request.json
     prize_id = data.get('prize_id')
     count = data.get('count', 1)
+    checked_in_only = bool(data.get('checked_in_only'))
     
     if not prize_id:
         return jsonify({'error': 'กรุณาเลือกรางวัลก่อน'}), 400
@@ -621,40 +1387,19 @@ def spin():
     if prize.remaining < count:
         return jsonify({'error': f'รางวัล "{prize.name}" เหลือไม่เพียงพอ (เหลือ {prize.remaining} รางวัล)'}), 400
     
-    # หาผู้เข้าร่วมที่ยังไม่ได้รางวัล
-    available_participants = Participant.query.filter_by(is_winner=False).all()
+    # หาผู้เข้าร่วมที่ยังไม่ได้รางวัล (เขียนการเช็คอินที่รออยู่ก่อน ให้คนที่เพิ่งสแกนมีสิทธิ์ด้วย)
+    if checked_in_only:
+        flush_check_ins()
+    available_participants = eligible_participants(checked_in_only).all()
     
     if len(available_participants) < count:
-        return jsonify({'error': f'มีผู้เข้าร่วมไม่เพียงพอ (เหลือ {len(available_participants)} คน)'}), 400
+        who = 'ผู้ที่เช็คอินแล้ว' if checked_in_only else 'ผู้เข้าร่วม'
+        return jsonify({'error': f'มี{who}ไม่เพียงพอ (เหลือ {len(available_participants)} คน)'}), 400
     
     # สุ่มผู้โชคดี
     winners = random.sample(available_participants, count)
     
-    results = []
-    for winner in winners:
-        winner.is_winner = True
-        winner.prize_id = prize.id
-        winner.won_at = datetime.utcnow()
-        
-        # เพิ่มจำนวนที่ถูกสุ่มไป
-        prize.claimed_count += 1
-        
-        # บันทึกประวัติ
-        history = DrawHistory(
-            participant_name=winner.name,
-            prize_name=prize.name,
-            is_grand=prize.is_grand,
-            status='ได้รับรางวัล'
-        )
-        db.session.add(history)
-        
-        results.append({
-            'winner_id': winner.id,
-            'winner_name': winner.name,
-            'prize_id': prize.id,
-            'prize_name': prize.name,
-            'is_grand': prize.is_grand
-        })
+    results = [award_prize(winner, prize) for winner in winners]
     
     db.session.commit()
     
@@ -680,6 +1425,7 @@ def reset_all():
     # ลบประวัติ
     DrawHistory.query.delete()
     db.session.commit()
+    rebuild_draw_stats()
     return jsonify({'success': True})
 
 @app.route('/api/clear-all', methods=['POST'])
@@ -689,6 +1435,8 @@ def clear_all():
     Prize.query.delete()
     DrawHistory.query.delete()
     db.session.commit()
+    invalidate_check_in_phone_index()
+    rebuild_draw_stats()
     return jsonify({'success': True})
 
 @app.route('/api/clear-participants', methods=['POST'])
@@ -697,6 +1445,8 @@ def clear_participants():
     Participant.query.delete()
     DrawHistory.query.delete()
     db.session.commit()
+    invalidate_check_in_phone_index()
+    rebuild_draw_stats()
     return jsonify({'success': True})
 
 @app.route('/api/clear-prizes', methods=['POST'])
@@ -705,8 +1455,359 @@ def clear_prizes():
     Prize.query.delete()
     DrawHistory.query.delete()
     db.session.commit()
+    rebuild_draw_stats()
     return jsonify({'success': True})
 
+# ==================== API Routes - Check-in ====================
+# หน้างานมีการสแกนเช็คอินหลายร้อยครั้งต่อนาที - ไม่ commit ทีละคน
+# แต่เก็บไว้ใน buffer แล้วเขียนลงฐานข้อมูลเป็น batch (ทุก CHECK_IN_FLUSH_INTERVAL หรือเมื่อครบ CHECK_IN_BATCH_SIZE)
+check_in_buffer = {}  # participant_id -> เวลาที่สแกน (ยังไม่ได้เขียนลงฐานข้อมูล)
+check_in_lock = threading.Lock()  # ป้องกัน check_in_buffer
+check_in_flush_lock = threading.Lock()  # ให้ flush ทีละครั้ง - คนที่รอ flush จะเห็นข้อมูลที่เขียนเสร็จแล้ว
+check_in_wakeup = threading.Event()
+check_in_flusher = None
+check_in_phone_index = None  # phone_match_key -> participant id (เบอร์ซ้ำ = None) - สร้างตอนสแกนครั้งแรก
+check_in_phone_generation = 0  # เพิ่มทุกครั้งที่รายชื่อเปลี่ยน - index ที่สร้างจากข้อมูลเก่าจะไม่ถูกเก็บ
+check_in_phone_lock = threading.Lock()
+
+def queue_check_ins(participant_ids):
+    """เพิ่มการเช็คอินเข้า buffer และปลุก thread flush ถ้าครบ batch"""
+    global check_in_flusher
+    scanned_at = datetime.utcnow()
+    with check_in_lock:
+        for participant_id in participant_ids:
+            check_in_buffer.setdefault(participant_id, scanned_at)
+        batch_full = len(check_in_buffer) >= app.config['CHECK_IN_BATCH_SIZE']
+        if check_in_flusher is None:
+            check_in_flusher = threading.Thread(target=check_in_flush_loop, name='check-in-flush', daemon=True)
+            check_in_flusher.start()
+    if batch_full:
+        check_in_wakeup.set()
+
+def flush_check_ins():
+    """เขียนการเช็คอินที่รออยู่ทั้งหมดลงฐานข้อมูลใน commit เดียว คืนจำนวนที่เขียน"""
+    with check_in_flush_lock:
+        with check_in_lock:
+            pending = dict(check_in_buffer)
+            check_in_buffer.clear()
+        if not pending:
+            return 0
+        
+        table = Participant.__table__
+        statement = table.update().where(
+            table.c.id == bindparam('participant_id'),
+            table.c.checked_in_at.is_(None)
+        ).values(checked_in_at=bindparam('scanned_at'))
+        try:
+            db.session.execute(statement, [
+                {'participant_id': participant_id, 'scanned_at': scanned_at}
+                for participant_id, scanned_at in pending.items()
+            ])
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            # คืนเข้า buffer ไว้ลองใหม่รอบหน้า
+            with check_in_lock:
+                for participant_id, scanned_at in pending.items():
+                    check_in_buffer.setdefault(participant_id, scanned_at)
+            raise
+        return len(pending)
+
+def check_in_flush_loop():
+    while True:
+        check_in_wakeup.wait(app.config['CHECK_IN_FLUSH_INTERVAL'])
+        check_in_wakeup.clear()
+        with app.app_context():
+            try:
+                flush_check_ins()
+            except Exception as e:
+                print(f"Check-in flush failed: {e}")
+            finally:
+                db.session.remove()
+
+def invalidate_check_in_phone_index():
+    """เรียกหลัง commit ที่เพิ่ม/ลบผู้เข้าร่วม ให้สร้าง index เบอร์โทรใหม่ตอนสแกนครั้งถัดไป"""
+    global check_in_phone_index, check_in_phone_generation
+    with check_in_phone_lock:
+        check_in_phone_index = None
+        check_in_phone_generation += 1
+
+def get_check_in_phone_index():
+    """
+    map เบอร์โทร (เฉพาะตัวเลข แบบเดียวกับการจับคู่รูป) -> participant id
+    สร้างครั้งเดียวแล้วใช้ซ้ำ - สแกนหน้างานไม่ต้อง scan ตาราง Participant ทุกครั้ง
+    """
+    global check_in_phone_index
+    with check_in_phone_lock:
+        if check_in_phone_index is not None:
+            return check_in_phone_index
+        generation = check_in_phone_generation
+    
+    index = {}
+    for participant_id, phone in db.session.query(Participant.id, Participant.phone):
+        key = phone_match_key(phone)
+        if key:
+            index[key] = None if key in index else participant_id
+    
+    with check_in_phone_lock:
+        if generation == check_in_phone_generation:
+            check_in_phone_index = index
+    return index
+
+def find_participant_by_code(code):
+    """หาผู้เข้าร่วมจากข้อความใน QR / ที่พิมพ์: ID หรือเบอร์โทร (ไม่สนขีด/เว้นวรรค)"""
+    code = code.strip()
+    if not code:
+        return None
+    if code.isdigit():
+        participant = db.session.get(Participant, int(code))
+        if participant:
+            return participant
+    phone_key = phone_match_key(code)
+    if phone_key:
+        participant_id = get_check_in_phone_index().get(phone_key)
+        return db.session.get(Participant, participant_id) if participant_id else None
+    return Participant.query.filter_by(phone=code).first()
+
+@app.route('/api/check-in', methods=['POST'])
+@admin_required
+def check_in():
+    """
+    เช็คอินผู้เข้าร่วมหน้างาน
+    Input: code (ID หรือเบอร์โทรจาก QR) หรือ participant_ids (list - สำหรับเครื่องสแกนที่ส่งเป็นชุด)
+    """
+    data = request.json or {}
+    
+    if 'participant_ids' in data:
+        try:
+            participant_ids = list(dict.fromkeys(int(pid) for pid in data.get('participant_ids') or []))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'รหัสผู้เข้าร่วมไม่ถูกต้อง'}), 400
+        rows = db.session.query(Participant.id, Participant.checked_in_at).filter(
+            Participant.id.in_(participant_ids)
+        ).all()
+        # ไม่นับซ้ำคนที่สแกนแล้วแต่ยังรอเขียนลงฐานข้อมูลใน buffer
+        with check_in_lock:
+            new_ids = [pid for pid, checked_in_at in rows
+                       if checked_in_at is None and pid not in check_in_buffer]
+        queue_check_ins(new_ids)
+        found = {pid for pid, _ in rows}
+        return jsonify({
+            'success': True,
+            'checked_in': len(new_ids),
+            'already_checked_in': len(rows) - len(new_ids),
+            'not_found': [pid for pid in participant_ids if pid not in found]
+        })
+    
+    participant = find_participant_by_code(str(data.get('code') or ''))
+    if not participant:
+        return jsonify({'error': 'ไม่พบผู้เข้าร่วม'}), 404
+    
+    with check_in_lock:
+        already_checked_in = participant.checked_in_at is not None or participant.id in check_in_buffer
+    if not already_checked_in:
+        queue_check_ins([participant.id])
+    
+    return jsonify({
+        'success': True,
+        'already_checked_in': already_checked_in,
+        'participant': {
+            'id': participant.id,
+            'name': participant.name,
+            'image_path': participant.image_path
+        }
+    })
+
+@app.route('/api/check-in/stats', methods=['GET'])
+@admin_required
+def check_in_stats():
+    with check_in_lock:
+        pending = len(check_in_buffer)
+    checked_in = Participant.query.filter(Participant.checked_in_at.isnot(None)).count()
+    return jsonify({
+        'total': Participant.query.count(),
+        'checked_in': checked_in + pending,
+        'pending': pending
+    })
+
+# ==================== API Routes - Event Archive ====================
+# เก็บงานที่จบแล้ว (รางวัล, ผู้เข้าร่วม, ประวัติ, รูป) ลงไฟล์ ZIP ไฟล์เดียว แล้วล้างตารางหลัก
+# ให้ query ของงานถัดไปเร็วเหมือนเดิม - restore กลับมาได้เมื่อต้องการดู/สุ่มซ้ำ
+ARCHIVE_FORMAT_VERSION = 1
+ARCHIVED_TABLES = (('prizes', Prize), ('participants', Participant), ('history', DrawHistory))  # ลำดับตอน restore (prize ก่อน participant)
+
+def table_rows(model):
+    """ดึงทุกแถวของตารางเป็น dict (ใช้ Core ไม่สร้าง ORM object)"""
+    table = model.__table__
+    return [dict(row._mapping) for row in db.session.execute(table.select().order_by(table.c.id))]
+
+def json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+def archive_path(filename):
+    """path ของไฟล์ archive หรือ None ถ้าชื่อไฟล์ไม่ถูกต้อง/ไม่มีไฟล์"""
+    if secure_filename(filename) != filename or not filename.endswith('.zip'):
+        return None
+    path = os.path.join(app.config['ARCHIVE_FOLDER'], filename)
+    return path if os.path.isfile(path) else None
+
+def read_archive_meta(path):
+    with zipfile.ZipFile(path) as archive:
+        meta = json.loads(archive.read('meta.json'))
+    meta['filename'] = os.path.basename(path)
+    meta['size'] = os.path.getsize(path)
+    return meta
+
+def write_event_archive(name):
+    """เขียน snapshot ของงานปัจจุบันลง ARCHIVE_FOLDER คืนค่า (meta, รายการรูปที่เก็บ)"""
+    archived_at = datetime.now()
+    label = secure_filename(name or '')
+    # suffix สุ่มกันชื่อซ้ำ - เก็บหลายครั้งในวินาทีเดียวกัน หรือชื่องานภาษาไทยที่ secure_filename ตัดเหลือว่าง
+    filename = f"event_{archived_at.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}{'_' + label if label else ''}.zip"
+    
+    tables = {key: table_rows(model) for key, model in ARCHIVED_TABLES}
+    image_paths = sorted({row['image_path'] for key in ('prizes', 'participants')
+                          for row in tables[key] if row.get('image_path')})
+    meta = {
+        'version': ARCHIVE_FORMAT_VERSION,
+        'name': name or archived_at.strftime('%Y-%m-%d %H:%M'),
+        'archived_at': archived_at.isoformat(),
+        'counts': {key: len(rows) for key, rows in tables.items()}
+    }
+    
+    # เขียนลงไฟล์ชั่วคราวก่อน แล้วค่อยเปลี่ยนชื่อ - ไม่มีไฟล์ครึ่งๆ กลางๆ ถ้าเขียนไม่สำเร็จ
+    path = os.path.join(app.config['ARCHIVE_FOLDER'], filename)
+    temp_path = path + '.tmp'
+    with zipfile.ZipFile(temp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for key, rows in tables.items():
+            archive.writestr(f'{key}.json', json.dumps(rows, ensure_ascii=False, default=json_default))
+        image_count = 0
+        for image_path in image_paths:
+            source = os.path.join('static', image_path)
+            if os.path.isfile(source):
+                # รูปบีบอัดมาแล้ว เก็บแบบไม่บีบซ้ำ
+                archive.write(source, f'images/{image_path}', compress_type=zipfile.ZIP_STORED)
+                image_count += 1
+        meta['counts']['images'] = image_count
+        archive.writestr('meta.json', json.dumps(meta, ensure_ascii=False))
+    os.replace(temp_path, path)
+    
+    meta['filename'] = filename
+    meta['size'] = os.path.getsize(path)
+    return meta, image_paths
+
+def prune_event(image_paths):
+    """ลบข้อมูลงานออกจากตารางหลักและลบรูปที่เก็บลง archive แล้ว"""
+    DrawHistory.query.delete()
+    Participant.query.delete()
+    Prize.query.delete()
+    db.session.commit()
+    invalidate_check_in_phone_index()
+    for image_path in image_paths:
+        path = os.path.join('static', image_path)
+        if image_path.startswith('uploads/') and os.path.isfile(path):
+            os.remove(path)
+
+def restore_event_archive(path):
+    """โหลด snapshot กลับเข้าตารางหลักแบบ bulk insert (คง id เดิมไว้) และแตกรูปกลับไปที่ static/"""
+    with zipfile.ZipFile(path) as archive:
+        meta = json.loads(archive.read('meta.json'))
+        if meta.get('version') != ARCHIVE_FORMAT_VERSION:
+            raise ValueError(f"ไม่รองรับไฟล์ archive เวอร์ชัน {meta.get('version')}")
+        
+        for key, model in ARCHIVED_TABLES:
+            columns = {column.name: column for column in model.__table__.columns}
+            rows = []
+            for row in json.loads(archive.read(f'{key}.json')):
+                row = {name: value for name, value in row.items() if name in columns}
+                for name, value in row.items():
+                    if value and isinstance(columns[name].type, db.DateTime):
+                        row[name] = datetime.fromisoformat(value)
+                rows.append(row)
+            if rows:
+                db.session.execute(model.__table__.insert(), rows)
+        
+        for entry in archive.namelist():
+            if not entry.startswith('images/uploads/') or entry.endswith('/'):
+                continue
+            target = safe_join('static', entry[len('images/'):])
+            if target and not os.path.exists(target):
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with archive.open(entry) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+    db.session.commit()
+    invalidate_check_in_phone_index()
+    return meta
+
+def has_event_data():
+    return bool(Prize.query.first() or Participant.query.first() or DrawHistory.query.first())
+
+@app.route('/api/archives', methods=['GET'])
+@admin_required
+def get_archives():
+    archives = []
+    for filename in sorted(os.listdir(app.config['ARCHIVE_FOLDER']), reverse=True):
+        path = archive_path(filename)
+        if not path:
+            continue
+        try:
+            archives.append(read_archive_meta(path))
+        except (zipfile.BadZipFile, KeyError, ValueError) as e:
+            print(f"Note: Skipping unreadable archive {filename}: {e}")
+    return jsonify(archives)
+
+@app.route('/api/archives', methods=['POST'])
+@admin_required
+def archive_event():
+    """
+    เก็บงานปัจจุบันลงไฟล์ archive
+    Input: name (ชื่องาน), prune (ล้างตารางหลักหลังเก็บ, default true)
+    """
+    data = request.json or {}
+    name = (data.get('name') or '').strip()
+    prune = data.get('prune', True)
+    if isinstance(prune, str):
+        prune = prune.lower() == 'true'
+    
+    if not has_event_data():
+        return jsonify({'error': 'ไม่มีข้อมูลงานให้เก็บ'}), 400
+    
+    meta, image_paths = write_event_archive(name)
+    if prune:
+        prune_event(image_paths)
+        rebuild_draw_stats()
+    
+    return jsonify({'success': True, 'archive': meta, 'pruned': bool(prune)})
+
+@app.route('/api/archives/<filename>', methods=['GET'])
+@admin_required
+def download_archive(filename):
+    if not archive_path(filename):
+        return jsonify({'error': 'ไม่พบไฟล์ archive'}), 404
+    return send_from_directory(app.config['ARCHIVE_FOLDER'], filename, as_attachment=True)
+
+@app.route('/api/archives/<filename>/restore', methods=['POST'])
+@admin_required
+def restore_archive(filename):
+    """โหลดงานจาก archive กลับมา (ต้องเก็บหรือล้างงานปัจจุบันก่อน เพื่อคง id เดิมของข้อมูล)"""
+    path = archive_path(filename)
+    if not path:
+        return jsonify({'error': 'ไม่พบไฟล์ archive'}), 404
+    
+    if has_event_data():
+        return jsonify({'error': 'กรุณาเก็บ (archive) หรือล้างข้อมูลงานปัจจุบันก่อน restore'}), 400
+    
+    try:
+        meta = restore_event_archive(path)
+        rebuild_draw_stats()
+    except (zipfile.BadZipFile, KeyError, ValueError) as e:
+        db.session.rollback()
+        return jsonify({'error': f'ไฟล์ archive ไม่ถูกต้อง: {e}'}), 400
+    
+    return jsonify({'success': True, 'archive': meta})
+
 # ==================== API Routes - Users ====================
 @app.route('/api/users', methods=['GET'])
 @admin_required
@@ -811,23 +1912,202 @@ def delete_user(id):
 @login_required
 def check_results_update():
     """ตรวจสอบว่ามีข้อมูลเปลี่ยนแปลงหรือไม่"""
-    # ดึงข้อมูลปัจจุบัน
-    history_count = DrawHistory.query.count()
+    # ดึงข้อมูลปัจจุบันจากตารางสรุป (ไม่ต้อง scan DrawHistory / Prize)
+    totals = db.session.get(DrawStat, 'all') or DrawStat(draws=0, available=0)
     non_winners_count = Participant.query.filter_by(is_winner=False).count()
-    all_prizes = Prize.query.all()
-    unclaimed_prizes_count = len([p for p in all_prizes if p.remaining > 0])
-    
-    # หา timestamp ของ history ล่าสุด
-    latest_history = DrawHistory.query.order_by(DrawHistory.created_at.desc()).first()
-    latest_timestamp = latest_history.created_at.isoformat() if latest_history else None
     
     return jsonify({
-        'history_count': history_count,
+        'history_count': totals.draws,
         'non_winners_count': non_winners_count,
-        'unclaimed_prizes_count': unclaimed_prizes_count,
-        'latest_timestamp': latest_timestamp
+        'unclaimed_prizes_count': totals.available,
+        'latest_timestamp': totals.last_draw_at.isoformat() if totals.last_draw_at else None
     })
 
+# ==================== API Routes - Statistics ====================
+STAT_TOTAL_KEYS = ('all', 'grand', 'normal')
+STAT_COUNTERS = ('quantity', 'claimed', 'available', 'draws', 'no_shows')
+PRIZE_TOTAL_COUNTERS = ('quantity', 'claimed', 'available', 'no_shows')  # ยอดรวม/หมวดที่รวมจากแถวของรางวัล
+TIMELINE_MINUTES_DEFAULT = 60
+TIMELINE_MINUTES_MAX = 24 * 60
+
+def add_to_draw_stat(key, deltas, last_draw_at=None, **values):
+    """
+    เพิ่ม/ลดตัวนับของแถวเดียว (สร้างแถวถ้ายังไม่มี)
+    ใช้ UPDATE แบบ col = col + n ให้ request ที่ทำพร้อมกันไม่ทับค่ากัน
+    """
+    deltas = {column: value for column, value in deltas.items() if value}
+    if not deltas and not last_draw_at:
+        return
+    updates = {column: getattr(DrawStat, column) + value for column, value in deltas.items()}
+    if last_draw_at:
+        values['last_draw_at'] = updates['last_draw_at'] = last_draw_at
+    statement = sqlite_insert(DrawStat).values(key=key, **deltas, **values)
+    db.session.execute(statement.on_conflict_do_update(index_elements=['key'], set_=updates))
+
+def bump_draw_stats(prize, drawn_at=None, **deltas):
+    """
+    เพิ่ม/ลดตัวนับของรางวัล หมวด (grand/normal) และยอดรวม ในทรานแซกชันเดียวกับการสุ่ม
+    drawn_at: เวลาที่สุ่มได้ (won_at) - อัปเดต last_draw_at
+    """
+    for key in ('all', 'grand' if prize.is_grand else 'normal'):
+        add_to_draw_stat(key, deltas, drawn_at)
+    add_to_draw_stat(f'prize:{prize.id}', deltas, drawn_at, prize_id=prize.id, name=prize.name, is_grand=prize.is_grand)
+
+def prize_stat_snapshot(prize):
+    """ค่าของรางวัลที่รวมอยู่ในยอดรวม/หมวด - เก็บไว้ก่อนแก้ไข/ลบรางวัล เพื่อส่งให้ sync_prize_stats"""
+    row = db.session.get(DrawStat, f'prize:{prize.id}')
+    return {
+        'is_grand': bool(prize.is_grand),
+        'quantity': prize.quantity or 0,
+        'claimed': prize.claimed_count or 0,
+        'available': int(prize.remaining > 0),
+        'no_shows': row.no_shows if row else 0
+    }
+
+def sync_prize_stats(prize, before=None, deleted=False):
+    """
+    อัปเดตตารางสรุปหลังเพิ่ม/แก้ไข/ลบรางวัล 1 รายการ (ไม่ต้อง rebuild ทั้งหมด)
+    before: prize_stat_snapshot ก่อนแก้ไข (None = รางวัลใหม่)
+    ยอดรวม/หมวดเปลี่ยนตามผลต่าง - ถ้าเปลี่ยน is_grand จะย้ายค่าจากหมวดเดิมไปหมวดใหม่
+    """
+    after = None if deleted else prize_stat_snapshot(prize)
+    totals = {}
+    for snapshot, sign in ((before, -1), (after, 1)):
+        if snapshot:
+            for key in ('all', 'grand' if snapshot['is_grand'] else 'normal'):
+                deltas = totals.setdefault(key, dict.fromkeys(PRIZE_TOTAL_COUNTERS, 0))
+                for column in PRIZE_TOTAL_COUNTERS:
+                    deltas[column] += sign * snapshot[column]
+    for key, deltas in totals.items():
+        add_to_draw_stat(key, deltas)
+    
+    key = f'prize:{prize.id}'
+    if deleted:
+        DrawStat.query.filter_by(key=key).delete()
+        return
+    values = {
+        'name': prize.name,
+        'is_grand': after['is_grand'],
+        'quantity': after['quantity'],
+        'claimed': after['claimed'],
+        'available': after['available']
+    }
+    statement = sqlite_insert(DrawStat).values(key=key, prize_id=prize.id, draws=0, no_shows=0, **values)
+    db.session.execute(statement.on_conflict_do_update(index_elements=['key'], set_=values))
+
+def bump_draw_timeline(prize, drawn_at):
+    """เพิ่มผู้โชคดี 1 คนในช่องเวลาของนาทีนั้น"""
+    grand = int(bool(prize.is_grand))
+    statement = sqlite_insert(DrawTimeline).values(
+        bucket=drawn_at.replace(second=0, microsecond=0), draws=1, grand_draws=grand
+    )
+    db.session.execute(statement.on_conflict_do_update(index_elements=['bucket'], set_={
+        'draws': DrawTimeline.draws + 1,
+        'grand_draws': DrawTimeline.grand_draws + grand
+    }))
+
+def rebuild_draw_stats():
+    """
+    คำนวณตารางสรุปใหม่ทั้งหมดจากตารางหลัก
+    ใช้หลังการเปลี่ยนแปลงแบบ bulk (reset, ลบข้อมูล, archive/restore) และตอน start
+    """
+    # ต่อรางวัล: (จำนวนผู้โชคดี, ไม่เข้าร่วมงาน, เวลาที่สุ่มได้ล่าสุด)
+    no_show = case((Participant.attendance_status == 'ไม่เข้าร่วมงาน', 1), else_=0)
+    winners = {prize_id: (draws, no_shows or 0, last_won_at) for prize_id, draws, no_shows, last_won_at in
+               db.session.query(Participant.prize_id, func.count(), func.sum(no_show), func.max(Participant.won_at))
+               .filter(Participant.prize_id.isnot(None)).group_by(Participant.prize_id)}
+    history = {bool(is_grand): (count, last_draw_at) for is_grand, count, last_draw_at in
+               db.session.query(DrawHistory.is_grand, func.count(), func.max(DrawHistory.created_at))
+               .group_by(DrawHistory.is_grand)}
+    
+    totals = {key: DrawStat(key=key, **{column: 0 for column in STAT_COUNTERS}) for key in STAT_TOTAL_KEYS}
+    rows = list(totals.values())
+    for prize in Prize.query.order_by(Prize.id):
+        draws, no_shows, last_draw_at = winners.get(prize.id, (0, 0, None))
+        row = DrawStat(
+            key=f'prize:{prize.id}', prize_id=prize.id, name=prize.name, is_grand=prize.is_grand,
+            quantity=prize.quantity or 0, claimed=prize.claimed_count or 0, available=int(prize.remaining > 0),
+            draws=draws, no_shows=no_shows, last_draw_at=last_draw_at
+        )
+        rows.append(row)
+        for total in (totals['all'], totals['grand' if prize.is_grand else 'normal']):
+            for column in ('quantity', 'claimed', 'available', 'no_shows'):
+                setattr(total, column, getattr(total, column) + getattr(row, column))
+    
+    # จำนวนครั้งที่สุ่มของหมวด/ยอดรวมนับจาก DrawHistory (รวมรางวัลที่ถูกลบไปแล้ว)
+    for is_grand, key in ((True, 'grand'), (False, 'normal')):
+        count, last_draw_at = history.get(is_grand, (0, None))
+        totals[key].draws = count
+        totals[key].last_draw_at = last_draw_at
+        totals['all'].draws += count
+    totals['all'].last_draw_at = max((h[1] for h in history.values() if h[1]), default=None)
+    
+    DrawStat.query.delete()
+    db.session.add_all(rows)
+    
+    DrawTimeline.query.delete()
+    minute = func.strftime('%Y-%m-%d %H:%M:00', DrawHistory.created_at)
+    buckets = db.session.query(minute, func.count(), func.sum(case((DrawHistory.is_grand, 1), else_=0))) \
+        .group_by(minute)
+    db.session.add_all([
+        DrawTimeline(bucket=datetime.strptime(bucket, '%Y-%m-%d %H:%M:%S'), draws=draws, grand_draws=grand_draws)
+        for bucket, draws, grand_draws in buckets if bucket
+    ])
+    db.session.commit()
+
+# คำนวณตารางสรุปใหม่จากข้อมูลจริงตอน start (ฐานข้อมูลเดิม หรือกรณีตัวนับคลาดเคลื่อน)
+with app.app_context():
+    try:
+        rebuild_draw_stats()
+    except Exception as e:
+        print(f"Note: Could not rebuild draw statistics: {e}")
+        db.session.rollback()
+
+def draw_stat_to_dict(row):
+    return {
+        'quantity': row.quantity,
+        'claimed': row.claimed,
+        'remaining': row.quantity - row.claimed,
+        'available_prizes': row.available,
+        'draws': row.draws,
+        'no_shows': row.no_shows,
+        'last_draw_at': row.last_draw_at.isoformat() if row.last_draw_at else None
+    }
+
+@app.route('/api/stats', methods=['GET'])
+@login_required
+def get_stats():
+    """
+    สถิติสดสำหรับ dashboard: ยอดรวม/หมวด, รายรางวัล และผู้โชคดีต่อนาที
+    อ่านจากตารางสรุปเท่านั้น - ไม่ขึ้นกับจำนวนประวัติการสุ่ม
+    Query: minutes (ช่วงเวลาของ timeline, default 60), prizes=0 (ไม่ต้องการรายรางวัล)
+    """
+    try:
+        minutes = min(max(int(request.args.get('minutes', TIMELINE_MINUTES_DEFAULT)), 1), TIMELINE_MINUTES_MAX)
+    except ValueError:
+        return jsonify({'error': 'minutes ต้องเป็นตัวเลข'}), 400
+    
+    rows = {row.key: row for row in DrawStat.query.filter(DrawStat.key.in_(STAT_TOTAL_KEYS))}
+    empty = DrawStat(**{column: 0 for column in STAT_COUNTERS})
+    response = {'totals': {key: draw_stat_to_dict(rows.get(key, empty)) for key in STAT_TOTAL_KEYS}}
+    
+    if request.args.get('prizes', '1') != '0':
+        response['prizes'] = [
+            dict(draw_stat_to_dict(row), id=row.prize_id, name=row.name, is_grand=row.is_grand)
+            for row in DrawStat.query.filter(DrawStat.prize_id.isnot(None)).order_by(DrawStat.prize_id)
+        ]
+    
+    since = datetime.utcnow().replace(second=0, microsecond=0) - timedelta(minutes=minutes - 1)
+    timeline = DrawTimeline.query.filter(DrawTimeline.bucket >= since).order_by(DrawTimeline.bucket).all()
+    response['timeline'] = [{
+        'bucket': row.bucket.isoformat(),
+        'draws': row.draws,
+        'grand_draws': row.grand_draws
+    } for row in timeline]
+    response['draws_per_minute'] = round(sum(row.draws for row in timeline) / minutes, 2)
+    
+    return jsonify(response)
+
 # ==================== API Routes - Text-to-Speech ====================
 @app.route('/api/tts', methods=['GET'])
 @login_required
@@ -871,12 +2151,37 @@ def text_to_speech():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# ==================== Offline Support (Service Worker) ====================
+@app.route('/sw.js')
+def service_worker():
+    """Service worker ต้องเสิร์ฟจาก root เพื่อให้ครอบคลุมทุกหน้า"""
+    response = send_precompressed(app.static_folder, 'sw.js')
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/api/offline-manifest', methods=['GET'])
+@login_required
+def offline_manifest():
+    """รายการหน้าและไฟล์ที่ service worker ต้อง precache (ตามสิทธิ์ของผู้ใช้)"""
+    pages = ['/results']
+    if session.get('user_type') == 'admin':
+        pages[:0] = ['/spin', '/spin?mode=checked-in']  # cache แยกตาม query string
+    
+    music_path = os.path.join(app.root_path, 'assets', 'Music')
+    assets = [f'/assets/Music/{filename}' for filename in sorted(os.listdir(music_path))
+              if not filename.startswith('.')] if os.path.isdir(music_path) else []
+    
+    prize_images = db.session.query(Prize.image_path).filter(Prize.image_path.isnot(None)).distinct()
+    assets += [f'/static/{image_path}' for (image_path,) in prize_images if image_path]
+    
+    return jsonify({'pages': pages, 'assets': assets, 'bundles': bundle_urls()})
+
 # Serve assets files (music, etc.)
 @app.route('/assets/<path:filename>')
 def serve_assets(filename):
     import os
     assets_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
-    return send_from_directory(assets_path, filename)
+    return send_precompressed(assets_path, filename)
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
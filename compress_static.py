@@ -0,0 +1,72 @@
+"""
+Script สำหรับสร้างไฟล์ .gz / .br ของไฟล์ static ไว้ล่วงหน้า
+รันหลัง deploy หรือหลังแก้ไฟล์ใน static/ และ assets/:
+
+    python compress_static.py
+
+app.py จะส่งไฟล์ที่บีบอัดไว้แล้วให้ client ที่รองรับ (Accept-Encoding)
+โดยไม่ต้องบีบอัดใหม่ทุก request - ถ้าไม่ได้ติดตั้ง brotli จะสร้างเฉพาะ .gz
+"""
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIRS = [os.path.join(BASE_DIR, 'static'), os.path.join(BASE_DIR, 'assets')]
+SKIP_DIRS = {os.path.join(BASE_DIR, 'static', 'uploads')}  # รูปที่อัปโหลดบีบอัดมาแล้ว
+COMPRESSIBLE_EXTENSIONS = {'.js', '.css', '.html', '.json', '.svg', '.txt', '.map', '.xml'}
+MIN_SIZE = 1024  # ไฟล์เล็กกว่านี้บีบแล้วไม่คุ้ม
+
+def is_fresh(source, target):
+    """ไฟล์บีบอัดมีอยู่แล้วและใหม่กว่าไฟล์ต้นฉบับ"""
+    return os.path.isfile(target) and os.path.getmtime(target) >= os.path.getmtime(source)
+
+def write_compressed(source, target, data):
+    with open(target, 'wb') as f:
+        f.write(data)
+    # ให้ mtime เท่าไฟล์ต้นฉบับ เพื่อให้ app.py รู้ว่าไฟล์ยังตรงกัน
+    stat = os.stat(source)
+    os.utime(target, (stat.st_atime, stat.st_mtime))
+
+def compress_file(path):
+    """สร้าง .gz และ .br ของไฟล์เดียว คืนจำนวนไฟล์ที่สร้างใหม่"""
+    created = 0
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if not is_fresh(path, path + '.gz'):
+        write_compressed(path, path + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+        created += 1
+    if brotli is not None and not is_fresh(path, path + '.br'):
+        write_compressed(path, path + '.br', brotli.compress(data, quality=11))
+        created += 1
+    return created
+
+def compress_static():
+    created = 0
+    for static_dir in STATIC_DIRS:
+        for root, dirs, files in os.walk(static_dir):
+            dirs[:] = [d for d in dirs if os.path.join(root, d) not in SKIP_DIRS]
+            for filename in files:
+                path = os.path.join(root, filename)
+                ext = os.path.splitext(filename)[1].lower()
+                if ext not in COMPRESSIBLE_EXTENSIONS or os.path.getsize(path) < MIN_SIZE:
+                    continue
+                count = compress_file(path)
+                if count:
+                    print(f"✅ {os.path.relpath(path, BASE_DIR)}")
+                created += count
+    return created
+
+if __name__ == '__main__':
+    print("=" * 50)
+    print("สร้างไฟล์ static แบบบีบอัดล่วงหน้า")
+    print("=" * 50)
+    if brotli is None:
+        print("ℹ️  ไม่พบ brotli - สร้างเฉพาะ .gz (pip install brotli เพื่อเปิดใช้ .br)")
+    created = compress_static()
+    print(f"\n✅ เสร็จสิ้น! สร้างไฟล์ใหม่ {created} ไฟล์")
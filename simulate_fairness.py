@@ -0,0 +1,170 @@
+"""
+Script จำลองการสุ่มรางวัลแบบ Monte Carlo เพื่อตรวจสอบว่าการตั้งค่าการสุ่มยุติธรรม
+ใช้ข้อมูลจริงจากตาราง Participant / Prize และวิธีเลือกแบบเดียวกับ /api/spin:
+สุ่มทีละรางวัลตามลำดับ โดยเลือกจากคนที่ยังไม่ได้รางวัล ทุกคนมีโอกาสเท่ากันและไม่ได้ซ้ำ
+
+    python simulate_fairness.py --trials 1000000 --order grand-last [--checked-in-only]
+
+ต้องติดตั้ง numpy (pip install numpy) - ตัวเว็บไม่ต้องใช้
+"""
+import argparse
+import math
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from app import app, Participant, Prize, eligible_participants
+
+MEMORY_LIMIT = 32 * 1024 * 1024  # bytes ของตาราง "ได้รางวัลแล้ว" ต่อ batch
+P_VALUE_THRESHOLD = 0.001  # p-value ต่ำกว่านี้ถือว่าการกระจายผิดปกติ
+PRIZE_ORDERS = {
+    'id': lambda prize: prize.id,
+    'grand-first': lambda prize: (not prize.is_grand, prize.id),
+    'grand-last': lambda prize: (prize.is_grand, prize.id),
+}
+
+def load_draw_config(order, checked_in_only):
+    """ผู้มีสิทธิ์ถูกสุ่ม และรางวัลที่เหลือตามลำดับการสุ่ม (สุ่มรางวัลละ remaining คน)"""
+    with app.app_context():
+        participants = [(p.id, p.name) for p in eligible_participants(checked_in_only).order_by(Participant.id)]
+        prizes = [(prize.name, prize.remaining) for prize in sorted(Prize.query.all(), key=PRIZE_ORDERS[order])
+                  if prize.remaining > 0]
+    return participants, prizes
+
+def sample_by_rejection(rng, chosen, size, slots):
+    """
+    สุ่มทีละรางวัล (ทุก trial ใน batch พร้อมกัน) - คนที่ได้รางวัลไปแล้วใน trial เดียวกันจะสุ่มใหม่
+    ได้ผลเท่ากับ random.sample ของคนที่เหลือ เหมาะเมื่อจำนวนรางวัลไม่เกินครึ่งของจำนวนคน
+    """
+    pool_size = chosen.shape[1]
+    rows = np.arange(size)
+    picks = np.empty((size, slots), dtype=np.int64)
+    for slot in range(slots):
+        pick = rng.integers(0, pool_size, size)
+        clash = np.flatnonzero(chosen[rows, pick])
+        while clash.size:
+            pick[clash] = rng.integers(0, pool_size, clash.size)
+            clash = clash[chosen[clash, pick[clash]]]
+        chosen[rows, pick] = True
+        picks[:, slot] = pick
+    chosen[rows[:, None], picks] = False
+    return picks
+
+def sample_by_shuffle(rng, pool_size, size, slots):
+    """สุ่มลำดับทุกคนแล้วตัด slots คนแรก - ใช้เมื่อรางวัลมีจำนวนใกล้เคียงจำนวนคน"""
+    return np.argsort(rng.random((size, pool_size), dtype=np.float32), axis=1)[:, :slots]
+
+def simulate(pool_size, slot_prizes, prize_count, trials, seed=None):
+    """
+    จำลองทั้งงาน trials ครั้ง
+    slot_prizes: index ของรางวัลตามลำดับการสุ่ม (1 ช่องต่อผู้โชคดี 1 คน)
+    คืนค่า counts[participant, prize] = จำนวนครั้งที่คนนั้นได้รางวัลนั้น
+    """
+    rng = np.random.default_rng(seed)
+    slots = len(slot_prizes)
+    counts = np.zeros(pool_size * prize_count, dtype=np.int64)
+    batch = max(1, min(trials, MEMORY_LIMIT // pool_size))
+    use_rejection = slots * 2 <= pool_size
+    chosen = np.zeros((batch, pool_size), dtype=bool) if use_rejection else None
+
+    done = 0
+    while done < trials:
+        size = min(batch, trials - done)
+        if use_rejection:
+            picks = sample_by_rejection(rng, chosen, size, slots)
+        else:
+            picks = sample_by_shuffle(rng, pool_size, size, slots)
+        counts += np.bincount((picks * prize_count + slot_prizes).ravel(), minlength=counts.size)
+        done += size
+    return counts.reshape(pool_size, prize_count)
+
+def chi_square(observed, expected, share):
+    """
+    chi-square goodness of fit กับค่าคาดหวังที่เท่ากันทุกคน
+    share = โอกาสได้ต่อรอบของแต่ละคน - แต่ละคนได้ไม่เกิน 1 ครั้งต่อรอบ (Bernoulli)
+    จึงหารด้วย variance expected * (1 - share) แทน expected
+    p-value ประมาณด้วย Wilson-Hilferty (ไม่ต้องใช้ scipy)
+    """
+    dof = observed.size - 1
+    if dof <= 0 or share >= 1:
+        return 0.0, 1.0
+    statistic = float(((observed - expected) ** 2).sum() / (expected * (1 - share)))
+    z = ((statistic / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / math.sqrt(2 / (9 * dof))
+    return statistic, 0.5 * math.erfc(z / math.sqrt(2))
+
+def verdict(p_value, expected):
+    if expected < 5:
+        return 'ℹ️  ค่าคาดหวังต่อคน < 5 - เพิ่ม --trials เพื่อให้ chi-square น่าเชื่อถือ'
+    return '✅ ยุติธรรม' if p_value >= P_VALUE_THRESHOLD else '⚠️  การกระจายผิดปกติ'
+
+def report(participants, prizes, counts, trials, top):
+    pool_size = len(participants)
+    slots = sum(quantity for _, quantity in prizes)
+
+    print("\n🎯 โอกาสได้รางวัล (รางวัลใดก็ได้) ต่อคน")
+    wins = counts.sum(axis=1)
+    expected = trials * slots / pool_size
+    probabilities = wins / trials
+    statistic, p_value = chi_square(wins, expected, slots / pool_size)
+    print(f"   คาดหวัง {slots / pool_size:.6f} | จริง เฉลี่ย {probabilities.mean():.6f} "
+          f"ต่ำสุด {probabilities.min():.6f} สูงสุด {probabilities.max():.6f} (sd {probabilities.std():.6f})")
+    print(f"   chi-square = {statistic:,.1f} (dof {pool_size - 1:,}) p-value = {p_value:.4f} → {verdict(p_value, expected)}")
+
+    order = np.argsort(probabilities)
+    print(f"   โชคดีที่สุด {top} คน: " + ', '.join(
+        f"{participants[i][1]} ({probabilities[i]:.5f})" for i in order[::-1][:top]))
+    print(f"   โชคน้อยที่สุด {top} คน: " + ', '.join(
+        f"{participants[i][1]} ({probabilities[i]:.5f})" for i in order[:top]))
+
+    print("\n🎁 การกระจายของแต่ละรางวัล")
+    for index, (name, quantity) in enumerate(prizes):
+        expected = trials * quantity / pool_size
+        observed = counts[:, index]
+        statistic, p_value = chi_square(observed, expected, quantity / pool_size)
+        print(f"   {name} ×{quantity}: คาดหวัง {quantity / pool_size:.6f}/คน | "
+              f"จริง {observed.min() / trials:.6f} - {observed.max() / trials:.6f} | "
+              f"chi-square p-value = {p_value:.4f} → {verdict(p_value, expected)}")
+
+def main():
+    parser = argparse.ArgumentParser(description='จำลองการสุ่มรางวัลเพื่อตรวจสอบความยุติธรรม')
+    parser.add_argument('--trials', type=int, default=1_000_000, help='จำนวนงานที่จำลอง (default 1,000,000)')
+    parser.add_argument('--order', choices=sorted(PRIZE_ORDERS), default='id', help='ลำดับการสุ่มรางวัล')
+    parser.add_argument('--checked-in-only', action='store_true', help='สุ่มเฉพาะคนที่เช็คอินแล้ว (เหมือน /spin?mode=checked-in)')
+    parser.add_argument('--seed', type=int, default=None, help='seed สำหรับผลที่ทำซ้ำได้')
+    parser.add_argument('--top', type=int, default=5, help='จำนวนคนที่แสดงในรายชื่อโชคดี/โชคน้อยที่สุด')
+    args = parser.parse_args()
+
+    if np is None:
+        print("❌ ต้องติดตั้ง numpy ก่อน: pip install numpy")
+        return 1
+
+    participants, prizes = load_draw_config(args.order, args.checked_in_only)
+    slots = sum(quantity for _, quantity in prizes)
+    print("=" * 50)
+    print("จำลองการสุ่มรางวัล (Monte Carlo)")
+    print("=" * 50)
+    print(f"ผู้มีสิทธิ์ {len(participants):,} คน | รางวัลที่เหลือ {len(prizes)} รายการ ({slots:,} ชิ้น) "
+          f"| ลำดับ {args.order} | {args.trials:,} รอบ")
+
+    if not participants or not prizes:
+        print("❌ ไม่มีผู้มีสิทธิ์หรือรางวัลที่เหลือให้จำลอง")
+        return 1
+    if slots > len(participants):
+        print(f"❌ ผู้เข้าร่วมไม่เพียงพอ (รางวัล {slots:,} ชิ้น แต่มีผู้มีสิทธิ์ {len(participants):,} คน) "
+              "- /api/spin จะปฏิเสธรางวัลที่เหลือ")
+        return 1
+
+    slot_prizes = np.repeat(np.arange(len(prizes)), [quantity for _, quantity in prizes])
+    started = time.perf_counter()
+    counts = simulate(len(participants), slot_prizes, len(prizes), args.trials, args.seed)
+    print(f"⏱️  จำลองเสร็จใน {time.perf_counter() - started:.2f} วินาที")
+
+    report(participants, prizes, counts, args.trials, args.top)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
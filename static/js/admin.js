@@ -0,0 +1,744 @@
+let selectedPrizeType = true; // true = grand, false = normal
+let pendingAction = null;
+
+// Switch admin tabs
+function switchAdminTab(tab) {
+    document.querySelectorAll('.admin-tab').forEach(t => t.classList.remove('active'));
+    document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+
+    document.querySelector(`[onclick="switchAdminTab('${tab}')"]`).classList.add('active');
+    document.getElementById(`${tab}-tab`).classList.add('active');
+}
+
+// Select prize type
+function selectPrizeType(isGrand) {
+    selectedPrizeType = isGrand;
+    document.querySelectorAll('.prize-type-btn').forEach(btn => btn.classList.remove('active'));
+    document.querySelector(`[data-grand="${isGrand}"]`).classList.add('active');
+}
+
+// Preview participant image
+function previewParticipantImage(input) {
+    const preview = document.getElementById('participantImagePreview');
+    const previewImg = document.getElementById('previewParticipantImg');
+
+    if (input.files && input.files[0]) {
+        const reader = new FileReader();
+        reader.onload = function(e) {
+            previewImg.src = e.target.result;
+            preview.style.display = 'block';
+        };
+        reader.readAsDataURL(input.files[0]);
+    } else {
+        preview.style.display = 'none';
+    }
+}
+
+// Add participant
+function addParticipant(e) {
+    e.preventDefault();
+    const name = document.getElementById('participantName').value;
+    const phone = document.getElementById('participantPhone').value;
+    const imageFile = document.getElementById('participantImage').files[0];
+
+    // ใช้ FormData ถ้ามีรูปภาพ
+    const formData = new FormData();
+    formData.append('name', name);
+    formData.append('phone', phone);
+
+    if (imageFile) {
+        formData.append('image', imageFile);
+    }
+
+    fetch('/api/participants', {
+        method: 'POST',
+        body: formData
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) window.location.reload();
+    });
+}
+
+// Add bulk participants
+function addBulkParticipants(e) {
+    e.preventDefault();
+    const names = document.getElementById('bulkParticipants').value.split('\n').filter(n => n.trim());
+    if (names.length === 0) return alert('กรุณาใส่รายชื่อ');
+
+    fetch('/api/participants/bulk', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ names })
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) window.location.reload();
+    });
+}
+
+// Upload ZIP of participant photos (ประมวลผลใน background แล้ว poll ความคืบหน้า)
+function importParticipantPhotos(e) {
+    e.preventDefault();
+    const zipFile = document.getElementById('bulkPhotoZip').files[0];
+    if (!zipFile) return alert('กรุณาเลือกไฟล์ ZIP');
+
+    const button = document.getElementById('bulkPhotoBtn');
+    const status = document.getElementById('photoImportStatus');
+    button.disabled = true;
+    document.getElementById('photoImportProgress').style.display = 'block';
+    document.getElementById('photoImportFill').style.width = '0%';
+    status.textContent = 'กำลังอัปโหลด...';
+
+    const formData = new FormData();
+    formData.append('file', zipFile);
+
+    fetch('/api/participants/photos/bulk', {
+        method: 'POST',
+        body: formData
+    })
+    .then(r => r.json().catch(() => ({ error: `อัปโหลดไม่สำเร็จ (HTTP ${r.status})` })))
+    .then(data => {
+        if (!data.success) {
+            button.disabled = false;
+            status.textContent = data.error || 'เกิดข้อผิดพลาด';
+            return;
+        }
+        pollPhotoImport(data.job_id);
+    })
+    .catch(err => {
+        console.error(err);
+        button.disabled = false;
+        status.textContent = 'เกิดข้อผิดพลาดในการอัปโหลด';
+    });
+}
+
+function pollPhotoImport(jobId) {
+    fetch(`/api/participants/photos/bulk/${jobId}`)
+        .then(r => r.json())
+        .then(job => {
+            const status = document.getElementById('photoImportStatus');
+            if (job.error && !job.status) {
+                status.textContent = job.error;
+                document.getElementById('bulkPhotoBtn').disabled = false;
+                return;
+            }
+            const percent = job.total ? Math.round(job.processed / job.total * 100) : 0;
+            document.getElementById('photoImportFill').style.width = `${percent}%`;
+
+            if (job.status === 'done') {
+                status.textContent = `เสร็จแล้ว: จับคู่ได้ ${job.matched} รูป, ไม่พบผู้เข้าร่วม ${job.unmatched} รูป` +
+                    (job.too_large ? `, ไฟล์ใหญ่เกินไป ${job.too_large} รูป` : '') +
+                    (job.failed ? `, ผิดพลาด ${job.failed} รูป` : '');
+                if (job.unmatched_files.length) {
+                    console.log('ไฟล์ที่จับคู่ไม่ได้:', job.unmatched_files);
+                }
+                if (job.too_large_files.length) {
+                    console.log('ไฟล์ที่ใหญ่เกินไป:', job.too_large_files);
+                }
+                document.getElementById('bulkPhotoBtn').disabled = false;
+                document.getElementById('bulkPhotoZip').value = '';
+                participantsGrid.reload();
+            } else if (job.status === 'failed') {
+                status.textContent = `นำเข้ารูปไม่สำเร็จ: ${job.error}`;
+                document.getElementById('bulkPhotoBtn').disabled = false;
+            } else {
+                status.textContent = job.total == null
+                    ? 'กำลังอ่านไฟล์ ZIP...'
+                    : `กำลังประมวลผล ${job.processed}/${job.total} รูป`;
+                setTimeout(() => pollPhotoImport(jobId), 1000);
+            }
+        })
+        .catch(() => setTimeout(() => pollPhotoImport(jobId), 2000));
+}
+
+// Set color for single prize
+function setColor(color) {
+    document.getElementById('prizeColor').value = color;
+}
+
+// Set color for bulk prizes
+function setBulkColor(color) {
+    document.getElementById('bulkPrizeColor').value = color;
+}
+
+// Preview image
+function previewImage(input) {
+    const preview = document.getElementById('imagePreview');
+    const previewImg = document.getElementById('previewImg');
+
+    if (input.files && input.files[0]) {
+        const reader = new FileReader();
+        reader.onload = function(e) {
+            previewImg.src = e.target.result;
+            preview.style.display = 'block';
+        };
+        reader.readAsDataURL(input.files[0]);
+    } else {
+        preview.style.display = 'none';
+    }
+}
+
+// Add prize
+function addPrize(e) {
+    e.preventDefault();
+    const name = document.getElementById('prizeName').value;
+    const quantity = parseInt(document.getElementById('prizeQuantity').value) || 1;
+    const qr_code = document.getElementById('prizeQrCode').value;
+    const description = document.getElementById('prizeDesc').value;
+    const color = document.getElementById('prizeColor').value;
+    const imageFile = document.getElementById('prizeImage').files[0];
+
+    // ใช้ FormData ถ้ามีรูปภาพ
+    const formData = new FormData();
+    formData.append('name', name);
+    formData.append('quantity', quantity);
+    formData.append('qr_code', qr_code);
+    formData.append('description', description);
+    formData.append('color', color);
+    formData.append('is_grand', selectedPrizeType);
+
+    if (imageFile) {
+        formData.append('image', imageFile);
+    }
+
+    fetch('/api/prizes', {
+        method: 'POST',
+        body: formData
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) window.location.reload();
+    });
+}
+
+// Delete item
+function deleteItem(type, id, name) {
+    if (!confirm(`ต้องการลบ "${name}" หรือไม่?`)) return;
+
+    const endpoint = type === 'participant' ? `/api/participants/${id}` : `/api/prizes/${id}`;
+    fetch(endpoint, { method: 'DELETE' })
+        .then(r => r.json())
+        .then(data => {
+            if (data.success) {
+                (type === 'participant' ? participantsGrid : prizesGrid).remove(id);
+            }
+        });
+}
+
+// Filter items (ค้นหา/เรียงที่ฝั่ง server แล้วโหลดหน้าแรกใหม่)
+let filterTimers = {};
+function filterItems(type) {
+    clearTimeout(filterTimers[type]);
+    filterTimers[type] = setTimeout(() => {
+        if (type === 'participant') {
+            const [sort, order] = document.getElementById('participantSort').value.split(':');
+            participantsGrid.reload({
+                q: document.getElementById('searchParticipant').value.trim(),
+                status: document.getElementById('participantStatus').value,
+                sort: sort,
+                order: order
+            });
+        } else {
+            const [sort, order] = document.getElementById('prizeSort').value.split(':');
+            prizesGrid.reload({
+                q: document.getElementById('searchPrize').value.trim(),
+                sort: sort,
+                order: order
+            });
+        }
+    }, 250);
+}
+
+// ==================== Paged, Virtualized Lists ====================
+function escapeHtml(value) {
+    return String(value == null ? '' : value)
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&#39;');
+}
+
+// โหลดรายการทีละหน้าด้วย keyset cursor และ render เฉพาะการ์ดที่อยู่ในกรอบ scroll
+class PagedGrid {
+    constructor(el, options) {
+        this.el = el;
+        this.url = options.url;
+        this.params = options.params || {};
+        this.renderItem = options.renderItem;
+        this.emptyHtml = options.emptyHtml;
+        this.pageSize = options.pageSize || 100;
+        this.cardHeight = 82;
+        this.minCardWidth = 250;
+        this.gap = 16;
+        this.items = [];
+        this.cursor = null;
+        this.done = false;
+        this.loading = false;
+        this.requestId = 0;
+        this.rangeKey = null;
+        this.frame = null;
+
+        el.classList.add('virtual');
+        el.innerHTML = '<div class="virtual-spacer"></div><div class="virtual-window"></div>';
+        this.spacer = el.querySelector('.virtual-spacer');
+        this.window = el.querySelector('.virtual-window');
+
+        el.addEventListener('scroll', () => this.schedule(), { passive: true });
+        if (window.ResizeObserver) {
+            new ResizeObserver(() => { this.rangeKey = null; this.schedule(); }).observe(el);
+        } else {
+            window.addEventListener('resize', () => { this.rangeKey = null; this.schedule(); });
+        }
+    }
+
+    reload(params) {
+        Object.assign(this.params, params || {});
+        this.items = [];
+        this.cursor = null;
+        this.done = false;
+        this.loading = false;
+        this.requestId++;
+        this.rangeKey = null;
+        this.el.scrollTop = 0;
+        this.render();
+        this.loadMore();
+    }
+
+    loadMore() {
+        if (this.loading || this.done) return;
+        this.loading = true;
+        const requestId = this.requestId;
+        const query = new URLSearchParams(this.params);
+        query.set('limit', this.pageSize);
+        if (this.cursor) query.set('cursor', this.cursor);
+
+        fetch(`${this.url}?${query}`)
+            .then(r => r.json())
+            .then(data => {
+                if (requestId !== this.requestId) return;  // ผลของการค้นหาเก่า
+                this.loading = false;
+                if (data.error) {
+                    this.done = true;
+                    console.error(data.error);
+                } else {
+                    this.items.push(...data.items);
+                    this.cursor = data.next_cursor;
+                    this.done = !data.next_cursor;
+                }
+                this.rangeKey = null;
+                this.render();
+            })
+            .catch(err => {
+                if (requestId !== this.requestId) return;
+                this.loading = false;
+                console.error(err);
+            });
+    }
+
+    remove(id) {
+        this.items = this.items.filter(item => item.id !== id);
+        this.rangeKey = null;
+        this.render();
+    }
+
+    schedule() {
+        if (this.frame) return;
+        this.frame = requestAnimationFrame(() => {
+            this.frame = null;
+            this.render();
+        });
+    }
+
+    render() {
+        const style = getComputedStyle(this.el);
+        const width = this.el.clientWidth - parseFloat(style.paddingLeft) - parseFloat(style.paddingRight);
+        if (width <= 0) return;  // tab ถูกซ่อนอยู่ - ResizeObserver จะเรียกใหม่เมื่อแสดง
+
+        if (this.items.length === 0) {
+            this.spacer.style.height = '0px';
+            this.window.innerHTML = this.done ? this.emptyHtml
+                : '<div class="virtual-loading"><i class="fas fa-spinner fa-spin"></i></div>';
+            this.rangeKey = null;
+            return;
+        }
+
+        const columns = Math.max(1, Math.floor((width + this.gap) / (this.minCardWidth + this.gap)));
+        const cellWidth = (width - this.gap * (columns - 1)) / columns;
+        const pitch = this.cardHeight + this.gap;
+        const rows = Math.ceil(this.items.length / columns);
+        const scrollTop = this.el.scrollTop;
+        const firstRow = Math.max(0, Math.floor(scrollTop / pitch) - 2);
+        const lastRow = Math.min(rows - 1, Math.ceil((scrollTop + this.el.clientHeight) / pitch) + 2);
+
+        // โหลดหน้าถัดไปล่วงหน้าเมื่อเลื่อนใกล้ท้ายรายการที่มี
+        if (!this.done && lastRow >= rows - 5) this.loadMore();
+
+        const key = `${firstRow}:${lastRow}:${columns}:${this.items.length}:${this.loading}`;
+        if (key === this.rangeKey) return;
+        this.rangeKey = key;
+
+        this.spacer.style.height = `${rows * pitch + (this.done ? 0 : pitch)}px`;
+        let html = '';
+        const end = Math.min(this.items.length, (lastRow + 1) * columns);
+        for (let i = firstRow * columns; i < end; i++) {
+            const x = (i % columns) * (cellWidth + this.gap);
+            const y = Math.floor(i / columns) * pitch;
+            html += `<div class="virtual-cell" style="width: ${cellWidth}px; transform: translate(${x}px, ${y}px);">${this.renderItem(this.items[i])}</div>`;
+        }
+        if (!this.done) {
+            html += `<div class="virtual-loading" style="top: ${rows * pitch}px;"><i class="fas fa-spinner fa-spin"></i></div>`;
+        }
+        this.window.innerHTML = html;
+    }
+}
+
+function renderParticipantCard(p) {
+    const name = escapeHtml(p.name);
+    const avatar = p.image_path
+        ? `<div class="item-avatar" style="background: transparent; padding: 0; width: 50px; height: 50px; border-radius: 50%; overflow: hidden;">
+               <img src="/static/${escapeHtml(p.image_path)}" alt="${name}" loading="lazy" style="width: 100%; height: 100%; object-fit: cover;">
+           </div>`
+        : `<div class="item-avatar">${escapeHtml(p.name.charAt(0))}</div>`;
+    const status = p.is_winner
+        ? `<i class="fas fa-trophy"></i> ได้รางวัล: ${escapeHtml(p.prize_name || '-')}`
+        : '<i class="fas fa-clock"></i> รอลุ้น';
+    return `
+        <div class="item-card ${p.is_winner ? 'winner' : ''}" data-id="${p.id}" data-type="participant">
+            <div class="item-info">
+                ${avatar}
+                <div class="item-details">
+                    <div class="item-name">${name}</div>
+                    <div class="item-status ${p.is_winner ? 'winner' : ''}">${status}</div>
+                </div>
+            </div>
+            <button class="btn-delete" data-name="${name}" onclick="deleteItem('participant', ${p.id}, this.dataset.name)">
+                <i class="fas fa-times"></i>
+            </button>
+        </div>
+    `;
+}
+
+function renderPrizeCard(prize) {
+    const name = escapeHtml(prize.name);
+    const color = escapeHtml(prize.color || '#00d4ff');
+    const avatar = prize.image_path
+        ? `<div class="item-avatar" style="background: transparent; padding: 0; width: 50px; height: 50px; border-radius: 8px; overflow: hidden;">
+               <img src="/static/${escapeHtml(prize.image_path)}" alt="${name}" loading="lazy" style="width: 100%; height: 100%; object-fit: cover;">
+           </div>`
+        : `<div class="item-avatar" style="background: ${color}; ${prize.color === '#ffffff' || prize.color === '#ffd700' ? 'color: #1a1a2e;' : ''}">
+               <i class="fas ${prize.is_grand ? 'fa-crown' : 'fa-gift'}"></i>
+           </div>`;
+    return `
+        <div class="item-card ${prize.is_grand ? 'grand' : ''} ${prize.remaining === 0 ? 'claimed' : ''}"
+             data-id="${prize.id}" data-type="prize" style="border-left: 5px solid ${color};">
+            <div class="item-info">
+                ${avatar}
+                <div class="item-details">
+                    <div class="item-name">${name}</div>
+                    <div class="item-status ${prize.is_grand ? 'grand' : ''}">
+                        <span style="display: inline-block; width: 12px; height: 12px; border-radius: 3px; background: ${color}; margin-right: 5px;"></span>
+                        ${prize.is_grand ? 'รางวัลใหญ่' : 'รางวัลทั่วไป'}
+                        <span style="margin-left: 8px; background: #f0f0f0; padding: 2px 8px; border-radius: 10px; color: #333; font-size: 0.75rem;">
+                            เหลือ ${prize.remaining}/${prize.quantity}
+                        </span>
+                    </div>
+                </div>
+            </div>
+            <div class="item-actions">
+                <button class="btn-edit"
+                        data-prize-id="${prize.id}"
+                        data-prize-name="${name}"
+                        data-prize-desc="${escapeHtml(prize.description || '')}"
+                        data-prize-color="${color}"
+                        data-prize-qr="${escapeHtml(prize.qr_code || '')}"
+                        data-prize-grand="${prize.is_grand ? 'true' : 'false'}"
+                        data-prize-quantity="${prize.quantity}"
+                        data-prize-image="${escapeHtml(prize.image_path || '')}"
+                        onclick="editPrizeFromButton(this)"
+                        title="แก้ไขรางวัล">
+                    <i class="fas fa-edit"></i>
+                </button>
+                <button class="btn-delete" data-name="${name}" onclick="deleteItem('prize', ${prize.id}, this.dataset.name)" title="ลบรางวัล">
+                    <i class="fas fa-times"></i>
+                </button>
+            </div>
+        </div>
+    `;
+}
+
+const participantsGrid = new PagedGrid(document.getElementById('participantsGrid'), {
+    url: '/api/participants',
+    params: { status: 'all', sort: 'id', order: 'asc' },
+    renderItem: renderParticipantCard,
+    emptyHtml: `
+        <div class="empty-state">
+            <i class="fas fa-user-plus"></i>
+            <h3>ยังไม่มีรายชื่อคน</h3>
+            <p>เพิ่มรายชื่อผู้เข้าร่วมเพื่อเริ่มสุ่มรางวัล</p>
+        </div>
+    `
+});
+
+const prizesGrid = new PagedGrid(document.getElementById('prizesGrid'), {
+    url: '/api/prizes',
+    params: { sort: 'id', order: 'asc' },
+    renderItem: renderPrizeCard,
+    emptyHtml: `
+        <div class="empty-state">
+            <i class="fas fa-gift"></i>
+            <h3>ยังไม่มีรางวัล</h3>
+            <p>เพิ่มรางวัลเพื่อเริ่มสุ่ม</p>
+        </div>
+    `
+});
+
+participantsGrid.reload();
+prizesGrid.reload();
+
+// Confirm action
+function confirmAction(action, title, message) {
+    pendingAction = action;
+    document.getElementById('confirmTitle').textContent = title;
+    document.getElementById('confirmMessage').textContent = message;
+    document.getElementById('confirmModal').classList.add('active');
+}
+
+function closeConfirm() {
+    document.getElementById('confirmModal').classList.remove('active');
+    pendingAction = null;
+}
+
+function executeConfirmAction() {
+    if (!pendingAction) return;
+
+    fetch(`/api/${pendingAction}`, { method: 'POST' })
+        .then(r => r.json())
+        .then(data => {
+            if (data.success) window.location.reload();
+        });
+    closeConfirm();
+}
+
+document.getElementById('confirmModal').addEventListener('click', function(e) {
+    if (e.target === this) closeConfirm();
+});
+
+// ==================== Event Archive ====================
+function loadArchives() {
+    fetch('/api/archives')
+        .then(r => r.json())
+        .then(archives => {
+            const list = document.getElementById('archiveList');
+            if (!archives.length) {
+                list.innerHTML = '<div class="form-hint">ยังไม่มีงานที่เก็บไว้</div>';
+                return;
+            }
+            list.innerHTML = archives.map(a => `
+                <div class="archive-item">
+                    <div class="archive-info">
+                        <strong>${escapeHtml(a.name)}</strong>
+                        <small>${new Date(a.archived_at).toLocaleString('th-TH')} ·
+                            ${a.counts.participants} คน · ${a.counts.prizes} รางวัล · ${a.counts.history} ผู้ได้รับรางวัล ·
+                            ${(a.size / 1024 / 1024).toFixed(1)} MB</small>
+                    </div>
+                    <div class="archive-actions">
+                        <a class="btn btn-primary" href="/api/archives/${encodeURIComponent(a.filename)}" title="ดาวน์โหลด">
+                            <i class="fas fa-download"></i>
+                        </a>
+                        <button class="btn btn-gold" onclick="restoreArchive('${escapeHtml(a.filename)}')" title="โหลดงานนี้กลับมา">
+                            <i class="fas fa-undo"></i>
+                        </button>
+                    </div>
+                </div>
+            `).join('');
+        });
+}
+
+function archiveEvent(e) {
+    e.preventDefault();
+    if (!confirm('เก็บงานนี้ลงไฟล์ archive แล้วล้างรางวัล รายชื่อ และประวัติการสุ่มทั้งหมด?')) return;
+
+    const button = document.getElementById('archiveBtn');
+    button.disabled = true;
+    fetch('/api/archives', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ name: document.getElementById('archiveName').value })
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) {
+            alert(`เก็บงาน "${data.archive.name}" เรียบร้อยแล้ว`);
+            window.location.reload();
+        } else {
+            alert(data.error || 'เกิดข้อผิดพลาดในการเก็บงาน');
+            button.disabled = false;
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        alert('เกิดข้อผิดพลาดในการเชื่อมต่อ');
+        button.disabled = false;
+    });
+}
+
+function restoreArchive(filename) {
+    if (!confirm('โหลดงานนี้กลับมา? (ต้องไม่มีข้อมูลงานปัจจุบัน)')) return;
+
+    fetch(`/api/archives/${encodeURIComponent(filename)}/restore`, { method: 'POST' })
+        .then(r => r.json())
+        .then(data => {
+            if (data.success) {
+                window.location.reload();
+            } else {
+                alert(data.error || 'เกิดข้อผิดพลาดในการโหลดงาน');
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('เกิดข้อผิดพลาดในการเชื่อมต่อ');
+        });
+}
+
+loadArchives();
+
+// ==================== Edit Prize Functions ====================
+function editPrizeFromButton(button) {
+    const id = parseInt(button.getAttribute('data-prize-id'));
+    const name = button.getAttribute('data-prize-name');
+    const description = button.getAttribute('data-prize-desc');
+    const color = button.getAttribute('data-prize-color');
+    const qrCode = button.getAttribute('data-prize-qr');
+    const isGrand = button.getAttribute('data-prize-grand') === 'true';
+    const quantity = parseInt(button.getAttribute('data-prize-quantity'));
+    const imagePath = button.getAttribute('data-prize-image');
+
+    editPrize(id, name, description, color, qrCode, isGrand, quantity, imagePath);
+}
+
+function editPrize(id, name, description, color, qrCode, isGrand, quantity, imagePath) {
+    // เติมข้อมูลในฟอร์ม
+    document.getElementById('editPrizeId').value = id;
+    document.getElementById('editPrizeName').value = name;
+    document.getElementById('editPrizeDesc').value = description || '';
+    document.getElementById('editPrizeColor').value = color || '#00d4ff';
+    document.getElementById('editPrizeQrCode').value = qrCode || '';
+    document.getElementById('editPrizeQuantity').value = quantity;
+
+    // ตั้งค่าประเภทรางวัล
+    selectEditPrizeType(isGrand);
+
+    // แสดงรูปภาพปัจจุบันถ้ามี
+    const currentImageDiv = document.getElementById('editCurrentImage');
+    const currentImg = document.getElementById('editCurrentImg');
+    const editImagePreview = document.getElementById('editImagePreview');
+
+    if (imagePath && imagePath.trim() !== '' && imagePath !== 'None') {
+        currentImg.src = `/static/${imagePath}`;
+        currentImageDiv.style.display = 'block';
+        editImagePreview.style.display = 'none';
+    } else {
+        currentImageDiv.style.display = 'none';
+    }
+
+    // รีเซ็ต preview รูปใหม่
+    document.getElementById('editPrizeImage').value = '';
+
+    // แสดง modal
+    document.getElementById('editPrizeModal').classList.add('active');
+}
+
+function selectEditPrizeType(isGrand) {
+    const grandBtn = document.getElementById('editPrizeTypeGrand');
+    const normalBtn = document.getElementById('editPrizeTypeNormal');
+
+    if (isGrand) {
+        grandBtn.classList.add('active');
+        normalBtn.classList.remove('active');
+    } else {
+        normalBtn.classList.add('active');
+        grandBtn.classList.remove('active');
+    }
+}
+
+function setEditColor(color) {
+    document.getElementById('editPrizeColor').value = color;
+}
+
+function previewEditImage(input) {
+    const preview = document.getElementById('editImagePreview');
+    const previewImg = document.getElementById('editPreviewImg');
+    const currentImageDiv = document.getElementById('editCurrentImage');
+
+    if (input.files && input.files[0]) {
+        const reader = new FileReader();
+        reader.onload = function(e) {
+            previewImg.src = e.target.result;
+            preview.style.display = 'block';
+            currentImageDiv.style.display = 'none'; // ซ่อนรูปปัจจุบันเมื่อเลือกรูปใหม่
+        };
+        reader.readAsDataURL(input.files[0]);
+    } else {
+        preview.style.display = 'none';
+    }
+}
+
+function closeEditPrizeModal() {
+    document.getElementById('editPrizeModal').classList.remove('active');
+    // รีเซ็ตฟอร์ม
+    document.getElementById('editPrizeForm').reset();
+    document.getElementById('editImagePreview').style.display = 'none';
+    document.getElementById('editCurrentImage').style.display = 'none';
+}
+
+function updatePrize(e) {
+    e.preventDefault();
+
+    const prizeId = document.getElementById('editPrizeId').value;
+    const name = document.getElementById('editPrizeName').value;
+    const description = document.getElementById('editPrizeDesc').value;
+    const color = document.getElementById('editPrizeColor').value;
+    const qrCode = document.getElementById('editPrizeQrCode').value;
+    const quantity = parseInt(document.getElementById('editPrizeQuantity').value);
+    const imageFile = document.getElementById('editPrizeImage').files[0];
+    const isGrand = document.getElementById('editPrizeTypeGrand').classList.contains('active');
+
+    // สร้าง FormData
+    const formData = new FormData();
+    formData.append('name', name);
+    formData.append('description', description);
+    formData.append('color', color);
+    formData.append('qr_code', qrCode);
+    formData.append('quantity', quantity);
+    formData.append('is_grand', isGrand);
+
+    if (imageFile) {
+        formData.append('image', imageFile);
+    }
+
+    // ส่ง request ไปอัปเดต
+    fetch(`/api/prizes/${prizeId}`, {
+        method: 'PUT',
+        body: formData
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            closeEditPrizeModal();
+            window.location.reload();
+        } else {
+            alert('เกิดข้อผิดพลาดในการแก้ไขรางวัล');
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        alert('เกิดข้อผิดพลาดในการแก้ไขรางวัล');
+    });
+}
+
+// ปิด modal เมื่อคลิกนอก modal
+document.getElementById('editPrizeModal').addEventListener('click', function(e) {
+    if (e.target === this) closeEditPrizeModal();
+});
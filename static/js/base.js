@@ -0,0 +1,320 @@
+// ==================== Background Music (Global) ====================
+let bgMusic = null;
+let bgMusicInitialized = false;
+const BG_MUSIC_KEY = 'bgMusicPlaying';
+const BG_MUSIC_TIME_KEY = 'bgMusicCurrentTime';
+
+function initBackgroundMusic() {
+    if (bgMusicInitialized && bgMusic) {
+        // ถ้าเพลงถูกสร้างไว้แล้ว ให้เล่นต่อจากตำแหน่งเดิม
+        const savedTime = parseFloat(sessionStorage.getItem(BG_MUSIC_TIME_KEY)) || 0;
+        if (bgMusic.paused && sessionStorage.getItem(BG_MUSIC_KEY) === 'true') {
+            bgMusic.currentTime = savedTime;
+            // พยายามเล่นเพลงเมื่อโหลดหน้า (ต้องมี user interaction ก่อน)
+            document.addEventListener('click', function playMusicOnFirstClick() {
+                if (bgMusic && bgMusic.paused) {
+                    bgMusic.play().catch(err => {
+                        console.log('Background music will play after user interaction');
+                    });
+                }
+                document.removeEventListener('click', playMusicOnFirstClick);
+            }, { once: true });
+        }
+        return;
+    }
+
+    bgMusic = new Audio('/assets/Music/BG_Music.mp3');
+    bgMusic.loop = true;
+    bgMusic.volume = 0.5; // ตั้งค่าระดับเสียง 50%
+
+    bgMusic.onerror = function(e) {
+        console.error('Error loading background music:', e);
+    };
+
+    bgMusic.onloadedmetadata = function() {
+        // เมื่อโหลด metadata เสร็จ ให้ตั้งค่า currentTime จาก sessionStorage
+        const savedTime = parseFloat(sessionStorage.getItem(BG_MUSIC_TIME_KEY)) || 0;
+        if (savedTime > 0 && savedTime < bgMusic.duration) {
+            bgMusic.currentTime = savedTime;
+        }
+    };
+
+    bgMusic.onended = function() {
+        // ถ้าเพลงจบ (ไม่ควรเกิดขึ้นเพราะ loop = true) ให้เล่นต่อ
+        if (sessionStorage.getItem(BG_MUSIC_KEY) === 'true') {
+            bgMusic.play();
+        }
+    };
+
+    // บันทึกตำแหน่งเพลงทุก 1 วินาที
+    bgMusic.addEventListener('timeupdate', function() {
+        if (!bgMusic.paused) {
+            sessionStorage.setItem(BG_MUSIC_TIME_KEY, bgMusic.currentTime.toString());
+        }
+    });
+
+    bgMusicInitialized = true;
+
+    // ตรวจสอบสถานะจาก sessionStorage
+    if (sessionStorage.getItem(BG_MUSIC_KEY) === 'true') {
+        // พยายามเล่นเพลงเมื่อโหลดหน้า (ต้องมี user interaction ก่อน)
+        document.addEventListener('click', function playMusicOnFirstClick() {
+            if (bgMusic && bgMusic.paused) {
+                const savedTime = parseFloat(sessionStorage.getItem(BG_MUSIC_TIME_KEY)) || 0;
+                if (savedTime > 0 && bgMusic.readyState >= 2) {
+                    bgMusic.currentTime = savedTime;
+                }
+                bgMusic.play().catch(err => {
+                    console.log('Background music will play after user interaction');
+                });
+            }
+            document.removeEventListener('click', playMusicOnFirstClick);
+        }, { once: true });
+    }
+}
+
+function playBackgroundMusic() {
+    if (!bgMusic || !bgMusicInitialized) {
+        initBackgroundMusic();
+    }
+    if (bgMusic && bgMusic.paused) {
+        // ตั้งค่า currentTime จาก sessionStorage ก่อนเล่น
+        const savedTime = parseFloat(sessionStorage.getItem(BG_MUSIC_TIME_KEY)) || 0;
+        if (savedTime > 0 && bgMusic.readyState >= 2) {
+            bgMusic.currentTime = savedTime;
+        }
+        bgMusic.play().catch(err => {
+            console.error('Error playing background music:', err);
+        });
+        sessionStorage.setItem(BG_MUSIC_KEY, 'true');
+    }
+}
+
+function stopBackgroundMusic() {
+    if (bgMusic && !bgMusic.paused) {
+        // บันทึกตำแหน่งปัจจุบันก่อนหยุด
+        sessionStorage.setItem(BG_MUSIC_TIME_KEY, bgMusic.currentTime.toString());
+        bgMusic.pause();
+        sessionStorage.setItem(BG_MUSIC_KEY, 'false');
+    }
+}
+
+// เริ่มต้นเพลงเมื่อโหลดหน้า (ถ้ายังอยู่ในสถานะเล่น)
+document.addEventListener('DOMContentLoaded', function() {
+    initBackgroundMusic();
+});
+
+// เมื่อเปลี่ยนหน้า ให้บันทึกสถานะและตำแหน่งเพลง
+window.addEventListener('beforeunload', function() {
+    if (bgMusic && !bgMusic.paused) {
+        sessionStorage.setItem(BG_MUSIC_KEY, 'true');
+        sessionStorage.setItem(BG_MUSIC_TIME_KEY, bgMusic.currentTime.toString());
+    } else if (bgMusic && bgMusic.paused) {
+        // บันทึกตำแหน่งปัจจุบันแม้จะหยุดอยู่
+        sessionStorage.setItem(BG_MUSIC_TIME_KEY, bgMusic.currentTime.toString());
+    }
+});
+
+// บันทึกตำแหน่งเพลงเป็นระยะๆ (ทุก 2 วินาที)
+setInterval(function() {
+    if (bgMusic && !bgMusic.paused && bgMusic.readyState >= 2) {
+        sessionStorage.setItem(BG_MUSIC_TIME_KEY, bgMusic.currentTime.toString());
+    }
+}, 2000);
+
+// ==================== Offline Support ====================
+(function() {
+    const indicator = document.getElementById('offlineIndicator');
+    const indicatorText = document.getElementById('offlineText');
+    const sendBtn = document.getElementById('offlineSendBtn');
+    const discardBtn = document.getElementById('offlineDiscardBtn');
+    let pendingSpins = 0;
+
+    function updateOfflineIndicator() {
+        const offline = !navigator.onLine;
+        indicator.classList.toggle('active', offline || pendingSpins > 0);
+        indicator.classList.toggle('syncing', !offline && pendingSpins > 0);
+        if (offline) {
+            indicatorText.textContent = pendingSpins > 0
+                ? `ออฟไลน์ - รอส่งการสุ่ม ${pendingSpins} รายการ`
+                : 'ออฟไลน์ - ใช้ข้อมูลที่บันทึกไว้';
+        } else if (pendingSpins > 0) {
+            indicatorText.textContent = `มีการสุ่มที่ค้างไว้ตอนออฟไลน์ ${pendingSpins} รายการ`;
+        }
+    }
+
+    // ไม่ส่งคิวเองเมื่อกลับมาออนไลน์ - ผู้ควบคุมต้องเลือกว่าจะส่ง (สุ่มจริง) หรือยกเลิก
+    function postToWorker(message) {
+        if (navigator.serviceWorker && navigator.serviceWorker.controller) {
+            navigator.serviceWorker.controller.postMessage(message);
+        }
+    }
+
+    sendBtn.addEventListener('click', function() {
+        if (!confirm(`ส่งการสุ่มที่ค้างไว้ ${pendingSpins} รายการ?\n\nระบบจะสุ่มผู้โชคดีจริงตามคำขอเดิม - ถ้าสุ่มรางวัลเหล่านี้ใหม่ไปแล้ว ให้กด "ยกเลิก" แทน`)) return;
+        sendBtn.disabled = discardBtn.disabled = true;
+        postToWorker({ type: 'flush' });
+    });
+
+    discardBtn.addEventListener('click', function() {
+        if (!confirm(`ยกเลิกการสุ่มที่ค้างไว้ ${pendingSpins} รายการ? (จะไม่มีการสุ่มผู้โชคดีจากคำขอเหล่านี้)`)) return;
+        postToWorker({ type: 'discard' });
+    });
+
+    function showReplayedSpins(replayed) {
+        const lines = replayed.map(function(item) {
+            const results = (item.result && item.result.results) || [];
+            if (!item.ok || !results.length) {
+                return `❌ ${(item.result && item.result.error) || 'ส่งไม่สำเร็จ'}`;
+            }
+            return `🎁 ${results[0].prize_name}: ${results.map(r => r.winner_name).join(', ')}`;
+        });
+        alert(`ผลการสุ่มที่ค้างไว้ตอนออฟไลน์\n\n${lines.join('\n')}`);
+        // โหลดหน้าใหม่ให้จำนวนรางวัล/ผู้ลุ้นรางวัลตรงกับ server
+        window.location.reload();
+    }
+
+    window.addEventListener('online', updateOfflineIndicator);
+    window.addEventListener('offline', updateOfflineIndicator);
+    updateOfflineIndicator();
+
+    if (!('serviceWorker' in navigator)) return;
+
+    navigator.serviceWorker.addEventListener('message', function(event) {
+        const data = event.data || {};
+        if (data.type === 'spin-queue') {
+            pendingSpins = data.pending;
+            sendBtn.disabled = discardBtn.disabled = false;
+            updateOfflineIndicator();
+        } else if (data.type === 'spin-replayed') {
+            showReplayedSpins(data.replayed || []);
+        }
+    });
+
+    window.addEventListener('load', function() {
+        navigator.serviceWorker.register('/sw.js').then(function(registration) {
+            return navigator.serviceWorker.ready;
+        }).then(function(registration) {
+            // precache เฉพาะเมื่อ login แล้ว (ดู data-precache ใน base.html)
+            if (indicator.hasAttribute('data-precache')) {
+                registration.active.postMessage({ type: 'precache' });
+            }
+            registration.active.postMessage({ type: 'queue-status' });
+        }).catch(function(err) {
+            console.log('Service worker registration failed:', err);
+        });
+    });
+})();
+
+// ==================== Idle Video Overlay ====================
+(function() {
+    const videoOverlay = document.getElementById('videoOverlay');
+    const idleVideo = document.getElementById('idleVideo');
+    let inactivityTimer = null;
+    const INACTIVITY_TIME = 30000; // 30 seconds (ปรับเปลี่ยนตามต้องการ)
+    let isVideoActive = false;
+
+    // ฟังก์ชันตรวจสอบว่าอยู่ในหน้า results หรือไม่
+    function isResultsPage() {
+        return window.location.pathname === '/results' || 
+               window.location.pathname.startsWith('/results');
+    }
+
+    // ฟังก์ชันสำหรับแสดงวิดีโอ (fade in)
+    function showVideoOverlay() {
+        // ไม่แสดงวิดีโอถ้าอยู่ในหน้า results
+        if (isResultsPage()) {
+            return;
+        }
+
+        if (!isVideoActive) {
+            isVideoActive = true;
+            videoOverlay.classList.add('active');
+            // รอให้ fade in เสร็จก่อนแล้วค่อยเล่นวิดีโอ
+            setTimeout(function() {
+                if (idleVideo.paused) {
+                    idleVideo.currentTime = 0;
+                    idleVideo.play().catch(function(err) {
+                        console.log('Video play error:', err);
+                    });
+                }
+            }, 100);
+        }
+    }
+
+    // ฟังก์ชันสำหรับซ่อนวิดีโอ (fade out)
+    function hideVideoOverlay() {
+        if (isVideoActive) {
+            isVideoActive = false;
+            videoOverlay.classList.remove('active');
+            // หยุดวิดีโอเมื่อ fade out เสร็จ
+            setTimeout(function() {
+                if (!idleVideo.paused) {
+                    idleVideo.pause();
+                }
+            }, 1000); // รอให้ fade out เสร็จ (1 วินาที)
+        }
+    }
+
+    // ฟังก์ชันสำหรับรีเซ็ต timer
+    function resetInactivityTimer() {
+        // ไม่ตั้ง timer ถ้าอยู่ในหน้า results
+        if (isResultsPage()) {
+            // ล้าง timer ถ้ามี
+            if (inactivityTimer) {
+                clearTimeout(inactivityTimer);
+                inactivityTimer = null;
+            }
+            // ซ่อนวิดีโอถ้ามันแสดงอยู่
+            hideVideoOverlay();
+            return;
+        }
+
+        // ซ่อนวิดีโอถ้ามันแสดงอยู่
+        hideVideoOverlay();
+
+        // ล้าง timer เก่า
+        if (inactivityTimer) {
+            clearTimeout(inactivityTimer);
+        }
+
+        // ตั้ง timer ใหม่
+        inactivityTimer = setTimeout(function() {
+            showVideoOverlay();
+        }, INACTIVITY_TIME);
+    }
+
+    // Event listeners สำหรับตรวจจับกิจกรรม
+    const activityEvents = [
+        'mousedown',
+        'mousemove',
+        'keypress',
+        'scroll',
+        'touchstart',
+        'click'
+    ];
+
+    activityEvents.forEach(function(event) {
+        document.addEventListener(event, resetInactivityTimer, true);
+    });
+
+    // เริ่มต้น timer เมื่อโหลดหน้า
+    document.addEventListener('DOMContentLoaded', function() {
+        resetInactivityTimer();
+    });
+
+    // เมื่อวิดีโอจบให้เล่นต่อ (loop)
+    idleVideo.addEventListener('ended', function() {
+        if (isVideoActive && !isResultsPage()) {
+            idleVideo.currentTime = 0;
+            idleVideo.play().catch(function(err) {
+                console.log('Video loop error:', err);
+            });
+        }
+    });
+
+    // รีเซ็ต timer เมื่อคลิกบน overlay (เพื่อให้สามารถดูวิดีโอได้ถ้าต้องการ)
+    videoOverlay.addEventListener('click', function() {
+        resetInactivityTimer();
+    });
+})();
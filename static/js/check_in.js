@@ -0,0 +1,73 @@
+// ==================== Check-in ====================
+// เครื่องสแกน QR แบบ USB พิมพ์รหัสแล้วกด Enter ให้เอง - ส่งทีละรายการโดยไม่ต้องรอคำตอบ
+// เพื่อให้สแกนคนถัดไปได้ทันที (server เก็บเข้า buffer แล้วเขียนลงฐานข้อมูลเป็น batch)
+const RECENT_LIMIT = 50;
+const STATS_INTERVAL = 5000;
+
+const codeInput = document.getElementById('checkInCode');
+const resultBox = document.getElementById('checkInResult');
+const recentList = document.getElementById('checkInRecent');
+
+function escapeHtml(value) {
+    const div = document.createElement('div');
+    div.textContent = value == null ? '' : String(value);
+    return div.innerHTML;
+}
+
+function showResult(type, icon, message) {
+    resultBox.className = `check-in-result ${type}`;
+    resultBox.innerHTML = `<i class="fas ${icon}"></i> ${escapeHtml(message)}`;
+}
+
+function addRecent(name) {
+    const item = document.createElement('li');
+    item.innerHTML = `<span>${escapeHtml(name)}</span><small>${new Date().toLocaleTimeString('th-TH')}</small>`;
+    recentList.prepend(item);
+    while (recentList.children.length > RECENT_LIMIT) {
+        recentList.lastElementChild.remove();
+    }
+}
+
+function submitCheckIn(e) {
+    e.preventDefault();
+    const code = codeInput.value.trim();
+    codeInput.value = '';
+    codeInput.focus();
+    if (!code) return;
+
+    fetch('/api/check-in', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ code: code })
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (!data.success) {
+            showResult('error', 'fa-times-circle', `${data.error || 'เช็คอินไม่สำเร็จ'} (${code})`);
+        } else if (data.already_checked_in) {
+            showResult('repeat', 'fa-info-circle', `${data.participant.name} เช็คอินไว้แล้ว`);
+        } else {
+            showResult('success', 'fa-check-circle', `ยินดีต้อนรับ ${data.participant.name}`);
+            addRecent(data.participant.name);
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        showResult('error', 'fa-wifi', `เชื่อมต่อไม่ได้ - กรุณาสแกนใหม่ (${code})`);
+    });
+}
+
+function loadCheckInStats() {
+    fetch('/api/check-in/stats')
+        .then(r => r.json())
+        .then(stats => {
+            document.getElementById('checkedInCount').textContent = stats.checked_in.toLocaleString();
+            document.getElementById('totalCount').textContent = stats.total.toLocaleString();
+        })
+        .catch(() => {});
+}
+
+// กลับมาโฟกัสช่องสแกนเสมอ (เครื่องสแกนพิมพ์ลงช่องที่โฟกัสอยู่)
+document.addEventListener('click', () => codeInput.focus());
+loadCheckInStats();
+setInterval(loadCheckInStats, STATS_INTERVAL);
@@ -0,0 +1,364 @@
+// ==================== Particle Engine (LuckyFX) ====================
+// วาด effect ทั้งหมด (ดาว, confetti, ฟองสบู่แตก, ประกายทอง) ลง canvas
+// ด้วย requestAnimationFrame loop เดียว และ reuse particle จาก pool
+// แทนการสร้าง/ลบ DOM element ทีละชิ้น
+const LuckyFX = (function() {
+    const POOL_LIMIT = 2000;            // จำนวน particle สูงสุดต่อ layer
+    const FRAME_BUDGET = 1000 / 50;     // เฟรมช้ากว่านี้ = ลดคุณภาพลง
+    const FRAME_RECOVER = 1000 / 58;    // เฟรมเร็วกว่านี้ = เพิ่มคุณภาพกลับ
+    const MIN_QUALITY = 0.25;
+    const MAX_STEP = 0.05;              // จำกัด dt (วินาที) ไม่ให้ particle กระโดด
+
+    const layers = {};
+    const sprites = {};
+    let quality = 1;
+    let avgFrame = 1000 / 60;
+    let lastTime = 0;
+    let running = false;
+    let dpr = Math.min(window.devicePixelRatio || 1, 2);
+    let viewW = window.innerWidth;
+    let viewH = window.innerHeight;
+
+    function rand(min, max) {
+        return min + Math.random() * (max - min);
+    }
+
+    function pick(list) {
+        return list[(Math.random() * list.length) | 0];
+    }
+
+    // ปรับจำนวน particle ตามคุณภาพปัจจุบัน (เครื่องช้าจะได้น้อยลง)
+    function scaled(count) {
+        return Math.max(1, Math.round(count * quality));
+    }
+
+    function resetParticle(p) {
+        p.x = 0; p.y = 0;
+        p.vx = 0; p.vy = 0;
+        p.gravity = 0;
+        p.drag = 0;
+        p.age = 0;              // ติดลบ = หน่วงเวลาก่อนเริ่ม
+        p.life = 1;
+        p.persistent = false;   // true = ไม่หมดอายุ (ดาว, ประกายทอง)
+        p.shape = 'dot';        // dot | rect | streak | ring
+        p.size = 4;
+        p.width = 0;
+        p.height = 0;
+        p.scaleFrom = 1;
+        p.scaleTo = 1;
+        p.rot = 0;
+        p.vrot = 0;
+        p.color = '#fff';
+        p.alpha = 1;
+        p.fade = true;
+        p.glow = false;
+        p.pulse = 0;            // คาบของการกระพริบ/ลอย (วินาที), 0 = ไม่มี
+        p.pulsePhase = 0;
+        p.pulseAlpha = 1;
+        p.pulseScale = 0;
+        p.pulseRise = 0;
+        p.group = '';
+        return p;
+    }
+
+    function resize() {
+        dpr = Math.min(window.devicePixelRatio || 1, 2);
+        const w = window.innerWidth;
+        const h = window.innerHeight;
+        Object.keys(layers).forEach(name => {
+            const layer = layers[name];
+            layer.canvas.width = Math.round(w * dpr);
+            layer.canvas.height = Math.round(h * dpr);
+            // ย้ายตำแหน่ง particle ถาวรตามสัดส่วนจอใหม่
+            for (let i = 0; i < layer.alive; i++) {
+                const p = layer.pool[i];
+                if (p.persistent) {
+                    p.x *= w / viewW;
+                    p.y *= h / viewH;
+                }
+            }
+            layer.dirty = true;
+        });
+        viewW = w;
+        viewH = h;
+        start();
+    }
+
+    function defineLayer(name, options) {
+        options = options || {};
+        if (layers[name]) return layers[name];
+        let canvas = options.canvas;
+        if (!canvas) {
+            canvas = document.createElement('canvas');
+            canvas.className = 'fx-layer';
+            canvas.style.zIndex = options.zIndex || 0;
+            document.body.appendChild(canvas);
+        }
+        canvas.width = Math.round(viewW * dpr);
+        canvas.height = Math.round(viewH * dpr);
+        layers[name] = {
+            canvas: canvas,
+            ctx: canvas.getContext('2d'),
+            pool: [],
+            alive: 0,
+            interval: 1000 / (options.fps || 60),
+            lastDraw: 0,
+            dirty: false,       // ต้องวาดใหม่ทันที (resize/clear)
+            painted: false      // canvas ยังมีภาพค้างอยู่
+        };
+        return layers[name];
+    }
+
+    // ดึง particle จาก pool (คืน null เมื่อ pool เต็ม - ข้าม effect นั้นไป)
+    function spawn(name) {
+        const layer = layers[name];
+        if (!layer || layer.alive >= POOL_LIMIT) return null;
+        let p = layer.pool[layer.alive];
+        if (!p) {
+            p = {};
+            layer.pool.push(p);
+        }
+        layer.alive++;
+        start();
+        return resetParticle(p);
+    }
+
+    function kill(layer, index) {
+        const last = layer.alive - 1;
+        const p = layer.pool[index];
+        layer.pool[index] = layer.pool[last];
+        layer.pool[last] = p;
+        layer.alive = last;
+    }
+
+    // ลบ particle ของ layer (หรือเฉพาะ group ที่ระบุ)
+    function clear(name, group) {
+        const layer = layers[name];
+        if (!layer) return;
+        for (let i = layer.alive - 1; i >= 0; i--) {
+            if (!group || layer.pool[i].group === group) kill(layer, i);
+        }
+        layer.dirty = true;
+        start();
+    }
+
+    // sprite วงกลม (มี/ไม่มี glow) render ครั้งเดียวแล้ว drawImage ซ้ำ
+    // แทนการใช้ shadowBlur ทุกเฟรม
+    function sprite(color, glow) {
+        const key = color + (glow ? '|glow' : '');
+        if (sprites[key]) return sprites[key];
+        const size = 64;
+        const c = document.createElement('canvas');
+        c.width = c.height = size;
+        const g = c.getContext('2d');
+        g.fillStyle = color;
+        g.beginPath();
+        if (glow) {
+            g.shadowColor = color;
+            g.shadowBlur = size / 4;
+            g.arc(size / 2, size / 2, size / 4, 0, Math.PI * 2);
+        } else {
+            g.arc(size / 2, size / 2, size / 2, 0, Math.PI * 2);
+        }
+        g.fill();
+        sprites[key] = c;
+        return c;
+    }
+
+    function streakSprite() {
+        if (sprites['|streak']) return sprites['|streak'];
+        const c = document.createElement('canvas');
+        c.width = 8;
+        c.height = 40;
+        const g = c.getContext('2d');
+        const grad = g.createLinearGradient(0, 0, 0, 40);
+        grad.addColorStop(0, 'rgba(255, 255, 255, 0)');
+        grad.addColorStop(0.5, 'rgba(255, 255, 255, 0.9)');
+        grad.addColorStop(1, 'rgba(255, 255, 255, 0)');
+        g.fillStyle = grad;
+        g.fillRect(0, 0, 8, 40);
+        sprites['|streak'] = c;
+        return c;
+    }
+
+    function update(layer, dt) {
+        for (let i = layer.alive - 1; i >= 0; i--) {
+            const p = layer.pool[i];
+            p.age += dt;
+            if (p.age < 0) continue;
+            if (!p.persistent && p.age >= p.life) {
+                kill(layer, i);
+                continue;
+            }
+            if (p.drag) {
+                const damping = Math.exp(-p.drag * dt);
+                p.vx *= damping;
+                p.vy *= damping;
+            }
+            p.vy += p.gravity * dt;
+            p.x += p.vx * dt;
+            p.y += p.vy * dt;
+            p.rot += p.vrot * dt;
+        }
+    }
+
+    function draw(layer) {
+        const ctx = layer.ctx;
+        const useGlow = quality >= 0.5;
+        ctx.setTransform(1, 0, 0, 1, 0, 0);
+        ctx.clearRect(0, 0, layer.canvas.width, layer.canvas.height);
+        for (let i = 0; i < layer.alive; i++) {
+            const p = layer.pool[i];
+            if (p.age < 0) continue;
+            const t = p.persistent ? 0 : p.age / p.life;
+            let alpha = p.fade ? p.alpha * (1 - t) : p.alpha;
+            let scale = p.scaleFrom + (p.scaleTo - p.scaleFrom) * t;
+            let y = p.y;
+            if (p.pulse) {
+                const k = 0.5 - 0.5 * Math.cos((p.age + p.pulsePhase) / p.pulse * Math.PI * 2);
+                alpha *= p.pulseAlpha + (1 - p.pulseAlpha) * k;
+                scale *= 1 + p.pulseScale * k;
+                y -= p.pulseRise * k;
+            }
+            if (alpha <= 0.01 || scale <= 0.01) continue;
+            ctx.globalAlpha = alpha;
+
+            if (p.shape === 'dot') {
+                const s = p.size * scale;
+                ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+                if (p.glow && useGlow) {
+                    ctx.drawImage(sprite(p.color, true), p.x - s, y - s, s * 2, s * 2);
+                } else {
+                    ctx.drawImage(sprite(p.color, false), p.x - s / 2, y - s / 2, s, s);
+                }
+            } else if (p.shape === 'rect') {
+                const cos = Math.cos(p.rot) * dpr * scale;
+                const sin = Math.sin(p.rot) * dpr * scale;
+                ctx.setTransform(cos, sin, -sin, cos, p.x * dpr, y * dpr);
+                ctx.fillStyle = p.color;
+                ctx.fillRect(-p.width / 2, -p.height / 2, p.width, p.height);
+            } else if (p.shape === 'streak') {
+                // scale ใช้กับแกน Y เท่านั้น (เส้นประกายหดลง)
+                const cos = Math.cos(p.rot) * dpr;
+                const sin = Math.sin(p.rot) * dpr;
+                ctx.setTransform(cos, sin, -sin * scale, cos * scale, p.x * dpr, y * dpr);
+                ctx.drawImage(streakSprite(), -p.width / 2, -p.height / 2, p.width, p.height);
+            } else if (p.shape === 'ring') {
+                ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+                ctx.strokeStyle = p.color;
+                ctx.lineWidth = p.width || 3;
+                ctx.beginPath();
+                ctx.arc(p.x, y, p.size / 2 * scale, 0, Math.PI * 2);
+                ctx.stroke();
+            }
+        }
+        ctx.globalAlpha = 1;
+        ctx.setTransform(1, 0, 0, 1, 0, 0);
+    }
+
+    // ปรับคุณภาพตามเวลาต่อเฟรมเฉลี่ย: ลดจำนวน particle ใหม่, ปิด glow,
+    // และลด fps ของ layer พื้นหลังเมื่อเครื่องทำงานไม่ทัน
+    function adaptQuality(frameMs) {
+        if (frameMs > 250) return;  // แท็บถูกซ่อน/กลับมาใหม่ ไม่นับ
+        avgFrame = avgFrame * 0.9 + frameMs * 0.1;
+        if (avgFrame > FRAME_BUDGET) {
+            quality = Math.max(MIN_QUALITY, quality * 0.95);
+        } else if (avgFrame < FRAME_RECOVER) {
+            quality = Math.min(1, quality + 0.01);
+        }
+    }
+
+    function frame(now) {
+        const frameMs = lastTime ? now - lastTime : 1000 / 60;
+        const dt = Math.min(frameMs / 1000, MAX_STEP);
+        lastTime = now;
+        adaptQuality(frameMs);
+
+        let busy = false;
+        Object.keys(layers).forEach(name => {
+            const layer = layers[name];
+            if (layer.alive === 0 && !layer.dirty && !layer.painted) return;
+            update(layer, dt);
+            const interval = quality < 0.5 ? layer.interval * 2 : layer.interval;
+            const mustClear = layer.alive === 0 && layer.painted;
+            if (layer.dirty || mustClear || now - layer.lastDraw >= interval - 1) {
+                draw(layer);
+                layer.lastDraw = now;
+                layer.dirty = false;
+                layer.painted = layer.alive > 0;
+            }
+            if (layer.alive > 0 || layer.painted) busy = true;
+        });
+
+        if (busy) {
+            requestAnimationFrame(frame);
+        } else {
+            running = false;
+            lastTime = 0;
+        }
+    }
+
+    function start() {
+        if (running) return;
+        running = true;
+        requestAnimationFrame(frame);
+    }
+
+    // ==================== Presets ====================
+    function stars(name, count) {
+        const n = scaled(count);
+        for (let i = 0; i < n; i++) {
+            const p = spawn(name);
+            if (!p) break;
+            p.persistent = true;
+            p.fade = false;
+            p.x = Math.random() * viewW;
+            p.y = Math.random() * viewH;
+            p.size = 3;
+            p.pulse = rand(1, 3);
+            p.pulsePhase = rand(0, 2);
+            p.pulseAlpha = 0.3;
+            p.pulseScale = 0.2;
+            p.group = 'stars';
+        }
+    }
+
+    function confetti(name, colors, count) {
+        const n = scaled(count);
+        for (let i = 0; i < n; i++) {
+            const p = spawn(name);
+            if (!p) break;
+            const size = rand(5, 15);
+            p.shape = 'rect';
+            p.age = -i * 0.02;
+            p.life = rand(2, 4);
+            p.x = Math.random() * viewW;
+            p.y = -size;
+            p.vx = rand(-20, 20);
+            p.vy = (viewH + size * 2) / p.life;
+            p.width = p.height = size;
+            p.rot = 0;
+            p.vrot = Math.PI * 4 / p.life;
+            p.color = pick(colors);
+            p.group = 'confetti';
+        }
+    }
+
+    window.addEventListener('resize', resize);
+
+    return {
+        defineLayer: defineLayer,
+        spawn: spawn,
+        clear: clear,
+        scaled: scaled,
+        rand: rand,
+        pick: pick,
+        stars: stars,
+        confetti: confetti,
+        get quality() { return quality; }
+    };
+})();
+
+LuckyFX.defineLayer('background', { canvas: document.getElementById('stars'), fps: 30 });
+LuckyFX.defineLayer('overlay', { zIndex: 2001 });
+LuckyFX.stars('background', 100);
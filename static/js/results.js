@@ -0,0 +1,277 @@
+function switchTab(tabName) {
+    document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
+    document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
+
+    document.querySelector(`[onclick="switchTab('${tabName}')"]`).classList.add('active');
+    document.getElementById(`${tabName}-tab`).classList.add('active');
+
+    // เรียก filterResults อีกครั้งเมื่อเปลี่ยนแท็บ
+    filterResults();
+}
+
+function filterResults() {
+    const searchInput = document.getElementById('searchInput');
+    const searchTerm = searchInput.value.toLowerCase().trim();
+    const activeTab = document.querySelector('.tab-content.active');
+
+    if (!activeTab) return;
+
+    // กรองตามแท็บที่เปิดอยู่
+    if (activeTab.id === 'winners-tab') {
+        // กรองตารางผู้ได้รับรางวัล
+        const rows = activeTab.querySelectorAll('.searchable-item');
+        let visibleCount = 0;
+
+        rows.forEach(row => {
+            const name = row.getAttribute('data-name') || '';
+            const prize = row.getAttribute('data-prize') || '';
+            const searchText = (name + ' ' + prize).toLowerCase();
+
+            if (searchTerm === '' || searchText.includes(searchTerm)) {
+                row.style.display = '';
+                visibleCount++;
+            } else {
+                row.style.display = 'none';
+            }
+        });
+
+        // แสดงข้อความถ้าไม่พบผลลัพธ์
+        let emptyState = activeTab.querySelector('.no-results-message');
+        if (searchTerm !== '' && visibleCount === 0) {
+            if (!emptyState) {
+                emptyState = document.createElement('div');
+                emptyState.className = 'empty-state no-results-message';
+                emptyState.innerHTML = `
+                    <i class="fas fa-search"></i>
+                    <h3>ไม่พบผลลัพธ์</h3>
+                    <p>ไม่พบข้อมูลที่ตรงกับ "${searchInput.value}"</p>
+                `;
+                activeTab.appendChild(emptyState);
+            }
+            emptyState.style.display = 'block';
+        } else if (emptyState) {
+            emptyState.style.display = 'none';
+        }
+
+    } else if (activeTab.id === 'waiting-tab' || activeTab.id === 'prizes-tab') {
+        // กรองรายการรอลุ้นรางวัลหรือรางวัลที่เหลือ
+        const items = activeTab.querySelectorAll('.searchable-item');
+        let visibleCount = 0;
+
+        items.forEach(item => {
+            const name = item.getAttribute('data-name') || '';
+            const searchText = name.toLowerCase();
+
+            if (searchTerm === '' || searchText.includes(searchTerm)) {
+                item.style.display = '';
+                visibleCount++;
+            } else {
+                item.style.display = 'none';
+            }
+        });
+
+        // แสดงข้อความถ้าไม่พบผลลัพธ์
+        let emptyState = activeTab.querySelector('.no-results-message');
+        if (searchTerm !== '' && visibleCount === 0) {
+            if (!emptyState) {
+                emptyState = document.createElement('div');
+                emptyState.className = 'empty-state no-results-message';
+                emptyState.innerHTML = `
+                    <i class="fas fa-search"></i>
+                    <h3>ไม่พบผลลัพธ์</h3>
+                    <p>ไม่พบข้อมูลที่ตรงกับ "${searchInput.value}"</p>
+                `;
+                activeTab.appendChild(emptyState);
+            }
+            emptyState.style.display = 'block';
+        } else if (emptyState) {
+            emptyState.style.display = 'none';
+        }
+    }
+}
+
+function clearSearch() {
+    const searchInput = document.getElementById('searchInput');
+    searchInput.value = '';
+    filterResults();
+    searchInput.focus();
+}
+
+// ฟังก์ชันสำหรับลบผู้ชนะ (unclaim winner) - สำหรับ admin เท่านั้น
+function unclaimWinner(participantId, participantName) {
+    if (!confirm(`ต้องการเปลี่ยนสถานะ "${participantName}" เป็น "ไม่เข้าร่วมงาน" ใช่หรือไม่?\n\nเมื่อเปลี่ยนแล้ว:\n- ชื่อจะยังคงอยู่ในรายการผู้ได้รับรางวัล\n- สถานะจะเปลี่ยนเป็น "ไม่เข้าร่วมงาน" ในคอลัมน์ประเภท\n- รางวัลจะถูกคืนกลับไปที่กองกลาง`)) {
+        return;
+    }
+
+    fetch(`/api/participants/${participantId}/unclaim`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        }
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            alert(data.message || 'ลบออกจากรายการผู้ได้รับรางวัลเรียบร้อยแล้ว');
+            // Reload หน้าเว็บเพื่ออัพเดทข้อมูล
+            window.location.reload();
+        } else {
+            alert(data.error || 'เกิดข้อผิดพลาดในการลบ');
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        alert('เกิดข้อผิดพลาดในการเชื่อมต่อ');
+    });
+}
+
+// ==================== Batch No-Show ====================
+// เลือกผู้ชนะที่ไม่มารับรางวัลหลายคน แล้วสุ่มคนใหม่แทนในรางวัลเดิมในครั้งเดียว
+function selectedNoShowIds() {
+    return Array.from(document.querySelectorAll('.no-show-select:checked')).map(cb => parseInt(cb.value, 10));
+}
+
+function updateNoShowSelection() {
+    const count = selectedNoShowIds().length;
+    document.getElementById('noShowCount').textContent = `เลือกผู้ไม่มารับรางวัล ${count} คน`;
+    document.getElementById('noShowButton').disabled = count === 0;
+}
+
+function submitNoShows() {
+    const participantIds = selectedNoShowIds();
+    if (participantIds.length === 0) return;
+    if (!confirm(`ต้องการเปลี่ยน ${participantIds.length} คนเป็น "ไม่เข้าร่วมงาน" และสุ่มผู้โชคดีคนใหม่แทนในรางวัลเดิมใช่หรือไม่?`)) {
+        return;
+    }
+
+    const button = document.getElementById('noShowButton');
+    button.disabled = true;
+
+    fetch('/api/participants/no-show', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({
+            participant_ids: participantIds,
+            checked_in_only: document.getElementById('noShowCheckedInOnly').checked
+        })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            const lines = data.results.map(r => `- ${r.prize_name}: ${r.winner_name} (แทน ${r.replaces_name})`);
+            let message = `เปลี่ยนสถานะ ${data.no_shows.length} คนเรียบร้อย`;
+            if (lines.length > 0) {
+                message += `\n\nผู้โชคดีคนใหม่:\n${lines.join('\n')}`;
+            }
+            if (data.unfilled > 0) {
+                message += `\n\nผู้เข้าร่วมไม่พอ - คืนรางวัล ${data.unfilled} รางวัลกลับกองกลาง`;
+            }
+            alert(message);
+            window.location.reload();
+        } else {
+            alert(data.error || 'เกิดข้อผิดพลาด');
+            updateNoShowSelection();
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        alert('เกิดข้อผิดพลาดในการเชื่อมต่อ');
+        updateNoShowSelection();
+    });
+}
+
+// เก็บข้อมูลปัจจุบันสำหรับเปรียบเทียบ
+let currentData = {
+    ...initialCounts,
+    latest_timestamp: null
+};
+
+// ตัวแปรสำหรับเก็บ timeout ที่จะ refresh หลังจาก 10 วินาที
+let pendingRefreshTimeout = null;
+let isRefreshPending = false;
+
+// ดึงข้อมูล timestamp ปัจจุบันเมื่อโหลดหน้าแรก
+async function loadInitialData() {
+    try {
+        const response = await fetch('/api/results/check');
+        const data = await response.json();
+        currentData.latest_timestamp = data.latest_timestamp;
+    } catch (error) {
+        console.error('Error loading initial data:', error);
+    }
+}
+
+// Polling function - เช็คข้อมูลทุก 3 วินาที
+let checkInterval;
+function startDataCheck() {
+    // เช็คทุก 3 วินาที
+    checkInterval = setInterval(async function() {
+        // ตรวจสอบว่าผู้ใช้กำลังพิมพ์ในช่องค้นหาหรือไม่
+        const searchInput = document.getElementById('searchInput');
+        if (document.activeElement === searchInput) {
+            // ถ้ากำลังพิมพ์ ให้ข้ามการเช็คครั้งนี้
+            return;
+        }
+
+        try {
+            const response = await fetch('/api/results/check');
+            const newData = await response.json();
+
+            // เปรียบเทียบข้อมูล
+            const hasChanged = 
+                newData.history_count !== currentData.history_count ||
+                newData.non_winners_count !== currentData.non_winners_count ||
+                newData.unclaimed_prizes_count !== currentData.unclaimed_prizes_count ||
+                newData.latest_timestamp !== currentData.latest_timestamp;
+
+            if (hasChanged && !isRefreshPending) {
+                // พบข้อมูลใหม่ - รอ 10 วินาทีแล้วค่อย refresh
+                isRefreshPending = true;
+
+                // ล้าง timeout เก่าถ้ามี
+                if (pendingRefreshTimeout) {
+                    clearTimeout(pendingRefreshTimeout);
+                }
+
+                // ตั้ง timeout สำหรับ refresh หลังจาก 10 วินาที
+                pendingRefreshTimeout = setTimeout(function() {
+                    // อัพเดทข้อมูลปัจจุบัน
+                    currentData = newData;
+                    isRefreshPending = false;
+                    // Reload หน้าเว็บ
+                    window.location.reload();
+                }, 10000); // 10000 milliseconds = 10 วินาที
+            } else if (!hasChanged && isRefreshPending) {
+                // ถ้าข้อมูลกลับมาเหมือนเดิม ให้ยกเลิกการ refresh ที่รออยู่
+                if (pendingRefreshTimeout) {
+                    clearTimeout(pendingRefreshTimeout);
+                    pendingRefreshTimeout = null;
+                }
+                isRefreshPending = false;
+            }
+        } catch (error) {
+            console.error('Error checking for updates:', error);
+        }
+    }, 3000); // เช็คทุก 3 วินาที
+}
+
+// เรียก filterResults เมื่อโหลดหน้าเพื่อเตรียมพร้อม
+document.addEventListener('DOMContentLoaded', async function() {
+    filterResults();
+    // โหลดข้อมูล timestamp ปัจจุบัน
+    await loadInitialData();
+    // เริ่มการเช็คข้อมูล
+    startDataCheck();
+});
+
+// หยุดการเช็คเมื่อผู้ใช้ออกจากหน้า
+window.addEventListener('beforeunload', function() {
+    if (checkInterval) {
+        clearInterval(checkInterval);
+    }
+    if (pendingRefreshTimeout) {
+        clearTimeout(pendingRefreshTimeout);
+    }
+});
@@ -0,0 +1,2121 @@
+let selectedPrize = null;
+let selectedCount = 1;
+let isProcessing = false;
+let currentRotation = 0;
+let pendingWinners = [];
+let revealedWinners = [];
+let revealedCount = 0;
+let isFinishingBubbleGame = false;
+
+// Layer สำหรับ effect ฟองสบู่แตก (อยู่เหนือ bubble fullscreen)
+LuckyFX.defineLayer('burst', { zIndex: 9001 });
+
+// ==================== Background Music ====================
+// ฟังก์ชันการจัดการเพลงถูกย้ายไปที่ base.html แล้ว
+// ใช้ฟังก์ชันจาก global scope (playBackgroundMusic, stopBackgroundMusic)
+
+// ==================== Text-to-Speech for Winner Names (ใช้ Google Translate TTS) ====================
+let currentAudio = null;
+
+// ตรวจสอบว่าชื่อเป็นภาษาอังกฤษ/พม่า (ไม่มีตัวอักษรไทย)
+function isEnglishOrMyanmarName(name) {
+    // ตรวจสอบว่ามีตัวอักษรไทยหรือไม่
+    const thaiPattern = /[ก-๙]/;
+    return !thaiPattern.test(name);
+}
+
+// แปลงชื่อภาษาอังกฤษ/พม่าให้อ่านได้ถูกต้อง (ใช้วิธีอ่านแบบคำ)
+function formatEnglishName(name) {
+    // แบ่งชื่อเป็นคำๆ และเพิ่มช่องว่างระหว่างคำเพื่อให้อ่านเป็นคำแทนตัวอักษร
+    return name.split(' ').join(' ');
+}
+
+function speakWinnerName(winnerName, prizeName, isGrand = false) {
+    // ปิดฟังก์ชันเสียง TTS ชั่วคราว
+    return;
+
+    console.log('Speaking for winner:', winnerName);
+
+    // หยุดเสียงที่กำลังเล่นอยู่
+    if (currentAudio) {
+        currentAudio.pause();
+        currentAudio = null;
+    }
+
+    // ตรวจสอบว่าชื่อเป็นภาษาอังกฤษ/พม่า หรือภาษาไทย
+    const isEnglishName = isEnglishOrMyanmarName(winnerName);
+
+    // สร้างข้อความที่จะอ่าน
+    let textToSpeak = '';
+    let nameToSpeak = winnerName;
+
+    // ถ้าเป็นชื่อภาษาอังกฤษ/พม่า ให้ใช้ lang=en เพื่ออ่านเป็นคำ
+    if (isEnglishName) {
+        // สำหรับชื่อภาษาอังกฤษ/พม่า ให้อ่านชื่อด้วยภาษาอังกฤษ
+        // แล้วอ่านส่วนอื่นด้วยภาษาไทย
+        const nameFormatted = formatEnglishName(winnerName);
+
+        if (isGrand) {
+            // อ่านชื่อด้วยภาษาอังกฤษ แล้วอ่านส่วนอื่นด้วยภาษาไทย
+            playEnglishNameThenThai(`ยินดีด้วยกับคุณ`, nameFormatted, `ได้รับรางวัลใหญ่ ${prizeName}`);
+        } else {
+            playEnglishNameThenThai(`ยินดีด้วยกับคุณ`, nameFormatted, `ได้รับรางวัล ${prizeName}`);
+        }
+        return;
+    } else {
+        // ชื่อภาษาไทย - อ่านทั้งหมดด้วยภาษาไทย
+        if (isGrand) {
+            textToSpeak = `ยินดีด้วยกับคุณ ${winnerName} ได้รับรางวัลใหญ่ ${prizeName}`;
+        } else {
+            textToSpeak = `ยินดีด้วยกับคุณ ${winnerName} ได้รับรางวัล ${prizeName}`;
+        }
+    }
+
+    console.log('Speaking:', textToSpeak);
+
+    // แบ่งข้อความเป็นประโยคสั้นๆ
+    const maxLength = 200;
+    const sentences = [];
+    let currentSentence = '';
+
+    const words = textToSpeak.split(' ');
+    for (let word of words) {
+        if ((currentSentence + ' ' + word).length <= maxLength) {
+            currentSentence = currentSentence ? currentSentence + ' ' + word : word;
+        } else {
+            if (currentSentence) sentences.push(currentSentence);
+            currentSentence = word;
+        }
+    }
+    if (currentSentence) sentences.push(currentSentence);
+
+    // เล่นเสียงทีละประโยคด้วยภาษาไทย
+    playSentences(sentences, 0, 'th');
+}
+
+// ฟังก์ชันสำหรับอ่านชื่อภาษาอังกฤษแล้วอ่านส่วนอื่นด้วยภาษาไทย
+function playEnglishNameThenThai(prefix, englishName, suffix) {
+    // อ่าน prefix ด้วยภาษาไทย
+    playSentences([prefix], 0, 'th', () => {
+        // อ่านชื่อด้วยภาษาอังกฤษ
+        playSentences([englishName], 0, 'en', () => {
+            // อ่าน suffix ด้วยภาษาไทย
+            playSentences([suffix], 0, 'th');
+        });
+    });
+}
+
+function playSentences(sentences, index, lang = 'th', onComplete = null) {
+    if (index >= sentences.length) {
+        if (onComplete) {
+            onComplete();
+        } else {
+            currentAudio = null;
+        }
+        return;
+    }
+
+    const textToSpeak = sentences[index];
+    // ใช้ backend endpoint เพื่อ bypass CORS
+    const encodedText = encodeURIComponent(textToSpeak);
+    const ttsUrl = `/api/tts?text=${encodedText}&lang=${lang}`;
+
+    console.log(`Playing sentence ${index + 1}/${sentences.length} (${lang}):`, textToSpeak);
+
+    // สร้าง Audio element
+    const audio = new Audio(ttsUrl);
+    audio.volume = 1;
+    currentAudio = audio;
+
+    // Event handlers
+    audio.onloadstart = function() {
+        console.log(`Google TTS loading sentence ${index + 1} (${lang})`);
+    };
+
+    audio.oncanplay = function() {
+        console.log(`Google TTS can play sentence ${index + 1} (${lang})`);
+    };
+
+    audio.onplay = function() {
+        console.log(`Google TTS started playing sentence ${index + 1} (${lang})`);
+    };
+
+    audio.onended = function() {
+        console.log(`Google TTS finished sentence ${index + 1} (${lang})`);
+        // เล่นประโยคถัดไป
+        setTimeout(() => {
+            playSentences(sentences, index + 1, lang, onComplete);
+        }, 300); // รอ 300ms ระหว่างประโยค
+    };
+
+    audio.onerror = function(error) {
+        console.error(`Google TTS error for sentence ${index + 1} (${lang}):`, error);
+        // ข้ามประโยคนี้และเล่นประโยคถัดไป
+        setTimeout(() => {
+            playSentences(sentences, index + 1, lang, onComplete);
+        }, 300);
+    };
+
+    // เริ่มเล่นเสียง
+    audio.play().then(() => {
+        console.log(`Google TTS audio playing sentence ${index + 1} (${lang}) successfully`);
+    }).catch(error => {
+        console.error(`Error playing Google TTS sentence ${index + 1} (${lang}):`, error);
+        // ข้ามประโยคนี้และเล่นประโยคถัดไป
+        setTimeout(() => {
+            playSentences(sentences, index + 1, lang, onComplete);
+        }, 300);
+    });
+}
+
+// ==================== Sound Effects for Grand Prize ====================
+let audioContext = null;
+let spinSoundOscillator = null;
+let spinSoundGainNode = null;
+let spinSoundIntervals = [];
+let spinningAudio = null; // สำหรับไฟล์ spinning-s.mp3 (ผู้ชนะคนเดียว)
+let spinningMAudio = null; // สำหรับไฟล์ spinning-m.mp3 (ผู้ชนะหลายคน)
+let luckyAudio = null; // สำหรับไฟล์ Lucky.mp3 (เมื่อมี popup ผู้โชคดี)
+let bubblePopAudio = null; // สำหรับไฟล์เสียงฟองสบู่แตก
+
+function initAudioContext() {
+    if (!audioContext) {
+        audioContext = new (window.AudioContext || window.webkitAudioContext)();
+    }
+    return audioContext;
+}
+
+function playSpinSound() {
+    try {
+        const ctx = initAudioContext();
+        if (ctx.state === 'suspended') {
+            ctx.resume();
+        }
+
+        const now = ctx.currentTime;
+
+        // เสียงเริ่มหมุนลอตเตอรี - เสียงกลองต่ำเหมือนถังเริ่มหมุน
+        const oscillator1 = ctx.createOscillator();
+        const gainNode1 = ctx.createGain();
+        oscillator1.connect(gainNode1);
+        gainNode1.connect(ctx.destination);
+
+        oscillator1.type = 'sine';
+        oscillator1.frequency.setValueAtTime(60, now); // เสียงต่ำเหมือนกลอง
+        oscillator1.frequency.exponentialRampToValueAtTime(80, now + 0.3);
+
+        gainNode1.gain.setValueAtTime(0.5, now);
+        gainNode1.gain.exponentialRampToValueAtTime(0.6, now + 0.1);
+        gainNode1.gain.exponentialRampToValueAtTime(0.1, now + 0.5);
+
+        oscillator1.start(now);
+        oscillator1.stop(now + 0.5);
+
+        // เสียงลูกบอลเริ่มกลิ้ง - เสียงต่ำที่เพิ่มขึ้น
+        const oscillator2 = ctx.createOscillator();
+        const gainNode2 = ctx.createGain();
+        oscillator2.connect(gainNode2);
+        gainNode2.connect(ctx.destination);
+
+        oscillator2.type = 'triangle';
+        oscillator2.frequency.setValueAtTime(40, now);
+        oscillator2.frequency.exponentialRampToValueAtTime(100, now + 0.4);
+
+        gainNode2.gain.setValueAtTime(0.3, now);
+        gainNode2.gain.exponentialRampToValueAtTime(0.4, now + 0.2);
+        gainNode2.gain.exponentialRampToValueAtTime(0.05, now + 0.4);
+
+        oscillator2.start(now);
+        oscillator2.stop(now + 0.4);
+
+        // เสียงถังหมุน - เสียงต่ำที่เพิ่มขึ้น
+        const oscillator3 = ctx.createOscillator();
+        const gainNode3 = ctx.createGain();
+        oscillator3.connect(gainNode3);
+        gainNode3.connect(ctx.destination);
+
+        oscillator3.type = 'sawtooth';
+        oscillator3.frequency.setValueAtTime(30, now);
+        oscillator3.frequency.exponentialRampToValueAtTime(70, now + 0.5);
+
+        gainNode3.gain.setValueAtTime(0.35, now);
+        gainNode3.gain.exponentialRampToValueAtTime(0.45, now + 0.25);
+        gainNode3.gain.exponentialRampToValueAtTime(0.08, now + 0.5);
+
+        oscillator3.start(now);
+        oscillator3.stop(now + 0.5);
+
+    } catch (e) {
+        console.log('Audio not available:', e);
+    }
+}
+
+function playWinnerSound() {
+    try {
+        const ctx = initAudioContext();
+        if (ctx.state === 'suspended') {
+            ctx.resume();
+        }
+
+        // เสียงชนะลอตเตอรี - Fanfare ที่ตื่นเต้นมาก
+        const now = ctx.currentTime;
+
+        // เสียงหยุดถังหมุน - เสียงต่ำที่ลดลง (เร็วขึ้น)
+        const oscStop = ctx.createOscillator();
+        const gainStop = ctx.createGain();
+        oscStop.connect(gainStop);
+        gainStop.connect(ctx.destination);
+        oscStop.type = 'sine';
+        oscStop.frequency.setValueAtTime(80, now);
+        oscStop.frequency.exponentialRampToValueAtTime(50, now + 0.15);
+        gainStop.gain.setValueAtTime(0.4, now);
+        gainStop.gain.exponentialRampToValueAtTime(0.01, now + 0.15);
+        oscStop.start(now);
+        oscStop.stop(now + 0.15);
+
+        // โน้ตแรก - C5 (เสียงสูงที่ชัดเจน - เร็วขึ้น)
+        const osc1 = ctx.createOscillator();
+        const gain1 = ctx.createGain();
+        osc1.connect(gain1);
+        gain1.connect(ctx.destination);
+        osc1.type = 'sine';
+        osc1.frequency.setValueAtTime(523.25, now + 0.1); // C5
+        gain1.gain.setValueAtTime(0.6, now + 0.1);
+        gain1.gain.exponentialRampToValueAtTime(0.01, now + 0.3);
+        osc1.start(now + 0.1);
+        osc1.stop(now + 0.3);
+
+        // โน้ตที่สอง - E5 (เสียงสูงกว่า - เร็วขึ้น)
+        const osc2 = ctx.createOscillator();
+        const gain2 = ctx.createGain();
+        osc2.connect(gain2);
+        gain2.connect(ctx.destination);
+        osc2.type = 'sine';
+        osc2.frequency.setValueAtTime(659.25, now + 0.2); // E5
+        gain2.gain.setValueAtTime(0.65, now + 0.2);
+        gain2.gain.exponentialRampToValueAtTime(0.01, now + 0.4);
+        osc2.start(now + 0.2);
+        osc2.stop(now + 0.4);
+
+        // โน้ตที่สาม - G5 (เสียงสูงสุด - เร็วขึ้น)
+        const osc3 = ctx.createOscillator();
+        const gain3 = ctx.createGain();
+        osc3.connect(gain3);
+        gain3.connect(ctx.destination);
+        osc3.type = 'sine';
+        osc3.frequency.setValueAtTime(783.99, now + 0.3); // G5
+        gain3.gain.setValueAtTime(0.7, now + 0.3);
+        gain3.gain.exponentialRampToValueAtTime(0.01, now + 0.6);
+        osc3.start(now + 0.3);
+        osc3.stop(now + 0.6);
+
+        // โน้ตที่สี่ - C6 (เสียงสูงสุดสุด - เพิ่มความตื่นเต้น)
+        const osc4 = ctx.createOscillator();
+        const gain4 = ctx.createGain();
+        osc4.connect(gain4);
+        gain4.connect(ctx.destination);
+        osc4.type = 'sine';
+        osc4.frequency.setValueAtTime(1046.50, now + 0.4); // C6
+        gain4.gain.setValueAtTime(0.75, now + 0.4);
+        gain4.gain.exponentialRampToValueAtTime(0.01, now + 0.8);
+        osc4.start(now + 0.4);
+        osc4.stop(now + 0.8);
+
+        // โน้ตที่ห้า - E6 (เสียงสูงสุดสุดสุด - เพิ่มความตื่นเต้น)
+        const osc5 = ctx.createOscillator();
+        const gain5 = ctx.createGain();
+        osc5.connect(gain5);
+        gain5.connect(ctx.destination);
+        osc5.type = 'sine';
+        osc5.frequency.setValueAtTime(1318.51, now + 0.5); // E6
+        gain5.gain.setValueAtTime(0.7, now + 0.5);
+        gain5.gain.exponentialRampToValueAtTime(0.01, now + 0.9);
+        osc5.start(now + 0.5);
+        osc5.stop(now + 0.9);
+
+        // เสียงต่ำเสริม - เพิ่มความลึกและความตื่นเต้น (เร็วขึ้น)
+        const oscBass = ctx.createOscillator();
+        const gainBass = ctx.createGain();
+        oscBass.connect(gainBass);
+        gainBass.connect(ctx.destination);
+        oscBass.type = 'triangle';
+        oscBass.frequency.setValueAtTime(261.63, now + 0.05); // C4
+        oscBass.frequency.exponentialRampToValueAtTime(392.00, now + 0.5); // G4
+        gainBass.gain.setValueAtTime(0.45, now + 0.05);
+        gainBass.gain.exponentialRampToValueAtTime(0.5, now + 0.3);
+        gainBass.gain.exponentialRampToValueAtTime(0.01, now + 0.8);
+        oscBass.start(now + 0.05);
+        oscBass.stop(now + 0.8);
+
+        // เสียงต่ำเสริมที่สอง - เพิ่มความตื่นเต้น (เสียงกลอง)
+        const oscBass2 = ctx.createOscillator();
+        const gainBass2 = ctx.createGain();
+        oscBass2.connect(gainBass2);
+        gainBass2.connect(ctx.destination);
+        oscBass2.type = 'sawtooth';
+        oscBass2.frequency.setValueAtTime(100, now + 0.1);
+        oscBass2.frequency.exponentialRampToValueAtTime(150, now + 0.25);
+        oscBass2.frequency.exponentialRampToValueAtTime(80, now + 0.5);
+        gainBass2.gain.setValueAtTime(0.3, now + 0.1);
+        gainBass2.gain.exponentialRampToValueAtTime(0.4, now + 0.25);
+        gainBass2.gain.exponentialRampToValueAtTime(0.01, now + 0.6);
+        oscBass2.start(now + 0.1);
+        oscBass2.stop(now + 0.6);
+
+        // เสียงสูงเสริม - เพิ่มความตื่นเต้น (เสียงระฆัง)
+        const oscBell = ctx.createOscillator();
+        const gainBell = ctx.createGain();
+        oscBell.connect(gainBell);
+        gainBell.connect(ctx.destination);
+        oscBell.type = 'triangle';
+        oscBell.frequency.setValueAtTime(1567.98, now + 0.35); // G6
+        oscBell.frequency.exponentialRampToValueAtTime(2093.00, now + 0.55); // C7
+        gainBell.gain.setValueAtTime(0.5, now + 0.35);
+        gainBell.gain.exponentialRampToValueAtTime(0.6, now + 0.45);
+        gainBell.gain.exponentialRampToValueAtTime(0.01, now + 0.75);
+        oscBell.start(now + 0.35);
+        oscBell.stop(now + 0.75);
+    } catch (e) {
+        console.log('Audio not available:', e);
+    }
+}
+
+function playContinuousSpinSound() {
+    try {
+        const ctx = initAudioContext();
+        if (ctx.state === 'suspended') {
+            ctx.resume();
+        }
+
+        // หยุดเสียงเก่าถ้ามี
+        stopSpinSound();
+
+        const now = ctx.currentTime;
+        const startTime = Date.now();
+
+        // เสียงหมุนลอตเตอรี - เสียงลูกบอลกลิ้งในถังหมุน
+        // เสียงหลัก - เสียงต่ำที่เปลี่ยนแปลงแบบสุ่มเหมือนลูกบอลกลิ้ง
+        const oscillator1 = ctx.createOscillator();
+        const gainNode1 = ctx.createGain();
+        oscillator1.connect(gainNode1);
+        gainNode1.connect(ctx.destination);
+
+        oscillator1.type = 'sawtooth';
+        oscillator1.frequency.setValueAtTime(50, now);
+        oscillator1.frequency.exponentialRampToValueAtTime(80, now + 0.2);
+
+        // สร้างเอฟเฟกต์เสียงลูกบอลกลิ้ง - ความถี่เปลี่ยนแปลงแบบสุ่ม
+        const interval1 = setInterval(() => {
+            if (spinSoundOscillator && spinSoundOscillator.osc1 === oscillator1) {
+                const elapsed = (Date.now() - startTime) / 1000;
+                // เสียงที่เปลี่ยนแปลงแบบสุ่มเหมือนลูกบอลกลิ้ง
+                const randomVariation = Math.random() * 30 - 15; // -15 ถึง +15
+                const freq1 = 60 + Math.sin(elapsed * 2.5) * 25 + Math.sin(elapsed * 5.7) * 15 + randomVariation;
+                try {
+                    oscillator1.frequency.setValueAtTime(Math.max(30, Math.min(120, freq1)), ctx.currentTime);
+            } catch (e) {}
+            } else {
+                clearInterval(interval1);
+            }
+        }, 60);
+
+        gainNode1.gain.setValueAtTime(0.3, now);
+        gainNode1.gain.exponentialRampToValueAtTime(0.35, now + 0.15);
+
+        oscillator1.start(now);
+
+        // เสียงถังหมุน - เสียงต่ำที่เพิ่มความเข้มข้น
+        const oscillator2 = ctx.createOscillator();
+        const gainNode2 = ctx.createGain();
+        oscillator2.connect(gainNode2);
+        gainNode2.connect(ctx.destination);
+
+        oscillator2.type = 'triangle';
+        oscillator2.frequency.setValueAtTime(35, now);
+
+        // เปลี่ยนแปลงความถี่แบบต่อเนื่อง
+        const interval2 = setInterval(() => {
+            if (spinSoundOscillator && spinSoundOscillator.osc2 === oscillator2) {
+                const elapsed = (Date.now() - startTime) / 1000;
+                const freq2 = 40 + Math.cos(elapsed * 1.8) * 20 + Math.cos(elapsed * 4.3) * 10;
+                try {
+                    oscillator2.frequency.setValueAtTime(Math.max(25, Math.min(70, freq2)), ctx.currentTime);
+                } catch (e) {}
+            } else {
+                clearInterval(interval2);
+            }
+        }, 60);
+
+        gainNode2.gain.setValueAtTime(0.25, now);
+        gainNode2.gain.exponentialRampToValueAtTime(0.3, now + 0.1);
+
+        oscillator2.start(now);
+
+        // เสียงลูกบอลกระทบ - เสียงสูงเล็กน้อยที่เพิ่มความตื่นเต้น
+        const oscillator3 = ctx.createOscillator();
+        const gainNode3 = ctx.createGain();
+        oscillator3.connect(gainNode3);
+        gainNode3.connect(ctx.destination);
+
+        oscillator3.type = 'sine';
+        oscillator3.frequency.setValueAtTime(120, now);
+
+        // เพิ่มการเปลี่ยนแปลงความถี่แบบต่อเนื่อง
+        const interval3 = setInterval(() => {
+            if (spinSoundOscillator && spinSoundOscillator.osc3 === oscillator3) {
+                const elapsed = (Date.now() - startTime) / 1000;
+                // เสียงกระทบที่เกิดขึ้นเป็นระยะ
+                const impactFreq = 100 + Math.sin(elapsed * 8) * 40 + Math.random() * 20;
+                try {
+                    oscillator3.frequency.setValueAtTime(Math.max(80, Math.min(180, impactFreq)), ctx.currentTime);
+                    // เพิ่มความดังเป็นระยะเหมือนลูกบอลกระทบ
+                    const impactGain = 0.12 + Math.sin(elapsed * 6) * 0.08 + Math.random() * 0.05;
+                    gainNode3.gain.setValueAtTime(Math.max(0.08, Math.min(0.2, impactGain)), ctx.currentTime);
+                } catch (e) {}
+            } else {
+                clearInterval(interval3);
+            }
+        }, 80);
+
+        gainNode3.gain.setValueAtTime(0.15, now);
+        gainNode3.gain.exponentialRampToValueAtTime(0.18, now + 0.2);
+
+        oscillator3.start(now);
+
+        // เก็บ reference ทั้งหมดสำหรับหยุดภายหลัง
+        spinSoundOscillator = { osc1: oscillator1, osc2: oscillator2, osc3: oscillator3 };
+        spinSoundGainNode = { gain1: gainNode1, gain2: gainNode2, gain3: gainNode3 };
+        spinSoundIntervals = [interval1, interval2, interval3];
+
+        return { oscillator: oscillator1, gainNode: gainNode1 };
+    } catch (e) {
+        console.log('Audio not available:', e);
+        return null;
+    }
+}
+
+function playSpinningAudio() {
+    // เล่นไฟล์ spinning-s.mp3 สำหรับผู้ชนะคนเดียว
+    if (spinningAudio) {
+        spinningAudio.pause();
+        spinningAudio.currentTime = 0;
+    }
+
+    spinningAudio = new Audio('/assets/Music/spinning-s.mp3');
+    spinningAudio.loop = false;
+    spinningAudio.volume = 0.7;
+
+    spinningAudio.onerror = function(e) {
+        console.error('Error loading spinning-s.mp3:', e);
+    };
+
+    spinningAudio.play().catch(err => {
+        console.error('Error playing spinning-s.mp3:', err);
+    });
+}
+
+function playSpinningMAudio() {
+    // เล่นไฟล์ spinning-m.mp3 สำหรับผู้ชนะหลายคน
+    if (spinningMAudio) {
+        spinningMAudio.pause();
+        spinningMAudio.currentTime = 0;
+    }
+
+    spinningMAudio = new Audio('/assets/Music/spinning-m.mp3');
+    spinningMAudio.loop = false;
+    spinningMAudio.volume = 0.7;
+
+    spinningMAudio.onerror = function(e) {
+        console.error('Error loading spinning-m.mp3:', e);
+    };
+
+    spinningMAudio.play().catch(err => {
+        console.error('Error playing spinning-m.mp3:', err);
+    });
+}
+
+function stopSpinningAudio() {
+    if (spinningAudio) {
+        spinningAudio.pause();
+        spinningAudio.currentTime = 0;
+        spinningAudio = null;
+    }
+    if (spinningMAudio) {
+        spinningMAudio.pause();
+        spinningMAudio.currentTime = 0;
+        spinningMAudio = null;
+    }
+}
+
+function stopSpinSound() {
+    // หยุดไฟล์ spinning-s.mp3 ถ้ามี
+    stopSpinningAudio();
+
+    // หยุด intervals ทั้งหมด
+    if (spinSoundIntervals && spinSoundIntervals.length > 0) {
+        spinSoundIntervals.forEach(interval => clearInterval(interval));
+        spinSoundIntervals = [];
+    }
+
+    if (spinSoundOscillator && spinSoundGainNode) {
+        try {
+            const ctx = initAudioContext();
+            if (ctx) {
+                // ตรวจสอบว่าเป็น object ที่มีหลาย oscillator หรือไม่
+                if (typeof spinSoundOscillator === 'object' && spinSoundOscillator.osc1) {
+                    // Fade out เสียงทั้งหมด
+                    const now = ctx.currentTime;
+                    if (spinSoundGainNode.gain1) {
+                        spinSoundGainNode.gain1.gain.setValueAtTime(spinSoundGainNode.gain1.gain.value, now);
+                        spinSoundGainNode.gain1.gain.exponentialRampToValueAtTime(0.01, now + 0.25);
+                    }
+                    if (spinSoundGainNode.gain2) {
+                        spinSoundGainNode.gain2.gain.setValueAtTime(spinSoundGainNode.gain2.gain.value, now);
+                        spinSoundGainNode.gain2.gain.exponentialRampToValueAtTime(0.01, now + 0.25);
+                    }
+                    if (spinSoundGainNode.gain3) {
+                        spinSoundGainNode.gain3.gain.setValueAtTime(spinSoundGainNode.gain3.gain.value, now);
+                        spinSoundGainNode.gain3.gain.exponentialRampToValueAtTime(0.01, now + 0.25);
+                    }
+
+                    // หยุด oscillators หลังจาก fade out
+                    setTimeout(() => {
+                        try {
+                            if (spinSoundOscillator && spinSoundOscillator.osc1) {
+                                spinSoundOscillator.osc1.stop();
+                                spinSoundOscillator.osc2.stop();
+                                spinSoundOscillator.osc3.stop();
+                            }
+                        } catch (e) {
+                            console.log('Error stopping oscillators:', e);
+                        }
+                        spinSoundOscillator = null;
+                        spinSoundGainNode = null;
+                    }, 300);
+                } else {
+                    // รูปแบบเดิม - single oscillator
+                    if (typeof spinSoundGainNode.gain === 'object') {
+                spinSoundGainNode.gain.setValueAtTime(spinSoundGainNode.gain.value, ctx.currentTime);
+                spinSoundGainNode.gain.exponentialRampToValueAtTime(0.01, ctx.currentTime + 0.2);
+
+                setTimeout(() => {
+                    try {
+                                if (spinSoundOscillator && typeof spinSoundOscillator.stop === 'function') {
+                            spinSoundOscillator.stop();
+                        }
+                    } catch (e) {
+                        console.log('Error stopping oscillator:', e);
+                    }
+                    spinSoundOscillator = null;
+                    spinSoundGainNode = null;
+                }, 250);
+                    }
+                }
+            }
+        } catch (e) {
+            console.log('Error in stopSpinSound:', e);
+            spinSoundOscillator = null;
+            spinSoundGainNode = null;
+        }
+    } else if (spinSoundOscillator) {
+        // Fallback: หยุดทันทีถ้าไม่มี gainNode
+        try {
+            if (typeof spinSoundOscillator === 'object' && spinSoundOscillator.osc1) {
+                spinSoundOscillator.osc1.stop();
+                spinSoundOscillator.osc2.stop();
+                spinSoundOscillator.osc3.stop();
+            } else if (typeof spinSoundOscillator.stop === 'function') {
+            spinSoundOscillator.stop();
+            }
+        } catch (e) {}
+        spinSoundOscillator = null;
+        spinSoundGainNode = null;
+    }
+}
+
+const segmentColors = ['#0033A0', '#0055CC', '#0077DD', '#3399EE', '#0088AA', '#00AACC', '#00CCEE', '#33DDFF'];
+const bubbleColors = [
+    'radial-gradient(circle at 30% 30%, rgba(255,255,255,0.95) 0%, rgba(150,220,255,0.7) 25%, rgba(100,200,255,0.5) 50%, rgba(50,150,255,0.4) 75%, rgba(0,100,200,0.3) 100%)',
+    'radial-gradient(circle at 30% 30%, rgba(255,255,255,0.95) 0%, rgba(200,150,255,0.7) 25%, rgba(150,100,255,0.5) 50%, rgba(100,50,200,0.4) 75%, rgba(50,0,150,0.3) 100%)',
+    'radial-gradient(circle at 30% 30%, rgba(255,255,255,0.95) 0%, rgba(150,255,220,0.7) 25%, rgba(100,255,200,0.5) 50%, rgba(50,200,150,0.4) 75%, rgba(0,150,100,0.3) 100%)',
+    'radial-gradient(circle at 30% 30%, rgba(255,255,255,0.95) 0%, rgba(255,220,150,0.7) 25%, rgba(255,200,100,0.5) 50%, rgba(255,150,50,0.4) 75%, rgba(200,100,0,0.3) 100%)',
+    'radial-gradient(circle at 30% 30%, rgba(255,255,255,0.95) 0%, rgba(255,180,220,0.7) 25%, rgba(255,150,200,0.5) 50%, rgba(255,100,150,0.4) 75%, rgba(200,50,100,0.3) 100%)',
+    'radial-gradient(circle at 30% 30%, rgba(255,255,255,0.95) 0%, rgba(150,255,255,0.7) 25%, rgba(100,240,255,0.5) 50%, rgba(50,220,255,0.4) 75%, rgba(0,200,255,0.3) 100%)',
+    'radial-gradient(circle at 30% 30%, rgba(255,255,255,0.95) 0%, rgba(255,200,255,0.7) 25%, rgba(255,150,255,0.5) 50%, rgba(255,100,255,0.4) 75%, rgba(200,50,200,0.3) 100%)'
+];
+
+function selectPrize(card) {
+    if (card.classList.contains('disabled')) return;
+
+    document.querySelectorAll('.prize-card').forEach(c => c.classList.remove('selected'));
+    card.classList.add('selected');
+
+    // ดึง imagePath จาก data attribute (kebab-case จะแปลงเป็น camelCase อัตโนมัติ)
+    const imagePath = card.getAttribute('data-image-path') || card.dataset.imagePath || '';
+
+    selectedPrize = {
+        id: parseInt(card.dataset.prizeId),
+        name: card.dataset.prizeName,
+        imagePath: imagePath,
+        isGrand: card.dataset.isGrand === 'true',
+        remaining: parseInt(card.dataset.remaining)
+    };
+
+    document.getElementById('selectedPrizeName').textContent = selectedPrize.name;
+    document.getElementById('selectedPrizeRemaining').textContent = `เหลือ ${selectedPrize.remaining} รางวัล`;
+
+    const display = document.getElementById('selectedPrizeDisplay');
+    const icon = document.getElementById('selectedPrizeIcon');
+    const iconContainer = document.getElementById('selectedPrizeIconContainer');
+    const prizeImage = document.getElementById('selectedPrizeImage');
+    const spinBtn = document.getElementById('spinBtn');
+    const createBubbleBtn = document.getElementById('createBubbleSection');
+
+    // แสดงรูปภาพรางวัลถ้ามี
+    console.log('Selected Prize:', selectedPrize); // Debug
+    console.log('Image Path:', selectedPrize.imagePath); // Debug
+
+    if (selectedPrize.imagePath && selectedPrize.imagePath.trim() !== '' && selectedPrize.imagePath !== 'None') {
+        const imageUrl = `/static/${selectedPrize.imagePath}`;
+        prizeImage.src = imageUrl;
+        prizeImage.onload = function() {
+            prizeImage.style.display = 'block';
+            prizeImage.classList.add('show');
+            iconContainer.style.display = 'none';
+            console.log('Prize image loaded successfully:', imageUrl); // Debug
+        };
+        prizeImage.onerror = function() {
+            console.error('Failed to load prize image:', imageUrl); // Debug
+            prizeImage.style.display = 'none';
+            prizeImage.classList.remove('show');
+            iconContainer.style.display = 'flex';
+        };
+    } else {
+        prizeImage.style.display = 'none';
+        prizeImage.classList.remove('show');
+        iconContainer.style.display = 'flex';
+        console.log('No image path, showing icon'); // Debug
+    }
+
+    // Update count buttons based on prize type
+    updateCountButtons(selectedPrize.isGrand);
+
+    if (selectedPrize.isGrand) {
+        // Grand Prize - Show Wheel
+        display.classList.add('grand');
+        icon.className = 'fas fa-crown';
+        spinBtn.style.display = 'block';
+        spinBtn.classList.add('grand');
+        createBubbleBtn.style.display = 'none';
+        document.getElementById('wheelSection').style.display = 'block';
+        buildWheel();
+        activateGrandMode();
+        // Auto-select 1 winner for grand prize
+        selectCount(1);
+    } else {
+        // Normal Prize - Show Create Bubble Button
+        display.classList.remove('grand');
+        icon.className = 'fas fa-gift';
+        spinBtn.style.display = 'none';
+        createBubbleBtn.style.display = 'block';
+        document.getElementById('wheelSection').style.display = 'none';
+        deactivateGrandMode();
+        // Auto-select 1 winner for normal prize too
+        selectCount(1);
+    }
+
+    showGameSection();
+}
+
+function showGameSection() {
+    document.getElementById('prizeSelectionSection').style.display = 'none';
+    document.getElementById('gameSection').classList.add('active');
+    document.getElementById('step1').classList.remove('active');
+    document.getElementById('step1').classList.add('completed');
+    document.getElementById('step2').classList.remove('inactive');
+    document.getElementById('step2').classList.add('active');
+    // Hide stats cards
+    document.querySelector('.stats-cards').style.display = 'none';
+}
+
+function goBackToSelection() {
+    document.getElementById('prizeSelectionSection').style.display = 'block';
+    document.getElementById('gameSection').classList.remove('active');
+    document.getElementById('step1').classList.add('active');
+    document.getElementById('step1').classList.remove('completed');
+    document.getElementById('step2').classList.add('inactive');
+    document.getElementById('step2').classList.remove('active');
+    document.getElementById('bubbleContainer').innerHTML = '';
+    document.getElementById('poppedWinners').innerHTML = '';
+    document.getElementById('bubbleFullscreen').classList.remove('active');
+    document.getElementById('createBubbleSection').style.display = 'none';
+    document.getElementById('createBubbleBtn').disabled = false;
+    document.getElementById('spinBtn').style.display = 'none';
+
+    // Reset prize image display
+    const prizeImage = document.getElementById('selectedPrizeImage');
+    const iconContainer = document.getElementById('selectedPrizeIconContainer');
+    if (prizeImage) {
+        prizeImage.classList.remove('show');
+        prizeImage.src = '';
+    }
+    if (iconContainer) {
+        iconContainer.style.display = 'flex';
+    }
+
+    // Show stats cards again
+    document.querySelector('.stats-cards').style.display = 'flex';
+    deactivateGrandMode();
+    isProcessing = false;
+    pendingWinners = [];
+    revealedCount = 0;
+    resetCountSelection();
+    revealedWinners = [];
+    isFinishingBubbleGame = false;
+
+    // Reset popAllBtn state
+    const popAllBtn = document.getElementById('popAllBtn');
+    if (popAllBtn) {
+        popAllBtn.disabled = false;
+    }
+}
+
+function updateCountButtons(isGrand) {
+    const buttonsContainer = document.getElementById('winnerCountButtons');
+    const buttons = buttonsContainer.querySelectorAll('.count-btn');
+
+    // รางวัลใหญ่: 1, 2, 3, 4, 5
+    // รางวัลทั่วไป: 1, 2, 3, 4, 5, 10
+    buttons.forEach(btn => {
+        const count = parseInt(btn.dataset.count);
+        if (isGrand) {
+            // รางวัลใหญ่ - ซ่อนปุ่ม 10
+            if (count === 10) {
+                btn.style.display = 'none';
+            } else {
+                btn.style.display = 'inline-flex';
+            }
+        } else {
+            // รางวัลทั่วไป - แสดงปุ่มทั้งหมด
+            btn.style.display = 'inline-flex';
+        }
+    });
+}
+
+function selectCount(count) {
+    if (!selectedPrize) return;
+    const maxCount = Math.min(selectedPrize.remaining, participantsCopy.length);
+    if (count > maxCount) {
+        alert(`ไม่สามารถเลือก ${count} ผู้โชคดีได้ (สูงสุด ${maxCount} คน)`);
+        return;
+    }
+    selectedCount = count;
+    document.querySelectorAll('.count-btn').forEach(btn => {
+        btn.classList.toggle('active', parseInt(btn.dataset.count) === count);
+    });
+    // ล้าง custom input เมื่อเลือกปุ่ม
+    const customInput = document.getElementById('customCountInput');
+    if (customInput) {
+        customInput.value = '';
+    }
+}
+
+function resetCountSelection() {
+    // Helper function สำหรับรีเซ็ตการเลือกจำนวน
+    selectedCount = 0;
+    const customInput = document.getElementById('customCountInput');
+    if (customInput) {
+        customInput.value = '';
+    }
+    // ล้าง active state จากปุ่มทั้งหมด
+    document.querySelectorAll('.count-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+}
+
+function selectCustomCount() {
+    if (!selectedPrize) return;
+    const customInput = document.getElementById('customCountInput');
+    const customCount = parseInt(customInput.value);
+
+    // ถ้าไม่ได้กรอกอะไร หรือเป็น 0 ให้ล้างการเลือก
+    if (!customInput.value || customInput.value.trim() === '' || isNaN(customCount) || customCount <= 0) {
+        resetCountSelection();
+        return;
+    }
+
+    const maxCount = Math.min(selectedPrize.remaining, participantsCopy.length);
+    if (customCount > maxCount) {
+        alert(`ไม่สามารถเลือก ${customCount} ผู้โชคดีได้ (สูงสุด ${maxCount} คน)`);
+        resetCountSelection();
+        return;
+    }
+
+    selectedCount = customCount;
+    // ล้าง active state จากปุ่มทั้งหมดเมื่อกรอกเอง
+    document.querySelectorAll('.count-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+}
+
+function buildWheel() {
+    buildReel();
+}
+
+// ==================== Virtualized Reel ====================
+// วงล้อใช้ node จำนวนคงที่ (พอดีความกว้างกล่อง + buffer) แล้วเปลี่ยนเนื้อหาตาม
+// offset ที่เลื่อนไป แทนการสร้าง element ให้ทุกคนในรายชื่อ
+const REEL_ITEM_PITCH = 216;        // .csgo-item 200px + margin ซ้าย/ขวา 8px
+const REEL_BUFFER = 2;              // node สำรองนอกกรอบแต่ละด้าน
+const REEL_ITEMS_PER_SECOND = 10;   // ระยะหมุน (จำนวนช่อง) ต่อวินาทีของการหมุน
+
+const reelState = {
+    people: [],         // รายชื่อที่วนแสดงในวงล้อ
+    offset: 0,          // ตำแหน่ง (px) - ช่อง offset / PITCH อยู่ตรง pointer
+    nodes: [],          // node ที่ recycle: { el, item, avatar, img, name, slot, personId }
+    pinnedSlot: null,   // ช่องที่ล็อกให้เป็นผู้ชนะจาก server
+    pinnedPerson: null,
+    frame: null
+};
+
+function reelPersonAt(slot) {
+    if (slot === reelState.pinnedSlot) return reelState.pinnedPerson;
+    const people = reelState.people;
+    return people[((slot % people.length) + people.length) % people.length];
+}
+
+function createReelNode(reel) {
+    const el = document.createElement('div');
+    el.className = 'csgo-slot';
+    el.innerHTML = `
+        <div class="csgo-item">
+            <div class="csgo-item-avatar"></div>
+            <div class="csgo-item-name"></div>
+        </div>
+    `;
+    reel.appendChild(el);
+    const img = document.createElement('img');
+    img.style.borderRadius = '50%';
+    return {
+        el: el,
+        item: el.querySelector('.csgo-item'),
+        avatar: el.querySelector('.csgo-item-avatar'),
+        img: img,
+        name: el.querySelector('.csgo-item-name'),
+        slot: null,
+        personId: null
+    };
+}
+
+function fillReelNode(node, person) {
+    node.item.classList.remove('winner');
+    node.item.style.animation = '';
+    if (node.personId === person.id) return;
+    node.personId = person.id;
+    node.item.dataset.participantId = person.id;
+    if (person.image_path) {
+        node.img.src = `/static/${person.image_path}`;
+        node.img.alt = person.name;
+        if (node.img.parentNode !== node.avatar) {
+            node.avatar.textContent = '';
+            node.avatar.appendChild(node.img);
+        }
+    } else {
+        node.avatar.textContent = person.name.charAt(0).toUpperCase();
+    }
+    node.name.textContent = person.name.length > 15 ? person.name.substring(0, 13) + '...' : person.name;
+}
+
+function renderReel() {
+    const reel = document.getElementById('csgoReel');
+    const container = document.getElementById('csgoSpinner');
+    if (!reel || !container) return;
+
+    const width = container.clientWidth;
+    if (!width || reelState.people.length === 0) {
+        reel.style.visibility = 'hidden';
+        return;
+    }
+    reel.style.visibility = '';
+
+    // จำนวน node ขึ้นกับความกว้างกล่องเท่านั้น ไม่ขึ้นกับจำนวนผู้เข้าร่วม
+    const count = Math.ceil(width / REEL_ITEM_PITCH) + REEL_BUFFER * 2 + 1;
+    if (reelState.nodes.length !== count) {
+        reel.innerHTML = '';
+        reelState.nodes = [];
+        for (let i = 0; i < count; i++) {
+            reelState.nodes.push(createReelNode(reel));
+        }
+    }
+
+    const center = width / 2;
+    const first = Math.floor((reelState.offset - center) / REEL_ITEM_PITCH) - REEL_BUFFER;
+    for (let slot = first; slot < first + count; slot++) {
+        // ช่องเดิมจะอยู่กับ node เดิมจนกว่าจะเลื่อนออกนอกกรอบ
+        const node = reelState.nodes[((slot % count) + count) % count];
+        if (node.slot !== slot) {
+            node.slot = slot;
+            fillReelNode(node, reelPersonAt(slot));
+        }
+        const x = center + slot * REEL_ITEM_PITCH - reelState.offset - REEL_ITEM_PITCH / 2;
+        node.el.style.transform = `translate3d(${x}px, 0, 0)`;
+    }
+}
+
+function setReelPeople(people) {
+    if (reelState.frame) {
+        cancelAnimationFrame(reelState.frame);
+        reelState.frame = null;
+    }
+    reelState.people = people;
+    reelState.offset = 0;
+    reelState.pinnedSlot = null;
+    reelState.pinnedPerson = null;
+    reelState.nodes.forEach(node => { node.slot = null; });
+    renderReel();
+}
+
+// เหมือน CSS cubic-bezier(): หา t จาก x (Newton-Raphson + bisection) แล้วคืนค่า y
+function cubicBezier(x1, y1, x2, y2) {
+    const cx = 3 * x1, bx = 3 * (x2 - x1) - cx, ax = 1 - cx - bx;
+    const cy = 3 * y1, by = 3 * (y2 - y1) - cy, ay = 1 - cy - by;
+    const sampleX = t => ((ax * t + bx) * t + cx) * t;
+    const sampleY = t => ((ay * t + by) * t + cy) * t;
+    const slopeX = t => (3 * ax * t + 2 * bx) * t + cx;
+
+    return function(x) {
+        if (x <= 0) return 0;
+        if (x >= 1) return 1;
+        let t = x;
+        for (let i = 0; i < 8; i++) {
+            const error = sampleX(t) - x;
+            const slope = slopeX(t);
+            if (Math.abs(error) < 1e-5 || Math.abs(slope) < 1e-6) break;
+            t -= error / slope;
+        }
+        if (t < 0 || t > 1 || Math.abs(sampleX(t) - x) > 1e-4) {
+            let lo = 0, hi = 1;
+            t = x;
+            while (hi - lo > 1e-5) {
+                if (sampleX(t) < x) lo = t; else hi = t;
+                t = (lo + hi) / 2;
+            }
+        }
+        return sampleY(t);
+    };
+}
+
+function animateReelOffset(to, duration, easing, done) {
+    if (reelState.frame) cancelAnimationFrame(reelState.frame);
+    const from = reelState.offset;
+    const startTime = performance.now();
+
+    function step(now) {
+        const progress = Math.min(1, (now - startTime) / duration);
+        reelState.offset = from + (to - from) * easing(progress);
+        renderReel();
+        if (progress < 1) {
+            reelState.frame = requestAnimationFrame(step);
+        } else {
+            reelState.frame = null;
+            if (done) done();
+        }
+    }
+    reelState.frame = requestAnimationFrame(step);
+}
+
+function buildReel() {
+    if (!participantsCopy || participantsCopy.length === 0) {
+        console.log('No participants to build reel');
+    }
+    setReelPeople((participantsCopy || []).filter(person => person && person.name));
+}
+
+// วาดใหม่เมื่อกล่องวงล้อเปลี่ยนขนาด (รวมถึงตอนถูกแสดงจาก display: none)
+if (window.ResizeObserver && document.getElementById('csgoSpinner')) {
+    new ResizeObserver(() => renderReel()).observe(document.getElementById('csgoSpinner'));
+} else {
+    window.addEventListener('resize', renderReel);
+}
+
+function startGame() {
+    if (isProcessing || !selectedPrize) return;
+
+    if (participantsCopy.length < selectedCount) {
+        alert(`มีผู้เข้าร่วมไม่เพียงพอ`);
+        return;
+    }
+
+    if (selectedPrize.isGrand) {
+        spinWheel();
+    } else {
+        createBubbles();
+    }
+}
+
+// ==================== BUBBLE GAME ====================
+function createBubbles() {
+    if (!selectedPrize) {
+        alert('กรุณาเลือกรางวัลก่อน');
+        return;
+    }
+    if (selectedCount === 0) {
+        alert('กรุณาเลือกจำนวนผู้โชคดี');
+        return;
+    }
+
+    // หยุดเพลงเมื่อกดสร้างฟองสบู่
+    stopBackgroundMusic();
+
+    isProcessing = true;
+    revealedWinners = []; // Reset revealed winners
+    document.getElementById('createBubbleBtn').disabled = true;
+
+    // Show fullscreen bubble
+    document.getElementById('bubbleFullscreen').classList.add('active');
+    document.getElementById('bubblePrizeName').textContent = selectedPrize.name;
+    document.getElementById('bubbleContainer').innerHTML = '';
+    document.getElementById('poppedWinners').innerHTML = '';
+    document.getElementById('bubbleInstruction').innerHTML = '<i class="fas fa-spinner fa-spin"></i> กำลังสุ่มและสร้างฟองสบู่...';
+
+    // Disable popAllBtn จนกว่าฟองสบู่จะสร้างครบทั้งหมด
+    const popAllBtn = document.getElementById('popAllBtn');
+    if (popAllBtn) {
+        popAllBtn.disabled = true;
+    }
+
+    // Call API to get winners
+    fetch('/api/spin', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ prize_id: selectedPrize.id, count: selectedCount, checked_in_only: checkedInOnly })
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) {
+            pendingWinners = data.results;
+            revealedCount = 0;
+            isFinishingBubbleGame = false;
+
+            // Update prize remaining
+            selectedPrize.remaining = data.prize_remaining;
+            document.getElementById('selectedPrizeRemaining').textContent = `เหลือ ${data.prize_remaining} รางวัล`;
+
+            // Create bubbles - สร้างทีละลูก (เร็วกว่าเดิม: 100ms delay)
+            const container = document.getElementById('bubbleContainer');
+            const containerRect = container.getBoundingClientRect();
+
+            pendingWinners.forEach((winner, index) => {
+                setTimeout(() => {
+                    const bubble = createBubble(winner, index, containerRect.width, containerRect.height);
+                    container.appendChild(bubble);
+
+                    // เมื่อสร้างฟองสบู่ครบทั้งหมดแล้ว ให้ enable ปุ่ม "แตะฟองสบู่ทั้งหมด"
+                    if (index === pendingWinners.length - 1) {
+                        document.getElementById('bubbleInstruction').innerHTML = 
+                            '<i class="fas fa-hand-pointer"></i> แตะฟองสบู่เพื่อเปิดเผยผู้โชคดี!';
+
+                        // Enable popAllBtn หลังจากสร้างฟองสบู่ครบทั้งหมดแล้ว
+                        setTimeout(() => {
+                            const popAllBtn = document.getElementById('popAllBtn');
+                            if (popAllBtn) {
+                                popAllBtn.disabled = false;
+                            }
+                        }, 100);
+                    }
+                }, index * 100); // เร็วขึ้น: จาก 300ms เป็น 100ms
+            });
+        } else {
+            alert(data.error || 'เกิดข้อผิดพลาด');
+            isProcessing = false;
+            document.getElementById('spinBtn').disabled = false;
+        }
+    })
+    .catch(err => {
+        console.error(err);
+        alert('เกิดข้อผิดพลาดในการเชื่อมต่อ');
+        isProcessing = false;
+        document.getElementById('spinBtn').disabled = false;
+    });
+}
+
+function createBubble(winner, index, containerWidth, containerHeight) {
+    const bubble = document.createElement('div');
+    bubble.className = 'bubble';
+
+    // Varied sizes for visual interest
+    const size = 90 + Math.random() * 50;
+    bubble.style.width = size + 'px';
+    bubble.style.height = size + 'px';
+
+    // Random position with better distribution
+    const maxX = containerWidth - size - 40;
+    const maxY = containerHeight - size - 40;
+    bubble.style.left = (40 + Math.random() * maxX) + 'px';
+    bubble.style.top = (40 + Math.random() * maxY) + 'px';
+
+    // Use random color from array for variety
+    const colorIndex = Math.floor(Math.random() * bubbleColors.length);
+    bubble.style.background = bubbleColors[colorIndex];
+
+    // Varied animation delays for natural movement
+    bubble.style.animationDelay = (Math.random() * 3) + 's';
+
+    // Add random rotation for more dynamic look
+    const initialRotation = Math.random() * 360;
+    bubble.style.transform = `rotate(${initialRotation}deg)`;
+
+    bubble.innerHTML = `<div class="bubble-content">?</div>`;
+    bubble.dataset.winnerIndex = index;
+
+    bubble.onclick = () => popBubble(bubble, winner);
+
+    return bubble;
+}
+
+function playBubblePopSound() {
+    // เล่นเสียงฟองสบู่แตก
+    if (bubblePopAudio) {
+        bubblePopAudio.pause();
+        bubblePopAudio.currentTime = 0;
+    }
+
+    bubblePopAudio = new Audio('/assets/Music/bubble-pop.mp3');
+    bubblePopAudio.volume = 0.7;
+
+    bubblePopAudio.onerror = function(e) {
+        console.error('Error loading bubble-pop.mp3:', e);
+        // Fallback: สร้างเสียงฟองสบู่แตกด้วย Web Audio API
+        playBubblePopSoundFallback();
+    };
+
+    bubblePopAudio.play().catch(err => {
+        console.error('Error playing bubble-pop.mp3:', err);
+        // Fallback: สร้างเสียงฟองสบู่แตกด้วย Web Audio API
+        playBubblePopSoundFallback();
+    });
+}
+
+function playBubblePopSoundFallback() {
+    // Fallback: สร้างเสียงฟองสบู่แตกด้วย Web Audio API
+    try {
+        const ctx = initAudioContext();
+        if (ctx.state === 'suspended') {
+            ctx.resume();
+        }
+
+        const now = ctx.currentTime;
+
+        // เสียงฟองสบู่แตก - เสียงสูงที่ลดลงเร็ว
+        const osc1 = ctx.createOscillator();
+        const gain1 = ctx.createGain();
+        osc1.connect(gain1);
+        gain1.connect(ctx.destination);
+        osc1.type = 'sine';
+        osc1.frequency.setValueAtTime(800, now);
+        osc1.frequency.exponentialRampToValueAtTime(200, now + 0.1);
+        gain1.gain.setValueAtTime(0.3, now);
+        gain1.gain.exponentialRampToValueAtTime(0.01, now + 0.1);
+        osc1.start(now);
+        osc1.stop(now + 0.1);
+
+        // เสียงเสริม - เสียงต่ำที่เพิ่มขึ้น
+        const osc2 = ctx.createOscillator();
+        const gain2 = ctx.createGain();
+        osc2.connect(gain2);
+        gain2.connect(ctx.destination);
+        osc2.type = 'triangle';
+        osc2.frequency.setValueAtTime(100, now);
+        osc2.frequency.exponentialRampToValueAtTime(150, now + 0.05);
+        gain2.gain.setValueAtTime(0.2, now);
+        gain2.gain.exponentialRampToValueAtTime(0.01, now + 0.08);
+        osc2.start(now);
+        osc2.stop(now + 0.08);
+    } catch (e) {
+        console.log('Audio not available:', e);
+    }
+}
+
+function popBubble(bubble, winner) {
+    if (bubble.classList.contains('popping')) return;
+
+    bubble.classList.add('popping');
+
+    // เล่นเสียงฟองสบู่แตก
+    playBubblePopSound();
+
+    // Create ripple effect
+    createRippleEffect(bubble);
+
+    // Create enhanced splash particles
+    createSplashParticles(bubble);
+
+    // Create sparkles
+    createSparkles(bubble);
+
+    setTimeout(() => {
+        bubble.remove();
+        revealWinner(winner);
+        revealedCount++;
+
+        // Check if all bubbles popped
+        if (revealedCount === pendingWinners.length && !isFinishingBubbleGame) {
+            isFinishingBubbleGame = true;
+            setTimeout(() => {
+                finishBubbleGame();
+            }, 500);
+        }
+    }, 600);
+}
+
+function bubbleCenter(bubble) {
+    const rect = bubble.getBoundingClientRect();
+    return {
+        x: rect.left + rect.width / 2,
+        y: rect.top + rect.height / 2,
+        size: rect.width
+    };
+}
+
+function createRippleEffect(bubble) {
+    const center = bubbleCenter(bubble);
+
+    for (let i = 0; i < 3; i++) {
+        const ripple = LuckyFX.spawn('burst');
+        if (!ripple) break;
+        ripple.shape = 'ring';
+        ripple.x = center.x;
+        ripple.y = center.y;
+        ripple.size = center.size;
+        ripple.width = 3;
+        ripple.color = 'rgba(255, 255, 255, 0.8)';
+        ripple.age = -i * 0.1;
+        ripple.life = 0.6;
+        ripple.scaleTo = 3 + i;
+    }
+}
+
+function createSplashParticles(bubble) {
+    const center = bubbleCenter(bubble);
+
+    const colors = [
+        'rgba(100, 200, 255, 0.9)',
+        'rgba(150, 220, 255, 0.9)',
+        'rgba(200, 240, 255, 0.9)',
+        'rgba(255, 255, 255, 0.9)',
+        'rgba(0, 212, 255, 0.8)'
+    ];
+
+    const count = LuckyFX.scaled(20);
+    const drag = 5;
+    for (let i = 0; i < count; i++) {
+        const particle = LuckyFX.spawn('burst');
+        if (!particle) break;
+
+        // ความเร็วต้นที่ทำให้ชะลอด้วย drag แล้วไปหยุดที่ระยะ distance พอดีเมื่อหมดอายุ
+        const angle = (i / count) * Math.PI * 2 + Math.random() * 0.5;
+        const distance = 60 + Math.random() * 80;
+        const life = 0.8 + Math.random() * 0.2;
+        const speed = distance * drag / (1 - Math.exp(-drag * life));
+
+        particle.x = center.x;
+        particle.y = center.y;
+        particle.vx = Math.cos(angle) * speed;
+        particle.vy = Math.sin(angle) * speed;
+        particle.drag = drag;
+        particle.life = life;
+        particle.size = 8 + Math.random() * 12;
+        particle.color = LuckyFX.pick(colors);
+        particle.glow = true;
+        particle.scaleTo = 0;
+    }
+}
+
+function createSparkles(bubble) {
+    const center = bubbleCenter(bubble);
+
+    for (let i = 0; i < 8; i++) {
+        const sparkle = LuckyFX.spawn('burst');
+        if (!sparkle) break;
+
+        const angle = (i / 8) * Math.PI * 2;
+        const distance = 40 + Math.random() * 30;
+
+        sparkle.shape = 'streak';
+        sparkle.x = center.x;
+        sparkle.y = center.y;
+        sparkle.vx = Math.cos(angle) * distance / 0.6;
+        sparkle.vy = Math.sin(angle) * distance / 0.6;
+        sparkle.width = 4;
+        sparkle.height = 20;
+        sparkle.rot = angle;
+        sparkle.vrot = Math.PI / 0.6;
+        sparkle.life = 0.6;
+        sparkle.scaleTo = 0;
+    }
+}
+
+function revealWinner(winner) {
+    // Add to revealed winners list
+    revealedWinners.push(winner);
+
+    // Find participant to get image_path
+    const participant = participantsCopy.find(p => p.id === winner.winner_id);
+    const avatarContent = participant && participant.image_path
+        ? `<img src="/static/${participant.image_path}" alt="${winner.winner_name}" style="width: 100%; height: 100%; object-fit: cover; border-radius: 50%;">`
+        : winner.winner_name[0];
+
+    const container = document.getElementById('poppedWinners');
+    const winnerEl = document.createElement('div');
+    winnerEl.className = 'popped-winner';
+    winnerEl.innerHTML = `
+        <div class="winner-avatar">${avatarContent}</div>
+        <div>
+            <div class="winner-name">${winner.winner_name}</div>
+            <div class="winner-label"><i class="fas fa-gift"></i> ${selectedPrize.name}</div>
+        </div>
+    `;
+    container.appendChild(winnerEl);
+
+    // Remove from local participants
+    const idx = participantsCopy.findIndex(p => p.id === winner.winner_id);
+    if (idx > -1) participantsCopy.splice(idx, 1);
+
+    createConfetti(false, 30);
+}
+
+function popAllBubbles() {
+    const bubbles = document.querySelectorAll('.bubble:not(.popped)');
+    if (bubbles.length === 0) return;
+
+    document.getElementById('popAllBtn').disabled = true;
+    document.getElementById('bubbleInstruction').innerHTML = '<i class="fas fa-magic"></i> กำลังเปิดเผยทั้งหมด...';
+
+    // Pop each bubble with a small delay for effect (เร็วกว่าเดิม: 100ms delay)
+    bubbles.forEach((bubble, index) => {
+        setTimeout(() => {
+            if (!bubble.classList.contains('popped')) {
+                bubble.click();
+            }
+        }, index * 100); // เร็วขึ้น: จาก 300ms เป็น 100ms
+    });
+}
+
+function finishBubbleGame() {
+    if (isFinishingBubbleGame === false && revealedCount < pendingWinners.length) {
+        return; // Already finished or not ready
+    }
+
+    console.log('finishBubbleGame called', { revealedCount, pendingWinnersLength: pendingWinners.length, revealedWinnersCount: revealedWinners.length });
+
+    // Update stats
+    document.getElementById('participantCount').textContent = participantsCopy.length;
+    const normalCount = parseInt(document.getElementById('normalPrizeCount').textContent) - revealedWinners.length;
+    document.getElementById('normalPrizeCount').textContent = normalCount;
+
+    // Update prize card
+    const prizeCard = document.querySelector(`[data-prize-id="${selectedPrize.id}"]`);
+    if (prizeCard) {
+        prizeCard.dataset.remaining = selectedPrize.remaining;
+        prizeCard.querySelector('.count').textContent = `${selectedPrize.remaining} รางวัล`;
+        if (selectedPrize.remaining === 0) {
+            prizeCard.classList.add('disabled');
+        }
+    }
+
+    isProcessing = false;
+    document.getElementById('createBubbleBtn').disabled = false;
+
+    // เก็บ revealedWinners ก่อนเรียก closeBubbleFullscreen (เพราะ closeBubbleFullscreen จะ reset revealedWinners)
+    const winnersToShow = [...revealedWinners];
+
+    console.log('winnersToShow:', winnersToShow);
+
+    // Close bubble fullscreen first (but don't play background music yet)
+    document.getElementById('bubbleFullscreen').classList.remove('active');
+    document.getElementById('bubbleContainer').innerHTML = '';
+    document.getElementById('poppedWinners').innerHTML = '';
+
+    // Reset selection
+    resetCountSelection();
+
+    // Reset popAllBtn state
+    const popAllBtn = document.getElementById('popAllBtn');
+    if (popAllBtn) {
+        popAllBtn.disabled = false;
+    }
+
+    // Show winners modal (this will handle stopping background music and playing Lucky music)
+    // Use a small delay to ensure DOM is ready
+    setTimeout(() => {
+        showBubbleWinners(winnersToShow);
+    }, 100);
+
+    // Reset after showing modal
+    pendingWinners = [];
+    revealedWinners = [];
+    revealedCount = 0;
+    isFinishingBubbleGame = false;
+}
+
+function playLuckyMusic() {
+    // เล่นเพลง Lucky.mp3 เมื่อมี popup ผู้โชคดี
+    if (luckyAudio) {
+        luckyAudio.pause();
+        luckyAudio.currentTime = 0;
+    }
+
+    luckyAudio = new Audio('/assets/Music/Lucky.mp3');
+    luckyAudio.loop = false;
+    luckyAudio.volume = 0.7;
+
+    luckyAudio.onerror = function(e) {
+        console.error('Error loading Lucky.mp3:', e);
+    };
+
+    luckyAudio.play().catch(err => {
+        console.error('Error playing Lucky.mp3:', err);
+    });
+}
+
+function stopLuckyMusic() {
+    if (luckyAudio) {
+        luckyAudio.pause();
+        luckyAudio.currentTime = 0;
+        luckyAudio = null;
+    }
+}
+
+function showBubbleWinners(winners) {
+    // หยุดเพลงเมื่อแสดง popup "ยินดีด้วย!"
+    stopBackgroundMusic();
+
+    // เล่นเพลง Lucky.mp3
+    playLuckyMusic();
+
+    const modal = document.getElementById('winnerModal');
+    const modalContent = document.getElementById('modalContent');
+    const winnerIcon = document.getElementById('winnerIcon');
+    const winnerTitle = document.getElementById('winnerTitle');
+    const winnerPrizeName = document.getElementById('winnerPrizeName');
+    const winnerList = document.getElementById('winnerList');
+
+    // Style for normal prize
+    modalContent.classList.remove('grand-prize');
+    modalContent.classList.add('normal-prize');
+    winnerIcon.className = 'winner-icon normal';
+
+    // ดึงข้อมูลรูปภาพรางวัลจาก selectedPrize หรือจาก prizeCard element
+    let prizeImagePath = null;
+    console.log('showBubbleWinners - selectedPrize:', selectedPrize); // Debug
+
+    if (selectedPrize && selectedPrize.imagePath) {
+        prizeImagePath = selectedPrize.imagePath;
+        console.log('Using imagePath from selectedPrize:', prizeImagePath); // Debug
+    } else if (selectedPrize && selectedPrize.id) {
+        // ถ้าไม่มี imagePath ใน selectedPrize ให้ดึงจาก prizeCard element
+        const prizeCard = document.querySelector(`[data-prize-id="${selectedPrize.id}"]`);
+        if (prizeCard) {
+            prizeImagePath = prizeCard.getAttribute('data-image-path') || prizeCard.dataset.imagePath || '';
+            console.log('Using imagePath from prizeCard:', prizeImagePath); // Debug
+        }
+    }
+
+    // แสดงรูปภาพรางวัลถ้ามี หรือแสดงไอคอนถ้าไม่มี
+    if (prizeImagePath && prizeImagePath.trim() !== '' && prizeImagePath !== 'None' && prizeImagePath !== 'null' && prizeImagePath !== 'undefined') {
+        const imageUrl = `/static/${prizeImagePath}`;
+        winnerIcon.innerHTML = `<img src="${imageUrl}" alt="${selectedPrize ? selectedPrize.name : 'Prize'}" onerror="this.parentElement.innerHTML='<i class=\\'fas fa-gift\\'></i>';">`;
+        console.log('Showing prize image:', imageUrl); // Debug
+    } else {
+    winnerIcon.innerHTML = '<i class="fas fa-gift"></i>';
+        console.log('No prize image, showing gift icon. ImagePath:', prizeImagePath, 'selectedPrize:', selectedPrize); // Debug
+    }
+
+    winnerTitle.className = 'winner-title normal';
+    winnerTitle.textContent = '🎉 ยินดีด้วย! 🎉';
+
+    winnerPrizeName.innerHTML = `<i class="fas fa-gift"></i> ${selectedPrize ? selectedPrize.name : ''}`;
+    winnerList.innerHTML = '';
+
+    console.log('showBubbleWinners - winners:', winners); // Debug
+    console.log('showBubbleWinners - winners.length:', winners ? winners.length : 0); // Debug
+    console.log('showBubbleWinners - modal element:', modal); // Debug
+
+    if (!winners || winners.length === 0) {
+        console.warn('No winners to display!');
+        const emptyItem = document.createElement('div');
+        emptyItem.className = 'winner-item normal-winner';
+        emptyItem.innerHTML = '<div class="person"><span>ไม่มีผู้โชคดี</span></div>';
+        winnerList.appendChild(emptyItem);
+    } else {
+        winners.forEach((winner, index) => {
+        // Find participant to get image_path
+        const participant = participantsCopy.find(p => p.id === winner.winner_id) || 
+                           participants.find(p => p.id === winner.winner_id);
+        const avatarContent = participant && participant.image_path
+            ? `<img src="/static/${participant.image_path}" alt="${winner.winner_name}" style="width: 40px; height: 40px; border-radius: 50%; object-fit: cover; margin-right: 10px;">`
+            : `<i class="fas fa-user"></i>`;
+
+        const item = document.createElement('div');
+        item.className = 'winner-item normal-winner';
+        item.style.animationDelay = `${index * 0.1}s`;
+        item.innerHTML = `
+            <div class="person">
+                ${avatarContent}
+                <span>${winner.winner_name}</span>
+            </div>
+        `;
+        winnerList.appendChild(item);
+        });
+    }
+
+    console.log('showBubbleWinners - about to show modal, modal element:', modal); // Debug
+    modal.classList.add('active');
+    console.log('showBubbleWinners - modal.classList after add active:', modal.classList.toString()); // Debug
+    createConfetti(false, 100);
+
+    // อ่านชื่อผู้โชคดีด้วยเสียง AI
+    if (winners && winners.length > 0) {
+        // รอให้ modal แสดงผลก่อน แล้วค่อยอ่าน
+        setTimeout(() => {
+            winners.forEach((winner, index) => {
+                setTimeout(() => {
+                    speakWinnerName(winner.winner_name, selectedPrize ? selectedPrize.name : '', false);
+                }, index * 4000); // อ่านแต่ละคนห่างกัน 4 วินาที
+            });
+        }, 1000); // รอ 1 วินาทีให้ modal แสดงผล
+    }
+}
+
+function closeBubbleFullscreen() {
+    document.getElementById('bubbleFullscreen').classList.remove('active');
+    document.getElementById('bubbleContainer').innerHTML = '';
+    document.getElementById('poppedWinners').innerHTML = '';
+
+    // Reset selection
+    resetCountSelection();
+    isProcessing = false;
+
+    // Reset popAllBtn state
+    const popAllBtn = document.getElementById('popAllBtn');
+    if (popAllBtn) {
+        popAllBtn.disabled = false;
+    }
+
+    // Reset revealed winners
+    revealedWinners = [];
+    revealedCount = 0;
+    pendingWinners = [];
+
+    // เล่นเพลงอีกครั้งเมื่อปิด
+    playBackgroundMusic();
+}
+
+// ==================== CS:GO STYLE REEL SPIN (Grand Prize) ====================
+let grandWinnersQueue = [];
+let allGrandWinners = [];
+let excludedWinnerIds = []; // Track winners to exclude from reel
+
+function spinReel() {
+    // หยุดเพลงเมื่อกดหมุนรางวัลใหญ่
+    stopBackgroundMusic();
+    if (!selectedPrize) {
+        alert('กรุณาเลือกรางวัลก่อน');
+        return;
+    }
+    if (selectedCount === 0) {
+        alert('กรุณาเลือกจำนวนผู้โชคดี');
+        return;
+    }
+    if (isProcessing) return;
+
+    isProcessing = true;
+    excludedWinnerIds = []; // Reset excluded list
+    document.getElementById('spinBtn').disabled = true;
+    document.getElementById('csgoSpinner').classList.add('spinning');
+    activateGrandMode();
+
+    // ไม่เรียกเสียงที่นี่ เพราะจะเรียกใน spinNextWinner() ตามจำนวนผู้ชนะ
+
+    // Call API first to get all winners
+    fetch('/api/spin', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ prize_id: selectedPrize.id, count: selectedCount, checked_in_only: checkedInOnly })
+    })
+    .then(r => r.json())
+    .then(data => {
+            if (data.success) {
+            allGrandWinners = data.results;
+            grandWinnersQueue = [...data.results];
+
+            // Update stats
+            selectedPrize.remaining = data.prize_remaining;
+            document.getElementById('selectedPrizeRemaining').textContent = `เหลือ ${data.prize_remaining} รางวัล`;
+
+            const grandCount = parseInt(document.getElementById('grandPrizeCount').textContent) - data.results.length;
+            document.getElementById('grandPrizeCount').textContent = grandCount;
+
+            const prizeCard = document.querySelector(`[data-prize-id="${selectedPrize.id}"]`);
+            if (prizeCard) {
+                prizeCard.dataset.remaining = data.prize_remaining;
+                prizeCard.querySelector('.count').textContent = `${data.prize_remaining} รางวัล`;
+                if (data.prize_remaining === 0) prizeCard.classList.add('disabled');
+            }
+
+            // Build reel and start spinning
+            buildReelForSpin();
+            spinNextWinner();
+                } else {
+            stopSpinSound();
+            document.getElementById('csgoSpinner').classList.remove('spinning');
+            alert(data.error || 'เกิดข้อผิดพลาด');
+            deactivateGrandMode();
+            isProcessing = false;
+            document.getElementById('spinBtn').disabled = false;
+        }
+    })
+    .catch(err => {
+        console.error(err);
+        stopSpinSound();
+        document.getElementById('csgoSpinner').classList.remove('spinning');
+        alert('เกิดข้อผิดพลาดในการเชื่อมต่อ');
+        deactivateGrandMode();
+        isProcessing = false;
+        document.getElementById('spinBtn').disabled = false;
+    });
+}
+
+function buildReelForSpin() {
+    // Filter out already won participants
+    const availableParticipants = participantsCopy.filter(p => !excludedWinnerIds.includes(p.id));
+
+    if (availableParticipants.length === 0) {
+        console.log('No available participants');
+    }
+    setReelPeople(availableParticipants);
+}
+
+function spinNextWinner() {
+    if (grandWinnersQueue.length === 0) {
+        // All winners revealed - show final popup
+        stopSpinSound();
+        document.getElementById('csgoSpinner').classList.remove('spinning');
+
+        // Now actually remove winners from participantsCopy
+        allGrandWinners.forEach(w => {
+            const idx = participantsCopy.findIndex(p => p.id === w.winner_id);
+            if (idx > -1) participantsCopy.splice(idx, 1);
+        });
+
+        document.getElementById('participantCount').textContent = participantsCopy.length;
+
+        showGrandWinners(allGrandWinners);
+
+        // Reset and rebuild
+        excludedWinnerIds = [];
+        buildReel();
+
+        isProcessing = false;
+        document.getElementById('spinBtn').disabled = false;
+
+        if (selectedPrize.remaining === 0) {
+            setTimeout(() => goBackToSelection(), 500);
+        }
+        return;
+    }
+
+    const winner = grandWinnersQueue.shift();
+    const isMultiple = allGrandWinners.length > 1;
+    const spinDuration = isMultiple ? 3 : 5;
+
+    // เล่นเสียงหมุนตามจำนวนผู้ชนะ
+    if (isMultiple) {
+        // ผู้ชนะหลายคน - ใช้ไฟล์ spinning-m.mp3 (ไม่มี oscillator)
+        stopSpinSound(); // หยุดเสียงเก่าก่อน (ถ้ามี)
+        playSpinningMAudio(); // เล่นไฟล์ spinning-m.mp3
+    } else {
+        // ผู้ชนะคนเดียว - ใช้เฉพาะไฟล์ spinning-s.mp3 (ไม่มี oscillator)
+        stopSpinSound(); // หยุดเสียงเก่าก่อน (ถ้ามี)
+        playSpinningAudio(); // เล่นไฟล์ spinning-s.mp3
+    }
+
+    animateReelToWinner(winner, spinDuration, () => {
+        // Add to excluded list (don't modify participantsCopy yet)
+        excludedWinnerIds.push(winner.winner_id);
+
+        if (grandWinnersQueue.length > 0) {
+            // Rebuild reel without this winner, then spin next
+            setTimeout(() => {
+                buildReelForSpin();
+                setTimeout(() => spinNextWinner(), 300);
+            }, 1200);
+            } else {
+            // Last winner - show popup
+            setTimeout(() => spinNextWinner(), 1000);
+        }
+    });
+}
+
+function animateReelToWinner(winner, duration, callback) {
+    if (reelState.people.length === 0) {
+        console.error('Reel is empty, cannot land on winner:', winner);
+        callback();
+        return;
+    }
+
+    // ใช้ข้อมูลจากรายชื่อในวงล้อ (มีรูป) ถ้าหาไม่เจอใช้ข้อมูลจาก API
+    const person = reelState.people.find(p => p.id === winner.winner_id) ||
+                   { id: winner.winner_id, name: winner.winner_name, image_path: '' };
+
+    // Use provided duration
+    const spinDuration = duration || 5;
+    const snapTime = spinDuration * 1000;
+
+    // ล็อกช่องปลายทางให้เป็นผู้ชนะ - ระยะหมุนคงที่ไม่ขึ้นกับจำนวนผู้เข้าร่วม
+    const startSlot = Math.round(reelState.offset / REEL_ITEM_PITCH);
+    const targetSlot = startSlot + Math.round(spinDuration * REEL_ITEMS_PER_SECOND);
+    reelState.pinnedSlot = targetSlot;
+    reelState.pinnedPerson = person;
+    const exactOffset = targetSlot * REEL_ITEM_PITCH;
+
+    // First: Fast spin with overshoot (go past the target)
+    const overshootAmount = 50 + Math.random() * 70;
+
+    // สำหรับผู้ชนะคนเดียว (5 วินาที): กราฟสูตร: พุ่งไว แล้วเอื่อยยาว (หน้าไว หลังเอื่อย)
+    // สำหรับผู้ชนะหลายคน (3 วินาที): ใช้ easing เดิม
+    const easingFunction = spinDuration === 5 
+        ? cubicBezier(0.1, 0.7, 0.1, 1) // พุ่งไว แล้วเอื่อยยาว - หน้าไว หลังเอื่อย (ลุ้นมาก อ่านชื่อได้ทัน)
+        : cubicBezier(0.1, 0.8, 0.2, 1); // easing เดิมสำหรับหลายคน
+
+    animateReelOffset(exactOffset + overshootAmount, snapTime, easingFunction);
+
+    // Snap back to EXACT center with bounce effect
+    setTimeout(() => {
+        animateReelOffset(exactOffset, 700, cubicBezier(0.34, 1.56, 0.64, 1));
+    }, snapTime);
+
+    // Highlight winner after snap animation completes
+    setTimeout(() => {
+        // หยุดเสียงหมุนและเล่นเสียงชนะ
+        stopSpinSound();
+        playWinnerSound();
+
+        reelState.nodes.forEach(node => {
+            node.item.classList.remove('winner');
+            node.item.style.animation = '';
+        });
+
+        // ช่องที่ล็อกไว้อยู่ตรง pointer พอดี (offset = targetSlot * PITCH)
+        const winnerNode = reelState.nodes.find(node => node.slot === targetSlot);
+        if (winnerNode) {
+            winnerNode.item.classList.add('winner');
+            winnerNode.item.style.animation = 'winner-flash 0.5s ease 3';
+            console.log('✅ Correct winner highlighted:', winner.winner_name);
+        } else {
+            console.warn('⚠️ Winner slot not rendered:', winner.winner_id);
+        }
+
+        createConfetti(true, allGrandWinners.length > 1 ? 50 : 100);
+        callback();
+    }, snapTime + 800);
+}
+
+// Keep old function name for compatibility
+function spinWheel() {
+    // หยุดเพลงเมื่อกดหมุน
+    stopBackgroundMusic();
+    spinReel();
+}
+
+function showGrandWinners(results) {
+    // เล่นเพลง Lucky.mp3
+    playLuckyMusic();
+
+    const modal = document.getElementById('winnerModal');
+    const modalContent = document.getElementById('modalContent');
+    const winnerIcon = document.getElementById('winnerIcon');
+    const winnerTitle = document.getElementById('winnerTitle');
+    const winnerPrizeName = document.getElementById('winnerPrizeName');
+    const winnerList = document.getElementById('winnerList');
+
+    // Set grand prize styling
+    modalContent.classList.remove('normal-prize');
+        modalContent.classList.add('grand-prize');
+        winnerIcon.className = 'winner-icon grand';
+
+    // ดึงข้อมูลรูปภาพรางวัลจาก selectedPrize หรือจาก prizeCard element
+    let prizeImagePath = null;
+    console.log('showGrandWinners - selectedPrize:', selectedPrize); // Debug
+
+    if (selectedPrize && selectedPrize.imagePath) {
+        prizeImagePath = selectedPrize.imagePath;
+        console.log('Using imagePath from selectedPrize:', prizeImagePath); // Debug
+    } else if (selectedPrize && selectedPrize.id) {
+        // ถ้าไม่มี imagePath ใน selectedPrize ให้ดึงจาก prizeCard element
+        const prizeCard = document.querySelector(`[data-prize-id="${selectedPrize.id}"]`);
+        if (prizeCard) {
+            prizeImagePath = prizeCard.getAttribute('data-image-path') || prizeCard.dataset.imagePath || '';
+            console.log('Using imagePath from prizeCard:', prizeImagePath); // Debug
+        }
+    }
+
+    // แสดงรูปภาพรางวัลถ้ามี หรือแสดงไอคอนมงกุฎถ้าไม่มี
+    if (prizeImagePath && prizeImagePath.trim() !== '' && prizeImagePath !== 'None' && prizeImagePath !== 'null' && prizeImagePath !== 'undefined') {
+        const imageUrl = `/static/${prizeImagePath}`;
+        winnerIcon.innerHTML = `<img src="${imageUrl}" alt="${selectedPrize ? selectedPrize.name : 'Prize'}" onerror="this.parentElement.innerHTML='<i class=\\'fas fa-crown\\'></i>';">`;
+        console.log('Showing prize image:', imageUrl); // Debug
+    } else {
+    winnerIcon.innerHTML = '<i class="fas fa-crown"></i>';
+        console.log('No prize image, showing crown icon. ImagePath:', prizeImagePath, 'selectedPrize:', selectedPrize); // Debug
+    }
+
+        winnerTitle.className = 'winner-title grand';
+        winnerTitle.textContent = '🎉 รางวัลใหญ่ 🎉';
+
+    winnerPrizeName.innerHTML = `<i class="fas fa-crown"></i> ${selectedPrize ? selectedPrize.name : ''}`;
+    winnerList.innerHTML = '';
+
+    results.forEach((result, index) => {
+        // Find participant to get image_path
+        const participant = participantsCopy.find(p => p.id === result.winner_id) || 
+                           participants.find(p => p.id === result.winner_id);
+        const avatarContent = participant && participant.image_path
+            ? `<img src="/static/${participant.image_path}" alt="${result.winner_name}" style="width: 40px; height: 40px; border-radius: 50%; object-fit: cover; margin-right: 10px;">`
+            : `<i class="fas fa-crown"></i>`;
+
+        const item = document.createElement('div');
+        item.className = 'winner-item grand-winner';
+        item.style.animationDelay = `${index * 0.15}s`;
+        item.innerHTML = `
+            <div class="person">
+                ${avatarContent}
+                <span>${result.winner_name}</span>
+            </div>
+        `;
+        winnerList.appendChild(item);
+    });
+
+    modal.classList.add('active');
+    createConfetti(true, 150);
+
+    // อ่านชื่อผู้โชคดีด้วยเสียง AI
+    if (results.length > 0) {
+        // รอให้ modal แสดงผลและเสียงชนะเล่นเสร็จก่อน แล้วค่อยอ่าน
+        setTimeout(() => {
+            results.forEach((result, index) => {
+                setTimeout(() => {
+                    speakWinnerName(result.winner_name, selectedPrize ? selectedPrize.name : '', true);
+                }, index * 4000); // อ่านแต่ละคนห่างกัน 4 วินาที
+            });
+        }, 2000); // รอ 2 วินาทีให้เสียงชนะเล่นเสร็จ
+    }
+}
+
+function closeModal() {
+    const modalContent = document.getElementById('modalContent');
+    const isNormalPrize = modalContent.classList.contains('normal-prize');
+
+    // หยุดเพลง Lucky.mp3
+    stopLuckyMusic();
+
+    document.getElementById('winnerModal').classList.remove('active');
+    // Reset modal to default grand-prize styling for next use
+    modalContent.className = 'modal-content grand-prize';
+    LuckyFX.clear('overlay', 'confetti');
+    deactivateGrandMode();
+
+    // Always go back to prize selection
+    goBackToSelection();
+
+    // เล่นเพลงอีกครั้งเมื่อปิดเฉพาะรางวัลทั่วไป (ฟองสบู่)
+    if (isNormalPrize) {
+        playBackgroundMusic();
+    }
+}
+
+function activateGrandMode() {
+    document.body.classList.add('grand-mode');
+    LuckyFX.clear('background', 'gold');
+    for (let i = 0; i < 20; i++) {
+        const particle = LuckyFX.spawn('background');
+        if (!particle) break;
+        particle.persistent = true;
+        particle.fade = false;
+        particle.x = Math.random() * window.innerWidth;
+        particle.y = Math.random() * window.innerHeight;
+        particle.size = 8;
+        particle.color = '#FFD700';
+        particle.pulse = 3;
+        particle.pulsePhase = Math.random() * 3;
+        particle.pulseAlpha = 0.8;
+        particle.pulseRise = 30;
+        particle.group = 'gold';
+    }
+}
+
+function deactivateGrandMode() {
+    document.body.classList.remove('grand-mode');
+    LuckyFX.clear('background', 'gold');
+}
+
+function createConfetti(isGrand, count) {
+    const colors = isGrand 
+        ? ['#ffd700', '#ff6b35', '#ffaa00', '#fff'] 
+        : ['#0033A0', '#00d4ff', '#00ff88', '#fff'];
+
+    LuckyFX.confetti('overlay', colors, count);
+}
+
+// ==================== SEARCH & QR CODE ====================
+function filterPrizes() {
+    const searchValue = document.getElementById('prizeSearch').value.toLowerCase().trim();
+    const grandCards = document.querySelectorAll('#grandPrizesGrid .prize-card');
+    const normalCards = document.querySelectorAll('#normalPrizesGrid .prize-card');
+    const grandSection = document.querySelector('.prize-section-title.grand')?.parentElement;
+    const normalSection = document.querySelector('.prize-section-title.normal')?.parentElement;
+
+    let grandVisible = 0;
+    let normalVisible = 0;
+
+    grandCards.forEach(card => {
+        const name = card.dataset.prizeName.toLowerCase();
+        const qrCode = (card.dataset.qrCode || '').toLowerCase();
+        const matches = name.includes(searchValue) || qrCode.includes(searchValue);
+        card.style.display = matches ? '' : 'none';
+        if (matches) grandVisible++;
+    });
+
+    normalCards.forEach(card => {
+        const name = card.dataset.prizeName.toLowerCase();
+        const qrCode = (card.dataset.qrCode || '').toLowerCase();
+        const matches = name.includes(searchValue) || qrCode.includes(searchValue);
+        card.style.display = matches ? '' : 'none';
+        if (matches) normalVisible++;
+    });
+
+    // Show/hide section titles based on results
+    if (grandSection) {
+        const titleEl = grandSection.querySelector('.prize-section-title.grand');
+        const gridEl = document.getElementById('grandPrizesGrid');
+        if (titleEl) titleEl.style.display = grandVisible > 0 ? '' : 'none';
+        if (gridEl) gridEl.style.display = grandVisible > 0 ? '' : 'none';
+    }
+
+    if (normalSection) {
+        const titleEl = document.querySelector('.prize-section-title.normal');
+        const gridEl = document.getElementById('normalPrizesGrid');
+        if (titleEl) titleEl.style.display = normalVisible > 0 ? '' : 'none';
+        if (gridEl) gridEl.style.display = normalVisible > 0 ? '' : 'none';
+    }
+
+    // Show no results message
+    const noResults = document.getElementById('noResultsMessage');
+    noResults.classList.toggle('visible', grandVisible === 0 && normalVisible === 0 && searchValue.length > 0);
+
+    // Auto-select if exact QR code match
+    if (searchValue.length > 0) {
+        const allCards = [...grandCards, ...normalCards];
+        const exactMatch = allCards.find(card => {
+            const qrCode = (card.dataset.qrCode || '').toLowerCase();
+            return qrCode === searchValue && parseInt(card.dataset.remaining) > 0;
+        });
+        if (exactMatch && !exactMatch.classList.contains('selected')) {
+            selectPrize(exactMatch);
+        }
+    }
+}
+
+// ==================== QR SCANNER ====================
+let qrScanner = null;
+
+function openQrScanner() {
+    const modal = document.getElementById('qrModal');
+    modal.classList.add('active');
+    startQrScanner();
+}
+
+function closeQrScanner() {
+    const modal = document.getElementById('qrModal');
+    modal.classList.remove('active');
+    stopQrScanner();
+}
+
+async function startQrScanner() {
+    const video = document.getElementById('qrVideo');
+    try {
+        const stream = await navigator.mediaDevices.getUserMedia({ 
+            video: { facingMode: 'environment' } 
+        });
+        video.srcObject = stream;
+        video.play();
+
+        // Simple QR scanning using canvas
+        const canvas = document.createElement('canvas');
+        const ctx = canvas.getContext('2d');
+
+        qrScanner = setInterval(() => {
+            if (video.readyState === video.HAVE_ENOUGH_DATA) {
+                canvas.width = video.videoWidth;
+                canvas.height = video.videoHeight;
+                ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
+
+                // Use jsQR library if available
+                if (typeof jsQR !== 'undefined') {
+                    const imageData = ctx.getImageData(0, 0, canvas.width, canvas.height);
+                    const code = jsQR(imageData.data, imageData.width, imageData.height);
+                    if (code) {
+                        handleQrCode(code.data);
+                    }
+                }
+            }
+        }, 200);
+    } catch (err) {
+        console.error('Camera error:', err);
+        alert('ไม่สามารถเข้าถึงกล้องได้ กรุณาอนุญาตการใช้งานกล้อง');
+        closeQrScanner();
+    }
+}
+
+function stopQrScanner() {
+    if (qrScanner) {
+        clearInterval(qrScanner);
+        qrScanner = null;
+    }
+    const video = document.getElementById('qrVideo');
+    if (video.srcObject) {
+        video.srcObject.getTracks().forEach(track => track.stop());
+        video.srcObject = null;
+    }
+}
+
+function handleQrCode(code) {
+    document.getElementById('prizeSearch').value = code;
+    filterPrizes();
+    closeQrScanner();
+
+    // Vibrate on success
+    if (navigator.vibrate) navigator.vibrate(200);
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    // เพลงพื้นหลังถูกจัดการใน base.html แล้ว
+    // เริ่มเล่นเพลงเมื่อมีการคลิกครั้งแรก (ถ้ายังไม่ได้เล่น)
+    if (sessionStorage.getItem('bgMusicPlaying') !== 'true') {
+        // รอ user interaction ก่อน
+        document.addEventListener('click', function playMusicOnFirstClick() {
+            playBackgroundMusic();
+            document.removeEventListener('click', playMusicOnFirstClick);
+        }, { once: true });
+    }
+
+    if (participantsCopy.length > 0) buildWheel();
+});
+
+document.getElementById('winnerModal')?.addEventListener('click', function(e) {
+    if (e.target === this) closeModal();
+});
+
+document.getElementById('qrModal')?.addEventListener('click', function(e) {
+    if (e.target === this) closeQrScanner();
+});
@@ -0,0 +1,192 @@
+let selectedUserType = 'admin';
+
+// Select user type for new user
+function selectUserType(type) {
+    selectedUserType = type;
+    document.querySelectorAll('.type-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+    document.querySelector(`[data-type="${type}"]`).classList.add('active');
+}
+
+// Toggle password visibility
+function togglePassword(inputId, btn) {
+    const input = document.getElementById(inputId);
+    const icon = btn.querySelector('i');
+
+    if (input.type === 'password') {
+        input.type = 'text';
+        icon.classList.remove('fa-eye');
+        icon.classList.add('fa-eye-slash');
+    } else {
+        input.type = 'password';
+        icon.classList.remove('fa-eye-slash');
+        icon.classList.add('fa-eye');
+    }
+}
+
+// Add new user
+function addUser(e) {
+    e.preventDefault();
+
+    const username = document.getElementById('newUsername').value;
+    const displayName = document.getElementById('newDisplayName').value;
+    const password = document.getElementById('newPassword').value;
+
+    if (password.length < 4) {
+        alert('รหัสผ่านต้องมีอย่างน้อย 4 ตัวอักษร');
+        return;
+    }
+
+    fetch('/api/users', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            username: username,
+            display_name: displayName,
+            password: password,
+            user_type: selectedUserType,
+            is_active: true
+        })
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) {
+            window.location.reload();
+        } else {
+            alert(data.error || 'เกิดข้อผิดพลาด');
+        }
+    })
+    .catch(err => {
+        alert('เกิดข้อผิดพลาดในการเชื่อมต่อ');
+    });
+}
+
+// Filter users
+function filterUsers() {
+    const search = document.getElementById('searchUser').value.toLowerCase();
+    const cards = document.querySelectorAll('.user-card');
+
+    cards.forEach(card => {
+        const username = card.dataset.username;
+        const name = card.dataset.name;
+        const match = username.includes(search) || name.includes(search);
+        card.style.display = match ? 'flex' : 'none';
+    });
+}
+
+// Open edit modal
+function openEditModal(userId) {
+    fetch(`/api/users/${userId}`)
+        .then(r => r.json())
+        .then(user => {
+            document.getElementById('editUserId').value = user.id;
+            document.getElementById('editUsername').value = user.username;
+            document.getElementById('editDisplayName').value = user.display_name || '';
+            document.getElementById('editUserType').value = user.user_type;
+            document.getElementById('editIsActive').value = user.is_active ? 'true' : 'false';
+            document.getElementById('editModal').classList.add('active');
+        });
+}
+
+function closeEditModal() {
+    document.getElementById('editModal').classList.remove('active');
+}
+
+// Save user edit
+function saveUserEdit(e) {
+    e.preventDefault();
+
+    const userId = document.getElementById('editUserId').value;
+    const data = {
+        username: document.getElementById('editUsername').value,
+        display_name: document.getElementById('editDisplayName').value,
+        user_type: document.getElementById('editUserType').value,
+        is_active: document.getElementById('editIsActive').value === 'true'
+    };
+
+    fetch(`/api/users/${userId}`, {
+        method: 'PUT',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(data)
+    })
+    .then(r => r.json())
+    .then(result => {
+        if (result.success) {
+            window.location.reload();
+        } else {
+            alert(result.error || 'เกิดข้อผิดพลาด');
+        }
+    });
+}
+
+// Open password modal
+function openPasswordModal(userId, username) {
+    document.getElementById('passwordUserId').value = userId;
+    document.getElementById('passwordUsername').textContent = username;
+    document.getElementById('newUserPassword').value = '';
+    document.getElementById('confirmPassword').value = '';
+    document.getElementById('passwordModal').classList.add('active');
+}
+
+function closePasswordModal() {
+    document.getElementById('passwordModal').classList.remove('active');
+}
+
+// Save password
+function savePassword(e) {
+    e.preventDefault();
+
+    const userId = document.getElementById('passwordUserId').value;
+    const newPassword = document.getElementById('newUserPassword').value;
+    const confirmPassword = document.getElementById('confirmPassword').value;
+
+    if (newPassword !== confirmPassword) {
+        alert('รหัสผ่านไม่ตรงกัน');
+        return;
+    }
+
+    if (newPassword.length < 4) {
+        alert('รหัสผ่านต้องมีอย่างน้อย 4 ตัวอักษร');
+        return;
+    }
+
+    fetch(`/api/users/${userId}/password`, {
+        method: 'PUT',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ password: newPassword })
+    })
+    .then(r => r.json())
+    .then(result => {
+        if (result.success) {
+            alert('เปลี่ยนรหัสผ่านเรียบร้อยแล้ว');
+            closePasswordModal();
+        } else {
+            alert(result.error || 'เกิดข้อผิดพลาด');
+        }
+    });
+}
+
+// Delete user
+function deleteUser(userId, username) {
+    if (!confirm(`ต้องการลบผู้ใช้ "${username}" หรือไม่?`)) return;
+
+    fetch(`/api/users/${userId}`, { method: 'DELETE' })
+        .then(r => r.json())
+        .then(result => {
+            if (result.success) {
+                document.querySelector(`[data-id="${userId}"]`).remove();
+            } else {
+                alert(result.error || 'เกิดข้อผิดพลาด');
+            }
+        });
+}
+
+// Close modals on overlay click
+document.getElementById('editModal').addEventListener('click', function(e) {
+    if (e.target === this) closeEditModal();
+});
+
+document.getElementById('passwordModal').addEventListener('click', function(e) {
+    if (e.target === this) closePasswordModal();
+});
@@ -0,0 +1,268 @@
+// ==================== Lucky Draw Service Worker ====================
+// ทำให้หน้าสุ่มรางวัล/ผลรางวัลเปิดได้แม้เครือข่ายในงานล่ม:
+// - precache หน้า /spin, /results, เพลงใน /assets/Music และรูปรางวัล (รายการจาก /api/offline-manifest)
+// - ไฟล์ static (เพลง, รูป, ฟอนต์, CDN, CSS/JS ที่มี hash ในชื่อ) ใช้ cache-first
+// - หน้า HTML ใช้ network-first แบบมี timeout แล้ว fallback เป็น cache (ข้อมูลในหน้าเปลี่ยนทุกการสุ่ม)
+// - POST /api/spin ตอนออฟไลน์จะถูกเก็บลงคิว (IndexedDB) แล้วรอผู้ควบคุมกดยืนยันส่ง/ยกเลิกเมื่อกลับมาออนไลน์
+//   (ไม่ส่งเองอัตโนมัติ - การส่งคือการสุ่มผู้โชคดีจริง ถ้าผู้ควบคุมสุ่มใหม่ไปแล้วจะได้ผู้โชคดีซ้ำสองชุด)
+
+const CACHE_VERSION = 'luckydraw-v1';
+const SHELL_CACHE = `${CACHE_VERSION}-shell`;
+const ASSET_CACHE = `${CACHE_VERSION}-assets`;
+const NAVIGATION_TIMEOUT = 2500;  // ms ก่อนยอมใช้หน้าจาก cache
+const QUEUE_DB = 'luckydraw-offline';
+const QUEUE_STORE = 'spin-queue';
+
+const BUNDLE_PATH = /^\/static\/(css|js)\/.+\.[0-9a-f]{10}\.(css|js)$/;  // ชื่อไฟล์มี hash = ไม่เปลี่ยนแล้ว
+
+const CDN_HOSTS = [
+    'fonts.googleapis.com',
+    'fonts.gstatic.com',
+    'cdnjs.cloudflare.com',
+    'cdn.jsdelivr.net'
+];
+
+self.addEventListener('install', event => {
+    event.waitUntil(self.skipWaiting());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(
+                keys.filter(key => !key.startsWith(CACHE_VERSION)).map(key => caches.delete(key))
+            ))
+            .then(() => self.clients.claim())
+    );
+});
+
+// ==================== Precache ====================
+// หน้าเว็บต้อง login ก่อน จึง precache เมื่อหน้าเว็บส่ง message 'precache' มาหลัง login แล้ว
+async function precache() {
+    const response = await fetch('/api/offline-manifest', { credentials: 'same-origin' });
+    if (!response.ok || response.redirected) return;
+    const manifest = await response.json();
+
+    // หน้าที่มีใน cache แล้วไม่ต้องโหลดซ้ำ - networkFirst อัปเดตให้ทุกครั้งที่เปิดหน้านั้นอยู่แล้ว
+    // (แต่ละหน้าฝังรายชื่อทั้งหมด โหลดใหม่ทุก page view จะหนักมาก)
+    const shell = await caches.open(SHELL_CACHE);
+    for (const url of manifest.pages) {
+        if (!(await shell.match(url))) {
+            await cacheIfOk(shell, url);
+        }
+    }
+
+    // เพลง, รูป และ CSS/JS ที่มี hash ไม่เปลี่ยน - ดาวน์โหลดเฉพาะที่ยังไม่มีใน cache
+    const assets = await caches.open(ASSET_CACHE);
+    const bundles = manifest.bundles || [];
+    for (const url of manifest.assets.concat(bundles)) {
+        if (!(await assets.match(url))) {
+            await cacheIfOk(assets, url);
+        }
+    }
+
+    // ลบ CSS/JS รุ่นเก่า (hash ไม่อยู่ใน manifest แล้ว)
+    const current = new Set(bundles.map(url => new URL(url, self.location.origin).pathname));
+    for (const request of await assets.keys()) {
+        const pathname = new URL(request.url).pathname;
+        if (BUNDLE_PATH.test(pathname) && !current.has(pathname)) {
+            await assets.delete(request);
+        }
+    }
+}
+
+async function cacheIfOk(cache, url) {
+    try {
+        const response = await fetch(url, { credentials: 'same-origin' });
+        if (response.ok && !response.redirected) {
+            await cache.put(url, response);
+        }
+    } catch (err) {
+        // ออฟไลน์อยู่ - ไว้ลองใหม่รอบหน้า
+    }
+}
+
+// ==================== Fetch Strategies ====================
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+
+    if (request.method === 'POST' && url.origin === self.location.origin && url.pathname === '/api/spin') {
+        event.respondWith(spinOrQueue(request));
+        return;
+    }
+    if (request.method !== 'GET') return;
+
+    if (request.mode === 'navigate') {
+        event.respondWith(networkFirst(request));
+    } else if (url.origin === self.location.origin &&
+               (url.pathname.startsWith('/assets/') || url.pathname.startsWith('/static/uploads/') ||
+                BUNDLE_PATH.test(url.pathname))) {
+        event.respondWith(cacheFirst(request));
+    } else if (CDN_HOSTS.includes(url.hostname)) {
+        event.respondWith(cacheFirst(request));
+    }
+});
+
+async function networkFirst(request) {
+    const cache = await caches.open(SHELL_CACHE);
+    const url = new URL(request.url);
+    const key = url.origin + url.pathname + url.search;  // /spin กับ /spin?mode=checked-in เป็นคนละหน้า
+
+    const network = fetch(request).then(response => {
+        if (response.ok && !response.redirected) {
+            cache.put(key, response.clone());
+        }
+        return response;
+    });
+    network.catch(() => {});  // ตอบจาก cache ไปแล้ว ไม่ต้องรายงาน error ซ้ำ
+
+    try {
+        return await Promise.race([
+            network,
+            new Promise((resolve, reject) => setTimeout(() => reject(new Error('timeout')), NAVIGATION_TIMEOUT))
+        ]);
+    } catch (err) {
+        const cached = await cache.match(key);
+        if (cached) return cached;
+        return network;
+    }
+}
+
+async function cacheFirst(request) {
+    const cache = await caches.open(ASSET_CACHE);
+    const cached = await cache.match(request.url);
+    if (cached) {
+        return request.headers.has('range') ? rangeResponse(request, cached) : cached;
+    }
+
+    // ขอไฟล์เต็มเสมอ (ไม่ส่ง Range) เพื่อเก็บลง cache ได้
+    const response = await fetch(request.url, { credentials: 'same-origin', mode: request.mode });
+    if (response.ok || response.type === 'opaque') {
+        await cache.put(request.url, response.clone());
+    }
+    return request.headers.has('range') && response.ok ? rangeResponse(request, response) : response;
+}
+
+// <audio>/<video> ขอไฟล์เป็นช่วง (Range) - ตัดจากไฟล์เต็มใน cache แล้วตอบ 206
+async function rangeResponse(request, response) {
+    const match = /bytes=(\d*)-(\d*)/.exec(request.headers.get('range') || '');
+    const blob = await response.blob();
+    if (!match) return new Response(blob, { headers: response.headers });
+
+    const start = match[1] ? parseInt(match[1], 10) : Math.max(0, blob.size - parseInt(match[2], 10));
+    const end = match[1] && match[2] ? Math.min(parseInt(match[2], 10), blob.size - 1) : blob.size - 1;
+    return new Response(blob.slice(start, end + 1), {
+        status: 206,
+        statusText: 'Partial Content',
+        headers: {
+            'Content-Type': response.headers.get('Content-Type') || 'application/octet-stream',
+            'Content-Range': `bytes ${start}-${end}/${blob.size}`,
+            'Content-Length': String(end - start + 1),
+            'Accept-Ranges': 'bytes'
+        }
+    });
+}
+
+// ==================== Offline Spin Queue ====================
+function openQueue() {
+    return new Promise((resolve, reject) => {
+        const open = indexedDB.open(QUEUE_DB, 1);
+        open.onupgradeneeded = () => {
+            open.result.createObjectStore(QUEUE_STORE, { keyPath: 'id', autoIncrement: true });
+        };
+        open.onsuccess = () => resolve(open.result);
+        open.onerror = () => reject(open.error);
+    });
+}
+
+function queueTransaction(mode, work) {
+    return openQueue().then(db => new Promise((resolve, reject) => {
+        const tx = db.transaction(QUEUE_STORE, mode);
+        const result = work(tx.objectStore(QUEUE_STORE));
+        tx.oncomplete = () => resolve(result.result);
+        tx.onerror = () => reject(tx.error);
+    }));
+}
+
+const queueAdd = entry => queueTransaction('readwrite', store => store.add(entry));
+const queueAll = () => queueTransaction('readonly', store => store.getAll());
+const queueDelete = id => queueTransaction('readwrite', store => store.delete(id));
+
+async function spinOrQueue(request) {
+    const body = await request.clone().text();
+    try {
+        return await fetch(request);
+    } catch (err) {
+        await queueAdd({ body: body, created_at: new Date().toISOString() });
+        await notifyQueue();
+        return new Response(JSON.stringify({
+            success: false,
+            queued: true,
+            error: 'ออฟไลน์อยู่ - บันทึกคำขอสุ่มไว้แล้ว เมื่อกลับมาออนไลน์ให้กดยืนยันส่งหรือยกเลิกที่แถบด้านล่าง (อย่าสุ่มรางวัลนี้ซ้ำ)'
+        }), { status: 202, headers: { 'Content-Type': 'application/json' } });
+    }
+}
+
+let flushing = null;
+function flushSpinQueue() {
+    if (!flushing) {
+        flushing = doFlush().finally(() => { flushing = null; });
+    }
+    return flushing;
+}
+
+// ส่งคำขอที่ค้างไว้ - เรียกเมื่อผู้ควบคุมกดยืนยันเท่านั้น แล้วส่งผลทั้งหมดให้หน้าเว็บแสดง
+async function doFlush() {
+    const entries = await queueAll();
+    const replayed = [];
+    for (const entry of entries) {
+        let response;
+        try {
+            response = await fetch('/api/spin', {
+                method: 'POST',
+                credentials: 'same-origin',
+                headers: { 'Content-Type': 'application/json' },
+                body: entry.body
+            });
+        } catch (err) {
+            break;  // ยังออฟไลน์ - เก็บคิวไว้ก่อน
+        }
+        await queueDelete(entry.id);
+        // server ตอบแล้ว (สำเร็จหรือถูกปฏิเสธ เช่นรางวัลหมด)
+        const result = await response.json().catch(() => ({}));
+        replayed.push({ ok: response.ok, result: result });
+    }
+    if (replayed.length) {
+        broadcast({ type: 'spin-replayed', replayed: replayed });
+    }
+    await notifyQueue();
+}
+
+async function discardSpinQueue() {
+    await queueTransaction('readwrite', store => store.clear());
+    await notifyQueue();
+}
+
+async function notifyQueue() {
+    const entries = await queueAll();
+    broadcast({ type: 'spin-queue', pending: entries.length });
+}
+
+async function broadcast(message) {
+    const clients = await self.clients.matchAll({ type: 'window' });
+    clients.forEach(client => client.postMessage(message));
+}
+
+self.addEventListener('message', event => {
+    const type = event.data && event.data.type;
+    if (type === 'precache') {
+        event.waitUntil(precache());
+    } else if (type === 'flush') {
+        event.waitUntil(flushSpinQueue());
+    } else if (type === 'discard') {
+        event.waitUntil(discardSpinQueue());
+    } else if (type === 'queue-status') {
+        event.waitUntil(notifyQueue());
+    }
+});